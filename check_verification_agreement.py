@@ -0,0 +1,92 @@
+"""검증 방식 비교 스크립트 (2회 호출 vs fused).
+
+같은 세특에 대해 기존 2단계 검증(validate_input + check_grammar)과
+통합 검증(verify)을 각각 실행하여 지연 시간과 판정 일치율을 출력합니다.
+
+사용법:
+    python check_verification_agreement.py --samples 10 --model openai
+"""
+import argparse
+import asyncio
+import copy
+import statistics
+import time
+from typing import Any, Dict, List
+
+from agent.utils.node.check_grammer import check_grammar_and_vocabulary
+from agent.utils.node.generate_detailed_record import generate_detailed_record
+from agent.utils.node.validate_input_inclusion import validate_input_inclusion
+from agent.utils.node.verify_record import verify_detailed_record
+from src.utils.logger import setup_logger
+
+logger = setup_logger("check_verification_agreement")
+
+SAMPLE_INPUTS: List[Dict[str, Any]] = [
+    {"name": "강감찬", "subject": "화학", "midterm_score": 0, "final_score": 0,
+     "additional_notes": "수업에 좀 더 집중할 필요가 있어 보임"},
+    {"name": "홍길동", "subject": "물리", "midterm_score": 85, "final_score": 92,
+     "additional_notes": "과학 동아리에서 실험 설계를 주도함"},
+    {"name": "유관순", "subject": "국어", "midterm_score": 70, "final_score": 70,
+     "additional_notes": None},
+    {"name": "이순신", "subject": "수학", "midterm_score": 100, "final_score": 95,
+     "additional_notes": "교내 수학 경시대회 참가"},
+]
+
+
+def make_state(index: int) -> Dict[str, Any]:
+    """샘플 입력을 순환하며 index번째 학생의 초기 state 생성."""
+    sample = SAMPLE_INPUTS[index % len(SAMPLE_INPUTS)]
+    return {
+        "teacher_input": {"student_id": index + 1, **sample},
+        "generation_status": "pending",
+        "semester": 2,
+        "academic_year": 2025,
+    }
+
+
+async def run_two_call(state: Dict[str, Any], config: Dict[str, Any]) -> Dict[str, Any]:
+    """입력 검증과 문법 검증을 각각 호출하고 두 결과를 합친 state 반환."""
+    # 그래프와 같이 두 검증을 동시에 실행
+    validation, grammar = await asyncio.gather(
+        validate_input_inclusion(state, config),
+        check_grammar_and_vocabulary(state, config),
+    )
+    return {**state, **validation, **grammar}
+
+
+async def compare(samples: int, model_name: str) -> None:
+    """samples명의 세특을 생성해 두 검증 방식의 지연 시간과 판정 일치율 출력."""
+    config = {"configurable": {"model_name": model_name}}
+    two_call_times, fused_times = [], []
+    validation_agree = grammar_agree = 0
+
+    for index in range(samples):
+        generated = await generate_detailed_record(make_state(index), config)
+
+        started = time.perf_counter()
+        two_call = await run_two_call(copy.deepcopy(generated), config)
+        two_call_times.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        fused = await verify_detailed_record(copy.deepcopy(generated), config)
+        fused_times.append(time.perf_counter() - started)
+
+        validation_agree += two_call["validation_result"]["is_valid"] == fused["validation_result"]["is_valid"]
+        grammar_agree += two_call["grammar_result"]["is_valid"] == fused["grammar_result"]["is_valid"]
+        logger.info(
+            f"[{index + 1}/{samples}] 2회 호출 {two_call_times[-1]:.2f}s, fused {fused_times[-1]:.2f}s"
+        )
+
+    logger.info("------------------------------------------")
+    logger.info(f"2회 호출 평균: {statistics.mean(two_call_times):.2f}s (최대 {max(two_call_times):.2f}s)")
+    logger.info(f"fused 평균: {statistics.mean(fused_times):.2f}s (최대 {max(fused_times):.2f}s)")
+    logger.info(f"입력 검증 판정 일치율: {validation_agree / samples:.0%}")
+    logger.info(f"문법 검증 판정 일치율: {grammar_agree / samples:.0%}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="검증 방식(2회 호출/fused) 지연 시간 및 일치율 비교")
+    parser.add_argument("--samples", type=int, default=10)
+    parser.add_argument("--model", default="openai", choices=["openai", "anthropic"])
+    args = parser.parse_args()
+    asyncio.run(compare(args.samples, args.model))
@@ -3,31 +3,37 @@
 echo "🚀 세부능력 특기사항 생성 서비스 시작"
 echo "=================================="
 
-# LangGraph Server 시작 (백그라운드)
-echo "1. LangGraph Server 시작 중..."
-langgraph up &
-LANGGRAPH_PID=$!
+# EXECUTION_BACKEND=inprocess이면 프록시가 워크플로우를 직접 실행하므로 LangGraph Server가 필요 없음
+if [ "${EXECUTION_BACKEND:-remote}" = "inprocess" ]; then
+    echo "1. In-process 실행 모드: LangGraph Server를 시작하지 않습니다."
+    LANGGRAPH_PID=""
+else
+    # LangGraph Server 시작 (백그라운드)
+    echo "1. LangGraph Server 시작 중..."
+    langgraph up &
+    LANGGRAPH_PID=$!
 
-# LangGraph Server가 준비될 때까지 대기
-echo "   LangGraph Server 빌드 및 초기화 대기 중..."
-sleep 10  # 빌드 시간을 고려해서 더 길게 대기
+    # LangGraph Server가 준비될 때까지 대기
+    echo "   LangGraph Server 빌드 및 초기화 대기 중..."
+    sleep 10  # 빌드 시간을 고려해서 더 길게 대기
 
-# 헬스 체크 (더 긴 간격으로 시도)
-echo "   LangGraph Server 상태 확인 중..."
-RETRY_COUNT=0
-MAX_RETRIES=30  # 최대 1분 대기
+    # 헬스 체크 (더 긴 간격으로 시도)
+    echo "   LangGraph Server 상태 확인 중..."
+    RETRY_COUNT=0
+    MAX_RETRIES=30  # 최대 1분 대기
 
-until curl -s http://localhost:8123/health > /dev/null 2>&1; do
-    RETRY_COUNT=$((RETRY_COUNT + 1))
-    if [ $RETRY_COUNT -ge $MAX_RETRIES ]; then
-        echo "   ❌ LangGraph Server 시작 실패 (시간 초과)"
-        kill $LANGGRAPH_PID 2>/dev/null
-        exit 1
-    fi
-    echo "   대기 중... ($RETRY_COUNT/$MAX_RETRIES)"
-    sleep 3
-done
-echo "   ✅ LangGraph Server 준비 완료 (http://localhost:8123)"
+    until curl -s http://localhost:8123/health > /dev/null 2>&1; do
+        RETRY_COUNT=$((RETRY_COUNT + 1))
+        if [ $RETRY_COUNT -ge $MAX_RETRIES ]; then
+            echo "   ❌ LangGraph Server 시작 실패 (시간 초과)"
+            kill $LANGGRAPH_PID 2>/dev/null
+            exit 1
+        fi
+        echo "   대기 중... ($RETRY_COUNT/$MAX_RETRIES)"
+        sleep 3
+    done
+    echo "   ✅ LangGraph Server 준비 완료 (http://localhost:8123)"
+fi
 
 # Proxy API 서버 시작
 echo ""
@@ -1,13 +1,26 @@
 from __future__ import annotations
 
+from typing import List, Optional, Union
+
+from langchain_core.runnables import RunnableConfig
 from langgraph.graph import END, StateGraph
 
-from agent.utils.config.config import CustomConfig
+from agent.utils.config.config import (
+    MAX_GRAMMAR_FIX_ATTEMPTS,
+    MAX_REGENERATION_ATTEMPTS,
+    CustomConfig,
+    get_verification_mode,
+)
 from agent.utils.node.check_grammer import check_grammar_and_vocabulary
 from agent.utils.node.clear import clear_and_prepare_regeneration
+from agent.utils.node.finalize import finalize_best_candidate
 from agent.utils.node.fix_grammer import fix_grammar_and_regenerate
 from agent.utils.node.generate_detailed_record import generate_detailed_record
+from agent.utils.node.merge_verification import merge_verification_results
+from agent.utils.node.repair_record import repair_missing_inputs
 from agent.utils.node.validate_input_inclusion import validate_input_inclusion
+from agent.utils.node.verify_record import verify_detailed_record
+from agent.utils.rules.run_budget import limit_reason
 from agent.utils.state.state import StudentState
 
 
@@ -34,49 +47,92 @@ def should_fix_grammar(state: StudentState) -> str:
     return "end"
 
 
+# LangGraph는 config 어노테이션을 문자열로 비교하므로 ("Optional[RunnableConfig]"만 인식) Optional 표기 유지
+def route_to_verification(state: StudentState, config: Optional[RunnableConfig] = None) -> Union[str, List[str]]:  # noqa: UP045
+    """생성/문법 수정 후 검증 노드 결정.
+
+    parallel 모드는 입력 검증과 문법 검증을 동시에 실행하고(fan-out),
+    fused 모드는 통합 검증 노드 하나로 보냄
+    """
+    if get_verification_mode(config) == "fused":
+        return "verify"
+    return ["validate_input", "check_grammar"]
+
+
+def should_regenerate_or_fix(state: StudentState, config: Optional[RunnableConfig] = None) -> str:  # noqa: UP045
+    """검증 결과 합류 후 라우팅 결정 (입력 누락 → 보완/재생성, 문법 문제 → 수정, 한도 초과 → 종료)."""
+    # 입력 누락은 먼저 누락 항목만 보완하고, 보완한 세특도 누락되면 전체 재생성
+    # (보완/재생성 시 문법 검증 결과는 버려지고 다시 검증됨)
+    if should_regenerate_for_missing_info(state) == "clear_for_regeneration":
+        route = "clear_for_regeneration" if state.get("repair_result") else "repair_missing"
+    else:
+        route = should_fix_grammar(state)
+    
+    # 요청 마감 시각이 가깝거나 재생성/문법 수정 횟수, LLM 호출 수 한도를 넘으면 지금까지 가장 나은 세특으로 종료
+    if limit_reason(state, route, config):
+        return "finalize"
+    return route
+
 
 # LangGraph Server용 워크플로우 정의
 workflow = StateGraph(StudentState, config_schema=CustomConfig)
 
-# 노드 추가
+# 노드 추가 (모든 노드는 async → 동시 Run의 LLM 호출이 이벤트 루프에서 겹쳐 실행됨)
 workflow.add_node("generate", generate_detailed_record)
 workflow.add_node("validate_input", validate_input_inclusion)
-workflow.add_node("clear_for_regeneration", clear_and_prepare_regeneration)
 workflow.add_node("check_grammar", check_grammar_and_vocabulary)
+workflow.add_node("merge_verification", merge_verification_results)
+workflow.add_node("clear_for_regeneration", clear_and_prepare_regeneration)
 workflow.add_node("fix_grammar", fix_grammar_and_regenerate)
+workflow.add_node("verify", verify_detailed_record)
+workflow.add_node("repair_missing", repair_missing_inputs)
+workflow.add_node("finalize", finalize_best_candidate)
+
+verification_routes = {
+    "validate_input": "validate_input",
+    "check_grammar": "check_grammar",
+    "verify": "verify"
+}
+
+after_verification_routes = {
+    "repair_missing": "repair_missing",
+    "clear_for_regeneration": "clear_for_regeneration",
+    "fix_grammar": "fix_grammar",
+    "finalize": "finalize",
+    "end": END
+}
 
 # 엣지 정의
 # 시작 → 생성
 workflow.add_edge("__start__", "generate")
 
-# 생성 → 입력 검증
-workflow.add_edge("generate", "validate_input")
-
-# 입력 검증 → 조건부 라우팅
-workflow.add_conditional_edges(
-    "validate_input",
-    should_regenerate_for_missing_info,
-    {
-        "clear_for_regeneration": "clear_for_regeneration",
-        "check_grammar": "check_grammar"
-    }
-)
+# 생성 → 입력 검증 + 문법 검증 병렬 실행 (fused 모드는 통합 검증)
+workflow.add_conditional_edges("generate", route_to_verification, verification_routes)
+
+# 두 검증이 모두 끝나면 합류
+workflow.add_edge(["validate_input", "check_grammar"], "merge_verification")
+
+# 합류/통합 검증 → 조건부 라우팅
+workflow.add_conditional_edges("merge_verification", should_regenerate_or_fix, after_verification_routes)
+workflow.add_conditional_edges("verify", should_regenerate_or_fix, after_verification_routes)
+
+# 누락 정보 보완 → 다시 검증
+workflow.add_conditional_edges("repair_missing", route_to_verification, verification_routes)
 
 # 정보 삭제 → 다시 생성
 workflow.add_edge("clear_for_regeneration", "generate")
 
-# 문법 검증 → 조건부 라우팅
-workflow.add_conditional_edges(
-    "check_grammar",
-    should_fix_grammar,
-    {
-        "fix_grammar": "fix_grammar",
-        "end": END
-    }
-)
+# 문법 수정 → 다시 검증 (수정 중 입력 정보가 빠질 수 있으므로 두 검증 모두 수행)
+workflow.add_conditional_edges("fix_grammar", route_to_verification, verification_routes)
+
+# 한도 초과 → 최선의 후보 반환 후 종료
+workflow.add_edge("finalize", END)
 
-# 문법 수정 → 다시 문법 검증
-workflow.add_edge("fix_grammar", "check_grammar")
+# 최악의 경우 슈퍼스텝 수: 첫 생성·검증·합류(3) + 재생성마다 삭제·생성·검증·합류(4)
+# + 세특마다 한 번씩의 보완·검증·합류(3) + 문법 수정마다 수정·검증·합류(3) + 종료(1)
+RECURSION_LIMIT = 3 + 4 * MAX_REGENERATION_ATTEMPTS + 3 * (MAX_REGENERATION_ATTEMPTS + 1) + 3 * MAX_GRAMMAR_FIX_ATTEMPTS + 1
 
-# 그래프 컴파일
-graph = workflow.compile(name="세부능력 특기사항 생성 워크플로우")
+# 그래프 컴파일 (반복 한도로 먼저 종료되도록 recursion_limit을 최악의 경우에 맞춤)
+graph = workflow.compile(name="세부능력 특기사항 생성 워크플로우").with_config(
+    {"recursion_limit": max(RECURSION_LIMIT, 25)}
+)
@@ -1,4 +1,8 @@
+import hashlib
+import json
 import os
+import time
+from typing import Any, Dict, Optional
 
 from langchain_core.runnables import RunnableConfig
 from typing_extensions import TypedDict
@@ -6,8 +10,154 @@ from typing_extensions import TypedDict
 # 기본 AI 모델 설정
 DEFAULT_MODEL = os.getenv("AI_MODEL", "openai")
 
-class CustomConfigParam(TypedDict):
+# provider별 모델 ID
+PROVIDER_MODELS: Dict[str, str] = {
+    "openai": "gpt-4o-mini",
+    "anthropic": "claude-3-sonnet-20240229",
+}
+
+# 노드별 모델 파라미터 (temperature, max_tokens, timeout, max_retries)
+# NODE_MODEL_SETTINGS 환경변수(JSON)로 노드별 값을 덮어쓸 수 있음
+# 예: NODE_MODEL_SETTINGS='{"check_grammar": {"temperature": 0, "timeout": 20}}'
+DEFAULT_NODE_MODEL_SETTINGS: Dict[str, Dict[str, Any]] = {
+    "generate": {"temperature": 0.5},
+    "validate_input": {"temperature": 0.5},
+    "check_grammar": {"temperature": 0.5},
+    "fix_grammar": {"temperature": 0.5},
+    "verify": {"temperature": 0.5},
+    "repair": {"temperature": 0.5},
+}
+
+
+def _load_node_model_settings() -> Dict[str, Dict[str, Any]]:
+    settings = {node: dict(values) for node, values in DEFAULT_NODE_MODEL_SETTINGS.items()}
+    try:
+        overrides = json.loads(os.getenv("NODE_MODEL_SETTINGS", "{}"))
+    except json.JSONDecodeError:
+        overrides = {}
+    for node, values in overrides.items():
+        settings.setdefault(node, {}).update(values)
+    return settings
+
+
+NODE_MODEL_SETTINGS = _load_node_model_settings()
+
+
+def model_fingerprint(model_name: str, *nodes: str) -> str:
+    """캐시/메모이제이션 키에 쓸 모델 식별자 생성 (provider, 실제 모델 ID, 노드별 모델 파라미터 해시).
+
+    모델 ID나 temperature 등이 바뀌면 이전 모델로 만든 결과를 재사용하지 않도록 키에 포함합니다.
+    nodes를 생략하면 모든 노드의 파라미터를 포함합니다.
+    """
+    settings = {node: NODE_MODEL_SETTINGS.get(node, {}) for node in nodes} if nodes else NODE_MODEL_SETTINGS
+    payload = {"provider": model_name, "model": PROVIDER_MODELS.get(model_name), "settings": settings}
+    encoded = json.dumps(payload, ensure_ascii=False, sort_keys=True, default=str)
+    return f"{model_name}:{hashlib.sha256(encoded.encode('utf-8')).hexdigest()[:12]}"
+
+# provider별 호출 한도 (rpm: 분당 요청 수, tpm: 분당 토큰 수, max_concurrency: 동시 호출 수)
+# 계정 tier에 맞게 PROVIDER_RATE_LIMITS 환경변수(JSON)로 덮어쓸 수 있음, 값이 null이면 해당 한도 미적용
+# 예: PROVIDER_RATE_LIMITS='{"openai": {"rpm": 5000, "tpm": 2000000}}'
+DEFAULT_PROVIDER_RATE_LIMITS: Dict[str, Dict[str, Any]] = {
+    "openai": {"rpm": 500, "tpm": 200000, "max_concurrency": 50},
+    "anthropic": {"rpm": 50, "tpm": 40000, "max_concurrency": 10},
+}
+
+
+def _load_provider_rate_limits() -> Dict[str, Dict[str, Any]]:
+    limits = {provider: dict(values) for provider, values in DEFAULT_PROVIDER_RATE_LIMITS.items()}
+    try:
+        overrides = json.loads(os.getenv("PROVIDER_RATE_LIMITS", "{}"))
+    except json.JSONDecodeError:
+        overrides = {}
+    for provider, values in overrides.items():
+        limits.setdefault(provider, {}).update(values)
+    return limits
+
+
+PROVIDER_RATE_LIMITS = _load_provider_rate_limits()
+
+# 호출 전 토큰 추정 시 더할 응답 토큰 수 (세특 300-500자 + 검증 JSON 기준)
+LLM_OUTPUT_TOKEN_ESTIMATE = int(os.getenv("LLM_OUTPUT_TOKEN_ESTIMATE", "600"))
+
+# 429 응답 시 provider 전체를 Retry-After만큼 멈춘 뒤 다시 시도할 횟수
+RATE_LIMIT_MAX_RETRIES = int(os.getenv("RATE_LIMIT_MAX_RETRIES", "3"))
+
+# 노드별 LLM 호출 헤징 (응답이 최근 지연 시간의 percentile을 넘도록 오지 않으면 같은/대체 provider로 한 번 더 호출)
+# NODE_HEDGE_SETTINGS 환경변수(JSON)에 있는 노드만 헤징하며, 지정하지 않은 값은 DEFAULT_HEDGE_SETTINGS 사용
+# percentile: 헤징 기준 지연 시간 백분위, max_rate: 전체 호출 대비 최대 헤징 비율,
+# min_samples: 헤징을 시작할 최소 지연 시간 표본 수, window: 최근 표본 수, alternate_provider: 중복 호출할 provider (없으면 같은 provider)
+# 예: NODE_HEDGE_SETTINGS='{"generate": {}, "fix_grammar": {"percentile": 90, "alternate_provider": "anthropic"}}'
+DEFAULT_HEDGE_SETTINGS: Dict[str, Any] = {
+    "percentile": 95,
+    "max_rate": 0.1,
+    "min_samples": 20,
+    "window": 200,
+    "alternate_provider": None,
+}
+
+
+def _load_node_hedge_settings() -> Dict[str, Dict[str, Any]]:
+    try:
+        overrides = json.loads(os.getenv("NODE_HEDGE_SETTINGS", "{}"))
+    except json.JSONDecodeError:
+        overrides = {}
+    return {node: {**DEFAULT_HEDGE_SETTINGS, **(values or {})} for node, values in overrides.items()}
+
+
+NODE_HEDGE_SETTINGS = _load_node_hedge_settings()
+
+# 생성 후 검증 방식: "parallel" (입력 검증과 문법 검증 동시 실행) 또는 "fused" (한 번의 호출로 통합 검증)
+DEFAULT_VERIFICATION_MODE = os.getenv("VERIFICATION_MODE", "parallel")
+
+# 로컬 문법 린트 신뢰도가 이 값보다 낮으면 LLM 문법 검증 수행
+GRAMMAR_LINT_CONFIDENCE_THRESHOLD = float(os.getenv("GRAMMAR_LINT_CONFIDENCE_THRESHOLD", "0.8"))
+
+# 반복 한도 (초과하면 지금까지 가장 나은 세특을 best_effort로 표시해 반환)
+# 전체 재생성 횟수 / 문법 수정 횟수 / Run 하나의 LLM 호출 수 (다음 수정·검증 단계까지 포함해 넘지 않도록 미리 종료)
+MAX_REGENERATION_ATTEMPTS = int(os.getenv("MAX_REGENERATION_ATTEMPTS", "3"))
+MAX_GRAMMAR_FIX_ATTEMPTS = int(os.getenv("MAX_GRAMMAR_FIX_ATTEMPTS", "3"))
+MAX_LLM_CALLS_PER_RUN = int(os.getenv("MAX_LLM_CALLS_PER_RUN", "15"))
+
+# 요청 마감 시각(configurable.deadline)이 있을 때 남은 시간이 이보다 적으면 수정/재생성 단계를 새로 시작하지 않음(초)
+DEADLINE_MIN_CYCLE_SECONDS = float(os.getenv("DEADLINE_MIN_CYCLE_SECONDS", "10"))
+
+# LLM 호출 타임아웃을 남은 시간에서 이만큼 빼서 설정 (종료 노드 실행과 응답 전달 시간, 초)
+DEADLINE_RESERVE_SECONDS = float(os.getenv("DEADLINE_RESERVE_SECONDS", "2"))
+
+# 검증 노드 결과 메모이제이션 (같은 본문을 다시 검증할 때 LLM 호출 생략)
+# NODE_MEMO_MAX_ENTRIES=0이면 비활성화, NODE_MEMO_DB_PATH를 설정하면 SQLite에 저장해 Run/재시작 간에도 재사용
+NODE_MEMO_MAX_ENTRIES = int(os.getenv("NODE_MEMO_MAX_ENTRIES", "2000"))
+NODE_MEMO_DB_PATH = os.getenv("NODE_MEMO_DB_PATH", "")
+NODE_MEMO_DB_MAX_ENTRIES = int(os.getenv("NODE_MEMO_DB_MAX_ENTRIES", "50000"))
+
+class CustomConfigParam(TypedDict, total=False):
     model_name: str  # "openai" or "anthropic"
+    verification_mode: str  # "parallel" or "fused"
+    deadline: float  # 요청 마감 시각 (epoch 초, 프록시가 요청별로 설정)
 
 class CustomConfig(RunnableConfig):
-    configurable: CustomConfigParam
\ No newline at end of file
+    configurable: CustomConfigParam
+
+
+def get_model_name(config: Optional[RunnableConfig]) -> str:
+    """실행 config에서 모델 이름 추출 (없으면 DEFAULT_MODEL)."""
+    if not config:
+        return DEFAULT_MODEL
+    return config.get("configurable", {}).get("model_name", DEFAULT_MODEL)
+
+
+def get_verification_mode(config: Optional[RunnableConfig]) -> str:
+    """실행 config에서 검증 방식 추출 (없으면 DEFAULT_VERIFICATION_MODE)."""
+    if not config:
+        return DEFAULT_VERIFICATION_MODE
+    return config.get("configurable", {}).get("verification_mode", DEFAULT_VERIFICATION_MODE)
+
+
+def remaining_time(config: Optional[RunnableConfig]) -> Optional[float]:
+    """요청 마감 시각까지 남은 시간(초), 마감 시각이 없으면 None."""
+    if not config:
+        return None
+    deadline = config.get("configurable", {}).get("deadline")
+    if deadline is None:
+        return None
+    return float(deadline) - time.time()
@@ -1,6 +1,6 @@
 from typing import Optional
 
-from typing_extensions import TypedDict
+from typing_extensions import NotRequired, TypedDict
 
 
 class TeacherInput(TypedDict):
@@ -20,6 +20,8 @@ class DetailedRecord(TypedDict):
     content: str
     generated_at: str  # ISO format string으로 변경
     version: int
+    best_effort: NotRequired[bool]  # 반복 한도에 걸려 검증을 통과하지 못한 채 반환된 세특
+    degraded: NotRequired[bool]  # 요청 마감 시각 때문에 수정/검증을 줄여서 반환된 세특
 
 
 class ErrorInfo(TypedDict):
@@ -0,0 +1,51 @@
+"""검증 노드 구조화 출력(structured output) 스키마.
+
+프롬프트에 명시한 JSON 응답 형식과 같은 구조입니다.
+"""
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class ValidationDetails(BaseModel):
+    """입력 정보 항목별 포함 여부."""
+    name_included: bool
+    student_number_included: bool = True
+    subject_included: bool
+    midterm_score_included: bool
+    final_score_included: bool
+    additional_notes_included: bool
+
+
+class ValidationCheck(BaseModel):
+    """입력 정보 포함 검증 결과 (VALIDATE_INPUT_PROMPT 형식)."""
+    is_valid: bool
+    missing_items: List[str] = Field(default_factory=list)
+    validation_details: ValidationDetails
+
+
+class AdditionalNotesCheck(BaseModel):
+    """추가사항 반영 여부 (VALIDATE_ADDITIONAL_NOTES_PROMPT 형식)."""
+    additional_notes_included: bool
+
+
+class GrammarIssue(BaseModel):
+    """문법/어휘 문제 하나."""
+    type: str = Field(description="grammar, vocabulary, spelling, inappropriate 중 하나")
+    text: str = Field(description="문제가 있는 부분 (원문 그대로)")
+    suggestion: str = Field(description="text를 그대로 대체할 수정된 표현 (설명 없이 바꿀 어구만)")
+    severity: str = Field(description="high, medium, low 중 하나")
+
+
+class GrammarCheck(BaseModel):
+    """문법 및 어휘 검증 결과 (GRAMMAR_AND_VOCABULARY_CHECK_PROMPT 형식)."""
+    is_valid: bool
+    issues: List[GrammarIssue] = Field(default_factory=list)
+    overall_quality: Optional[str] = None
+    suggestions: Optional[str] = None
+
+
+class FusedVerification(BaseModel):
+    """입력 정보 포함 검증 + 문법 검증 통합 결과 (FUSED_VERIFICATION_PROMPT 형식)."""
+    validation: ValidationCheck
+    grammar: GrammarCheck
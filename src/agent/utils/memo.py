@@ -0,0 +1,115 @@
+"""검증 노드의 LLM 판정 결과를 본문 해시로 재사용하는 노드 결과 메모 모듈."""
+import hashlib
+import json
+import sqlite3
+from typing import Any, Dict, Optional
+
+from agent.utils.config.config import (
+    NODE_MEMO_DB_MAX_ENTRIES,
+    NODE_MEMO_DB_PATH,
+    NODE_MEMO_MAX_ENTRIES,
+)
+from agent.utils.stats import register_stats
+from agent.utils.tiered_store import TieredStore
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+def prompt_version(*templates: str) -> str:
+    """노드가 쓰는 프롬프트 템플릿 해시 (프롬프트가 바뀌면 이전 결과는 재사용되지 않음)."""
+    return hashlib.sha256("\n".join(templates).encode("utf-8")).hexdigest()[:12]
+
+
+class NodeMemo:
+    """검증 노드 결과 메모이제이션.
+
+    (노드, 프롬프트 버전, 모델, 선생님 입력, 세특 본문) 해시를 키로 LLM 판정 결과를 재사용합니다.
+    메모리 LRU를 1차로 사용하고, db_path가 주어지면 SQLite를 2차 저장소로 사용해
+    다른 Run이나 서버 재시작 후에도 같은 본문의 판정을 다시 호출하지 않습니다.
+    """
+
+    def __init__(self, max_entries: int = 2000, db_path: str = "", db_max_entries: int = 50000):
+        """메모 초기화.
+
+        Args:
+            max_entries: 메모리 LRU 최대 항목 수 (0이면 비활성화)
+            db_path: SQLite 파일 경로 (빈 값이면 디스크 저장소 미사용)
+            db_max_entries: SQLite 최대 항목 수 (초과 시 오래된 항목부터 삭제)
+        """
+        self.max_entries = max_entries
+        self._store = TieredStore("node_memo", max_entries, db_path if max_entries > 0 else "", db_max_entries)
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    @property
+    def enabled(self) -> bool:
+        """메모 사용 여부 (NODE_MEMO_MAX_ENTRIES=0이면 비활성화)."""
+        return self.max_entries > 0
+
+    def make_key(self, node: str, version: str, model: str, content: str,
+                 teacher_input: Optional[Dict[str, Any]] = None) -> str:
+        """노드 결과 키 생성 (본문의 공백 차이는 무시).
+
+        model은 model_fingerprint 값 (provider, 모델 ID, 노드 파라미터가 바뀌면 다른 키),
+        teacher_input은 판정이 선생님 입력에 따라 달라지는 노드만 넘김 (문법 검증은 본문만으로 판정)
+        """
+        payload = {
+            "node": node,
+            "prompt_version": version,
+            "model": model,
+            "teacher_input": teacher_input,
+            "content": " ".join(content.split()),
+        }
+        encoded = json.dumps(payload, ensure_ascii=False, sort_keys=True, default=str)
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    def _node_stats(self, node: str) -> Dict[str, int]:
+        """노드별 적중/저장 집계 (처음 보는 노드면 0으로 생성)."""
+        return self._stats.setdefault(node, {"memory_hits": 0, "disk_hits": 0, "misses": 0, "stores": 0})
+
+    async def get(self, node: str, key: str) -> Optional[Dict[str, Any]]:
+        """저장된 결과 조회 (메모리 → 디스크 순서, 디스크 적중 시 메모리에 올림)."""
+        if not self.enabled:
+            return None
+        stats = self._node_stats(node)
+        tier, value = await self._store.get(key)
+        stats[f"{tier}_hits" if tier else "misses"] += 1
+        return value
+
+    async def set(self, node: str, key: str, value: Dict[str, Any]) -> None:
+        """노드 결과 저장 (응답 복구에 실패한 임시 판정은 저장하지 않도록 호출부에서 구분)."""
+        if not self.enabled:
+            return
+        self._node_stats(node)["stores"] += 1
+        try:
+            await self._store.set(key, value)
+        except sqlite3.Error as e:
+            # 디스크 저장 실패는 메모리 결과로 계속 진행
+            logger.warning(f"노드 결과 디스크 저장 실패 ({node}): {e}")
+
+    def clear(self) -> None:
+        """메모리 항목과 통계 초기화 (디스크 항목은 유지)."""
+        self._store.clear_memory()
+        self._stats.clear()
+
+    def close(self) -> None:
+        """SQLite 연결 종료."""
+        self._store.close()
+
+    def stats(self) -> Dict[str, Any]:
+        """노드별 적중률 반환."""
+        nodes = {}
+        for node, stats in self._stats.items():
+            hits = stats["memory_hits"] + stats["disk_hits"]
+            lookups = hits + stats["misses"]
+            nodes[node] = {**stats, "hit_rate": round(hits / lookups, 4) if lookups else 0.0}
+        return {
+            "enabled": self.enabled,
+            "memory_entries": len(self._store),
+            "disk_enabled": self._store.disk_enabled,
+            "nodes": nodes,
+        }
+
+
+node_memo = NodeMemo(NODE_MEMO_MAX_ENTRIES, NODE_MEMO_DB_PATH, NODE_MEMO_DB_MAX_ENTRIES)
+register_stats("node_memo", node_memo.stats)
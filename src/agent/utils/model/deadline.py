@@ -0,0 +1,63 @@
+"""Run 마감 시각(configurable.deadline) 안에서 LLM 호출을 실행하는 모듈."""
+import asyncio
+from typing import Any, Dict, Optional
+
+from langchain_core.runnables import RunnableConfig
+
+from agent.utils.config.config import DEADLINE_RESERVE_SECONDS, remaining_time
+from agent.utils.stats import register_stats
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# 마감 시각이 있는 호출 수 / 남은 시간을 넘겨 중단된 호출 수 / 시간이 없어 시작하지 않은 호출 수
+_deadline_stats = {"calls": 0, "timeouts": 0, "skipped": 0}
+
+
+def get_deadline_stats() -> Dict[str, int]:
+    """마감 시각 관련 호출/중단/생략 횟수 반환."""
+    return dict(_deadline_stats)
+
+
+register_stats("deadline", get_deadline_stats)
+
+
+class DeadlineExceeded(asyncio.TimeoutError):
+    """요청 마감 시각 안에 LLM 호출을 끝낼 수 없음.
+
+    원격 LangGraph Server는 노드 예외를 클래스 이름으로 전달하므로,
+    API 서버는 이 이름으로 마감 초과(504)를 다른 워크플로우 실패(500)와 구분합니다.
+    """
+
+
+def call_timeout(config: Optional[RunnableConfig]) -> Optional[float]:
+    """이번 LLM 호출에 쓸 수 있는 시간(초), 마감 시각이 없으면 None."""
+    remaining = remaining_time(config)
+    if remaining is None:
+        return None
+    return remaining - DEADLINE_RESERVE_SECONDS
+
+
+async def ainvoke_before_deadline(model: Any, input: Any, config: Optional[RunnableConfig] = None) -> Any:
+    """요청 마감 시각 안에서 모델 호출 (남은 시간을 호출 타임아웃으로 사용).
+
+    config는 모델 호출에도 그대로 전달합니다 (stream_mode="messages" 토큰 전달, 콜백).
+
+    Raises:
+        DeadlineExceeded: 남은 시간이 없거나 호출이 남은 시간 안에 끝나지 않은 경우
+    """
+    kwargs = {"config": config} if config is not None else {}
+    timeout = call_timeout(config)
+    if timeout is None:
+        return await model.ainvoke(input, **kwargs)
+
+    _deadline_stats["calls"] += 1
+    if timeout <= 0:
+        _deadline_stats["skipped"] += 1
+        raise DeadlineExceeded("요청 마감 시각이 지나 LLM 호출을 생략했습니다")
+    try:
+        return await asyncio.wait_for(model.ainvoke(input, **kwargs), timeout)
+    except asyncio.TimeoutError:
+        _deadline_stats["timeouts"] += 1
+        logger.warning(f"LLM 호출이 남은 시간({timeout:.1f}초) 안에 끝나지 않아 중단")
+        raise DeadlineExceeded(f"LLM 호출이 남은 시간({timeout:.1f}초) 안에 끝나지 않았습니다") from None
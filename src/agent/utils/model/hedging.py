@@ -0,0 +1,160 @@
+"""노드별 LLM 호출 지연 분포를 보고 느린 호출에 중복 호출(헤징)을 보내는 모듈."""
+import asyncio
+import math
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+from agent.utils.config.config import NODE_HEDGE_SETTINGS
+from agent.utils.stats import register_stats
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class NodeHedger:
+    """노드 하나의 최근 LLM 호출 지연 시간과 헤징 현황.
+
+    최근 window개 지연 시간의 percentile을 헤징 대기 시간으로 쓰고,
+    헤징 횟수가 전체 호출의 max_rate를 넘지 않도록 제한합니다.
+    """
+
+    def __init__(self, node: str, percentile: float = 95, max_rate: float = 0.1, min_samples: int = 20,
+                 window: int = 200, alternate_provider: Optional[str] = None):
+        """헤저 초기화.
+
+        Args:
+            node: 노드 이름
+            percentile: 헤징 대기 시간으로 쓸 지연 시간 percentile
+            max_rate: 전체 호출 대비 헤징 비율 상한
+            min_samples: 헤징을 시작하기 전 필요한 최소 표본 수
+            window: 보관할 최근 지연 시간 표본 수
+            alternate_provider: 중복 호출에 쓸 provider (None이면 같은 모델)
+        """
+        self.node = node
+        self.percentile = percentile
+        self.max_rate = max_rate
+        self.min_samples = min_samples
+        self.alternate_provider = alternate_provider
+        self._latencies: Deque[float] = deque(maxlen=window)
+        self._stats = {"calls": 0, "fired": 0, "won": 0, "capped": 0}
+
+    def record(self, latency: float) -> None:
+        """호출 지연 시간(초) 표본 추가."""
+        self._latencies.append(latency)
+
+    def hedge_delay(self) -> Optional[float]:
+        """헤징 전 기다릴 시간(초), 표본이 부족하면 None (헤징하지 않음)."""
+        if len(self._latencies) < max(1, self.min_samples):
+            return None
+        ordered = sorted(self._latencies)
+        index = min(len(ordered) - 1, math.ceil(len(ordered) * self.percentile / 100) - 1)
+        return ordered[max(0, index)]
+
+    def try_fire(self) -> bool:
+        """헤징 비율 한도 안이면 헤징 횟수를 올리고 True."""
+        if self._stats["fired"] + 1 > self.max_rate * self._stats["calls"]:
+            self._stats["capped"] += 1
+            return False
+        self._stats["fired"] += 1
+        return True
+
+    def count_call(self) -> None:
+        """호출 횟수 집계 (헤징 비율 계산의 분모)."""
+        self._stats["calls"] += 1
+
+    def record_win(self) -> None:
+        """중복 호출이 원래 호출보다 먼저 응답한 횟수 집계."""
+        self._stats["won"] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """호출/헤징/승리 횟수와 헤징 비율, 현재 헤징 대기 시간."""
+        calls, fired = self._stats["calls"], self._stats["fired"]
+        delay = self.hedge_delay()
+        return {
+            **self._stats,
+            "hedge_rate": round(fired / calls, 4) if calls else 0.0,
+            "win_rate": round(self._stats["won"] / fired, 4) if fired else 0.0,
+            "hedge_delay": round(delay, 3) if delay is not None else None,
+            "samples": len(self._latencies),
+        }
+
+
+class HedgedModel:
+    """응답이 늦으면 중복 호출을 보내 먼저 온 응답을 쓰고 나머지는 취소하는 래퍼.
+
+    중복 호출은 콜백 없이 실행하므로 stream_mode="messages" 토큰은 원래 호출에서만 전달됩니다.
+    중복 호출이 이기면 스트리밍된 토큰과 최종 세특이 다를 수 있으며, 최종 결과는 노드 업데이트로 전달됩니다.
+    """
+
+    def __init__(self, model: Any, hedger: NodeHedger, alternate: Any = None):
+        """래퍼 초기화.
+
+        Args:
+            model: 채팅 모델 또는 구조화 출력 Runnable
+            hedger: 노드 헤저 (지연 시간 표본과 헤징 한도)
+            alternate: 중복 호출에 쓸 모델 (None이면 model 재사용)
+        """
+        self.model = model
+        self.hedger = hedger
+        self.alternate = alternate
+
+    async def _timed(self, model: Any, input: Any, kwargs: Dict[str, Any]) -> Any:
+        """모델을 호출하고 걸린 시간을 표본으로 기록."""
+        started = time.monotonic()
+        result = await model.ainvoke(input, **kwargs)
+        self.hedger.record(time.monotonic() - started)
+        return result
+
+    async def ainvoke(self, input: Any, config: Any = None, **kwargs: Any) -> Any:
+        """모델 호출 (헤징 대기 시간 안에 응답이 없으면 중복 호출을 보내 먼저 온 응답 반환)."""
+        hedger = self.hedger
+        hedger.count_call()
+        delay = hedger.hedge_delay()
+        primary_kwargs = {**kwargs, "config": config} if config is not None else kwargs
+        started = time.monotonic()
+        primary = asyncio.ensure_future(self._timed(self.model, input, primary_kwargs))
+        tasks = [primary]
+        try:
+            if delay is None:
+                return await primary
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if done or not hedger.try_fire():
+                return await primary
+
+            logger.debug(f"[{hedger.node}] {delay:.2f}초 안에 응답이 없어 중복 호출")
+            hedge_kwargs = {**kwargs, "config": {**(config or {}), "callbacks": []}}
+            hedge = asyncio.ensure_future(self._timed(self.alternate or self.model, input, hedge_kwargs))
+            tasks.append(hedge)
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                winner = next((task for task in done if task.exception() is None), None)
+                if winner is None:
+                    continue
+                if winner is hedge:
+                    hedger.record_win()
+                    # 취소되는 원래 호출도 지금까지 걸린 시간을 표본으로 남김 (느린 구간이 표본에서 빠지지 않도록)
+                    hedger.record(time.monotonic() - started)
+                return winner.result()
+            # 두 호출 모두 실패하면 원래 호출의 예외 전달
+            return primary.result()
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    def with_structured_output(self, schema: Any, **kwargs: Any) -> "HedgedModel":
+        """구조화 출력 모델을 같은 헤저로 감싼 래퍼 반환."""
+        alternate = self.alternate.with_structured_output(schema, **kwargs) if self.alternate is not None else None
+        return HedgedModel(self.model.with_structured_output(schema, **kwargs), self.hedger, alternate)
+
+    def __getattr__(self, name: str) -> Any:
+        """래퍼에 없는 속성은 원래 모델로 위임."""
+        return getattr(self.model, name)
+
+
+node_hedgers: Dict[str, NodeHedger] = {
+    node: NodeHedger(node, **settings) for node, settings in NODE_HEDGE_SETTINGS.items()
+}
+register_stats("hedging", lambda: {node: hedger.stats() for node, hedger in node_hedgers.items()})
@@ -0,0 +1,114 @@
+"""(provider, 모델 ID, 파라미터)별 모델 클라이언트를 공유하는 레지스트리."""
+import threading
+import time
+from typing import Any, Callable, Dict, Tuple
+
+from langchain_anthropic import ChatAnthropic
+from langchain_core.language_models import BaseChatModel
+from langchain_openai import ChatOpenAI
+
+from agent.utils.config.config import NODE_MODEL_SETTINGS, PROVIDER_MODELS
+from agent.utils.model.hedging import HedgedModel, node_hedgers
+from agent.utils.model.rate_limiter import rate_limited
+from agent.utils.stats import register_stats
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+ModelKey = Tuple[str, str, Tuple[Tuple[str, Any], ...]]
+
+
+class ModelRegistry:
+    """노드 간에 공유되는 채팅 모델 클라이언트 저장소.
+
+    (provider, 모델 ID, 파라미터) 조합마다 클라이언트를 한 번만 생성하고,
+    이후 Run에서는 같은 객체(와 내부 HTTP 커넥션 풀)를 재사용합니다.
+    클라이언트는 provider별 RPM/TPM 한도를 지키는 호출 제한 래퍼로 감싸서 반환하고,
+    헤징이 설정된 노드(NODE_HEDGE_SETTINGS)는 그 바깥을 헤징 래퍼로 한 번 더 감쌉니다.
+    """
+
+    def __init__(self):
+        """provider별 모델 생성자와 빈 클라이언트 캐시로 초기화."""
+        self.factories: Dict[str, Callable[..., BaseChatModel]] = {
+            "openai": ChatOpenAI,
+            "anthropic": ChatAnthropic,
+        }
+        self._clients: Dict[ModelKey, BaseChatModel] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.construction_seconds = 0.0
+
+    def get(self, model_name: str, node: str, **overrides: Any) -> BaseChatModel:
+        """노드 설정이 적용된 모델 클라이언트 반환.
+
+        Args:
+            model_name: provider 이름 ("openai" 또는 "anthropic")
+            node: 노드 이름 (NODE_MODEL_SETTINGS 조회 키)
+            **overrides: 노드 설정을 덮어쓸 파라미터
+        """
+        if model_name not in self.factories:
+            raise ValueError(f"지원하지 않는 모델입니다: {model_name}")
+
+        settings = {**NODE_MODEL_SETTINGS.get(node, {}), **overrides}
+        settings = {key: value for key, value in settings.items() if value is not None}
+        client = self._client(model_name, node, settings)
+
+        hedger = node_hedgers.get(node)
+        if hedger is None:
+            return client
+        # 헤징 상태는 노드별이므로 같은 설정의 클라이언트를 공유하는 노드끼리도 래퍼는 따로 생성
+        alternate = None
+        if hedger.alternate_provider and hedger.alternate_provider != model_name:
+            if hedger.alternate_provider not in self.factories:
+                raise ValueError(f"지원하지 않는 헤징 모델입니다: {hedger.alternate_provider}")
+            alternate = self._client(hedger.alternate_provider, node, settings)
+        return HedgedModel(client, hedger, alternate)
+
+    def _client(self, model_name: str, node: str, settings: Dict[str, Any]) -> BaseChatModel:
+        """공유 클라이언트 반환 ((provider, 모델 ID, 파라미터) 조합별로 하나, 없으면 생성)."""
+        key: ModelKey = (model_name, PROVIDER_MODELS[model_name], tuple(sorted(settings.items())))
+
+        with self._lock:
+            client = self._clients.get(key)
+            if client is not None:
+                self.hits += 1
+                return client
+
+            started = time.perf_counter()
+            client = rate_limited(
+                self.factories[model_name](model_name=PROVIDER_MODELS[model_name], **settings), model_name
+            )
+            elapsed = time.perf_counter() - started
+
+            self.misses += 1
+            self.construction_seconds += elapsed
+            self._clients[key] = client
+
+        logger.debug(f"모델 클라이언트 생성: {model_name} ({node}) {elapsed * 1000:.1f}ms")
+        return client
+
+    def clear(self) -> None:
+        """캐시된 클라이언트 모두 제거."""
+        with self._lock:
+            self._clients.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 적중 및 클라이언트 생성 시간 통계 반환."""
+        total = self.hits + self.misses
+        return {
+            "clients": len(self._clients),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+            "construction_seconds": round(self.construction_seconds, 4),
+        }
+
+
+model_registry = ModelRegistry()
+register_stats("model_registry", model_registry.stats)
+
+
+def get_model(model_name: str, node: str, **overrides: Any) -> BaseChatModel:
+    """공유 레지스트리에서 노드용 모델 클라이언트 조회."""
+    return model_registry.get(model_name, node, **overrides)
@@ -0,0 +1,293 @@
+"""provider별 RPM/TPM 한도와 동시 호출 수 안에서 LLM 호출을 실행하는 호출 제한 모듈."""
+import asyncio
+import re
+import time
+from contextlib import asynccontextmanager
+from email.utils import parsedate_to_datetime
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+
+from langchain_core.messages import BaseMessage
+
+from agent.utils.config.config import (
+    LLM_OUTPUT_TOKEN_ESTIMATE,
+    PROVIDER_RATE_LIMITS,
+    RATE_LIMIT_MAX_RETRIES,
+)
+from agent.utils.stats import register_stats
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+HANGUL_PATTERN = re.compile(r"[가-힣ㄱ-ㅎㅏ-ㅣ]")
+
+# Retry-After 헤더가 없는 429 응답의 대기 시간(초)
+DEFAULT_RETRY_AFTER = 2.0
+
+
+def estimate_tokens(prompt: Any) -> int:
+    """프롬프트 토큰 수 추정 (한글은 글자당 약 1토큰, 그 외는 4글자당 1토큰)."""
+    if isinstance(prompt, BaseMessage):
+        text = str(prompt.content)
+    elif isinstance(prompt, (list, tuple)):
+        text = "".join(str(getattr(message, "content", message)) for message in prompt)
+    else:
+        text = str(prompt)
+    hangul = len(HANGUL_PATTERN.findall(text))
+    return hangul + (len(text) - hangul) // 4 + 1
+
+
+def _used_tokens(result: Any) -> Optional[int]:
+    """응답의 실제 사용 토큰 수 (include_raw 구조화 출력 응답 포함)."""
+    if isinstance(result, dict):
+        result = result.get("raw")
+    usage = getattr(result, "usage_metadata", None)
+    if usage:
+        return usage.get("total_tokens")
+    return None
+
+
+def retry_after_seconds(error: Exception) -> Optional[float]:
+    """429 예외이면 Retry-After 대기 시간, 아니면 None."""
+    if getattr(error, "status_code", None) != 429:
+        return None
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    if headers.get("retry-after-ms"):
+        return float(headers["retry-after-ms"]) / 1000
+    value = headers.get("retry-after")
+    if not value:
+        return DEFAULT_RETRY_AFTER
+    try:
+        return float(value)
+    except ValueError:
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return DEFAULT_RETRY_AFTER
+
+
+class TokenBucket:
+    """분당 한도를 초당 속도로 채우는 토큰 버킷 (limit이 None이면 무제한)."""
+
+    def __init__(self, limit_per_minute: Optional[float]):
+        """버킷 초기화 (가득 찬 상태로 시작).
+
+        Args:
+            limit_per_minute: 분당 한도 (None이면 무제한)
+        """
+        self.capacity = limit_per_minute
+        self.level = limit_per_minute or 0.0
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        """마지막 갱신 이후 지난 시간만큼 버킷 채우기."""
+        if self.capacity is None:
+            return
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.capacity / 60)
+        self.updated = now
+
+    def clamp(self, amount: float) -> float:
+        """한 번에 차감할 양 (한도보다 큰 요청은 버킷이 가득 찼을 때 통과시켜야 영원히 대기하지 않음)."""
+        return min(amount, self.capacity) if self.capacity is not None else amount
+
+    def time_until(self, amount: float, now: float) -> float:
+        """amount만큼 사용할 수 있을 때까지 남은 시간(초)."""
+        if self.capacity is None:
+            return 0.0
+        self._refill(now)
+        shortage = self.clamp(amount) - self.level
+        return max(0.0, shortage * 60 / self.capacity)
+
+    def consume(self, amount: float) -> None:
+        """버킷에서 amount만큼 차감 (time_until로 여유를 확인한 뒤 호출)."""
+        if self.capacity is not None:
+            self.level -= self.clamp(amount)
+
+    def refund(self, amount: float) -> None:
+        """추정치와 실제 사용량의 차이 보정 (음수면 추가 차감)."""
+        if self.capacity is not None:
+            self.level = min(self.capacity, self.level + amount)
+
+
+class ProviderRateLimiter:
+    """provider 하나의 RPM/TPM 토큰 버킷과 동시 호출 수 제한.
+
+    대기 중인 호출은 도착 순서(FIFO)대로 한 명씩 버킷을 확인하므로
+    큰 요청이 작은 요청에 계속 밀리지 않고, 429 응답을 받으면 provider 전체를 Retry-After만큼 멈춥니다.
+    """
+
+    def __init__(self, provider: str, rpm: Optional[int] = None, tpm: Optional[int] = None,
+                 max_concurrency: Optional[int] = None):
+        """제한기 초기화.
+
+        Args:
+            provider: provider 이름 (로그/통계용)
+            rpm: 분당 요청 수 한도 (None이면 무제한)
+            tpm: 분당 토큰 수 한도 (None이면 무제한)
+            max_concurrency: 동시 호출 수 한도 (None이면 무제한)
+        """
+        self.provider = provider
+        self.max_concurrency = max_concurrency
+        self._requests = TokenBucket(rpm)
+        self._tokens = TokenBucket(tpm)
+        self._paused_until = 0.0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue_lock: Optional[asyncio.Lock] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._stats = {
+            "requests": 0,
+            "queued": 0,
+            "max_queued": 0,
+            "in_flight": 0,
+            "wait_seconds": 0.0,
+            "rate_limited": 0,
+            "paused_seconds": 0.0,
+            "estimated_tokens": 0,
+            "used_tokens": 0,
+        }
+
+    def _primitives(self) -> Tuple[asyncio.Lock, Optional[asyncio.Semaphore]]:
+        """현재 이벤트 루프의 대기열 lock과 동시 호출 semaphore 반환.
+
+        asyncio 동기화 객체는 생성된 이벤트 루프에 묶이므로 루프가 바뀌면 새로 생성합니다.
+        """
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._queue_lock = asyncio.Lock()
+            self._semaphore = asyncio.Semaphore(self.max_concurrency) if self.max_concurrency else None
+        return self._queue_lock, self._semaphore
+
+    @asynccontextmanager
+    async def slot(self, tokens: int) -> AsyncIterator[None]:
+        """버킷에 여유가 생길 때까지 순서대로 대기한 뒤 호출 슬롯 점유.
+
+        버킷에서 차감한 뒤 동시 호출 슬롯을 기다리다 취소되면(헤징에서 진 호출, 마감 시각 초과)
+        호출하지 않은 몫은 버킷에 돌려줍니다.
+        """
+        queue_lock, semaphore = self._primitives()
+        started = time.monotonic()
+        self._stats["queued"] += 1
+        self._stats["max_queued"] = max(self._stats["max_queued"], self._stats["queued"])
+        try:
+            async with queue_lock:
+                while True:
+                    now = time.monotonic()
+                    wait = max(
+                        self._paused_until - now,
+                        self._requests.time_until(1, now),
+                        self._tokens.time_until(tokens, now),
+                    )
+                    if wait <= 0:
+                        break
+                    await asyncio.sleep(wait)
+                self._requests.consume(1)
+                self._tokens.consume(tokens)
+            if semaphore is not None:
+                try:
+                    await semaphore.acquire()
+                except asyncio.CancelledError:
+                    self._requests.refund(1)
+                    self._tokens.refund(self._tokens.clamp(tokens))
+                    raise
+        finally:
+            self._stats["queued"] -= 1
+        self._stats["wait_seconds"] += time.monotonic() - started
+        self._stats["requests"] += 1
+        self._stats["estimated_tokens"] += tokens
+        self._stats["in_flight"] += 1
+        try:
+            yield
+        finally:
+            self._stats["in_flight"] -= 1
+            if semaphore is not None:
+                semaphore.release()
+
+    def pause(self, seconds: float) -> None:
+        """429 응답의 Retry-After 동안 새 호출 중지."""
+        self._stats["rate_limited"] += 1
+        self._stats["paused_seconds"] += seconds
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+        logger.warning(f"[{self.provider}] 호출 한도 초과, {seconds:.1f}초 대기")
+
+    def record_usage(self, estimated: int, used: Optional[int]) -> None:
+        """실제 사용 토큰으로 TPM 버킷 보정."""
+        if used is None:
+            return
+        self._stats["used_tokens"] += used
+        self._tokens.refund(estimated - used)
+
+    def stats(self) -> Dict[str, Any]:
+        """호출 수, 대기 시간, 429 횟수, 토큰 사용량 반환."""
+        requests = self._stats["requests"]
+        return {
+            **self._stats,
+            "wait_seconds": round(self._stats["wait_seconds"], 3),
+            "avg_wait_seconds": round(self._stats["wait_seconds"] / requests, 3) if requests else 0.0,
+            "paused_seconds": round(self._stats["paused_seconds"], 3),
+        }
+
+
+class RateLimitedModel:
+    """모델(또는 구조화 출력 Runnable) 호출을 provider 한도 안에서 실행하는 래퍼."""
+
+    def __init__(self, model: Any, limiter: ProviderRateLimiter, max_retries: int = RATE_LIMIT_MAX_RETRIES):
+        """래퍼 초기화.
+
+        Args:
+            model: 채팅 모델 또는 구조화 출력 Runnable
+            limiter: provider 호출 제한기
+            max_retries: 429 응답 시 재시도 횟수
+        """
+        self.model = model
+        self.limiter = limiter
+        self.max_retries = max_retries
+
+    async def ainvoke(self, input: Any, config: Any = None, **kwargs: Any) -> Any:
+        """한도 안에서 모델 호출 (429 응답이면 Retry-After만큼 provider 전체를 멈춘 뒤 재시도)."""
+        if config is not None:
+            kwargs["config"] = config
+        estimated = estimate_tokens(input) + LLM_OUTPUT_TOKEN_ESTIMATE
+        for attempt in range(self.max_retries + 1):
+            async with self.limiter.slot(estimated):
+                try:
+                    result = await self.model.ainvoke(input, **kwargs)
+                except Exception as e:
+                    wait = retry_after_seconds(e)
+                    if wait is None or attempt == self.max_retries:
+                        raise
+                    self.limiter.pause(wait)
+                    continue
+            self.limiter.record_usage(estimated, _used_tokens(result))
+            return result
+
+    def with_structured_output(self, schema: Any, **kwargs: Any) -> "RateLimitedModel":
+        """구조화 출력 Runnable도 같은 provider 한도 안에서 호출되도록 감싸서 반환."""
+        return RateLimitedModel(self.model.with_structured_output(schema, **kwargs), self.limiter, self.max_retries)
+
+    def __getattr__(self, name: str) -> Any:
+        """그 외 속성은 원래 모델에 위임."""
+        return getattr(self.model, name)
+
+
+def _build_limiters() -> Dict[str, ProviderRateLimiter]:
+    """PROVIDER_RATE_LIMITS 설정으로 provider별 제한기 생성."""
+    return {
+        provider: ProviderRateLimiter(
+            provider,
+            rpm=limits.get("rpm"),
+            tpm=limits.get("tpm"),
+            max_concurrency=limits.get("max_concurrency"),
+        )
+        for provider, limits in PROVIDER_RATE_LIMITS.items()
+    }
+
+
+provider_limiters = _build_limiters()
+register_stats("rate_limiter", lambda: {provider: limiter.stats() for provider, limiter in provider_limiters.items()})
+
+
+def rate_limited(model: Any, provider: str) -> Any:
+    """호출 한도가 설정된 provider면 모델을 호출 제한 래퍼로 감싸서 반환."""
+    limiter = provider_limiters.get(provider)
+    return RateLimitedModel(model, limiter) if limiter is not None else model
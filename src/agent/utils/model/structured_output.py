@@ -0,0 +1,132 @@
+"""구조화 출력 호출과 응답 파싱 실패 시 복구를 담당하는 모듈."""
+import asyncio
+import json
+import re
+from typing import Any, Dict, List, Optional, Type, TypeVar
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import BaseMessage
+from langchain_core.runnables import RunnableConfig
+from pydantic import BaseModel, ValidationError
+
+from agent.utils.model.deadline import ainvoke_before_deadline
+from agent.utils.stats import register_stats
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+SchemaT = TypeVar("SchemaT", bound=BaseModel)
+
+CODE_FENCE_PATTERN = re.compile(r"```(?:json)?\s*(.*?)```", re.DOTALL)
+TRAILING_COMMA_PATTERN = re.compile(r",\s*([}\]])")
+
+# 노드별 구조화 출력 통계 (calls: 호출, parsed: 바로 파싱, repaired: 관대한 파서로 복구, failed: 복구 실패,
+# timed_out: 요청 마감 시각 안에 응답을 받지 못함)
+_parse_stats: Dict[str, Dict[str, int]] = {}
+
+
+def get_parse_stats() -> Dict[str, Dict[str, int]]:
+    """노드별 파싱 실패/복구 횟수 반환."""
+    return {node: dict(stats) for node, stats in _parse_stats.items()}
+
+
+register_stats("structured_output", get_parse_stats)
+
+
+def _count(node: str, key: str) -> None:
+    stats = _parse_stats.setdefault(node, {"calls": 0, "parsed": 0, "repaired": 0, "failed": 0, "timed_out": 0})
+    stats[key] += 1
+
+
+def parse_json_tolerant(text: str) -> Dict[str, Any]:
+    """LLM 응답 문자열에서 JSON 객체를 관대하게 추출.
+
+    코드 블록(```json), 앞뒤 설명 문장, 끝에 붙은 쉼표, 파이썬식 True/False를 허용합니다.
+
+    Raises:
+        ValueError: JSON 객체를 찾을 수 없는 경우
+    """
+    fenced = CODE_FENCE_PATTERN.search(text)
+    if fenced:
+        text = fenced.group(1)
+
+    start = text.find("{")
+    end = text.rfind("}")
+    if start == -1 or end <= start:
+        raise ValueError("응답에서 JSON 객체를 찾을 수 없습니다")
+    candidate = text[start:end + 1]
+
+    for attempt in (
+        candidate,
+        TRAILING_COMMA_PATTERN.sub(r"\1", candidate),
+        re.sub(r"\bTrue\b", "true", re.sub(r"\bFalse\b", "false", TRAILING_COMMA_PATTERN.sub(r"\1", candidate))),
+    ):
+        try:
+            parsed = json.loads(attempt)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(parsed, dict):
+            return parsed
+    raise ValueError("JSON 파싱 실패")
+
+
+def _raw_candidates(raw: Optional[BaseMessage]) -> List[str]:
+    """원본 메시지에서 JSON이 들어 있을 수 있는 문자열 목록."""
+    if raw is None:
+        return []
+    candidates = []
+    for tool_call in getattr(raw, "tool_calls", []) or []:
+        candidates.append(json.dumps(tool_call.get("args", {}), ensure_ascii=False))
+    for tool_call in getattr(raw, "invalid_tool_calls", []) or []:
+        if tool_call.get("args"):
+            candidates.append(tool_call["args"])
+    if isinstance(raw.content, str):
+        candidates.append(raw.content)
+    return candidates
+
+
+async def ainvoke_structured(
+    model: BaseChatModel, prompt: str, schema: Type[SchemaT], node: str, config: Optional[RunnableConfig] = None
+) -> Optional[SchemaT]:
+    """구조화 출력으로 모델을 호출하고, 실패하면 관대한 파서로 복구.
+
+    config에 요청 마감 시각이 있으면 남은 시간 안에서만 호출합니다.
+
+    Returns:
+        스키마 객체, 복구까지 실패하면 None (노드별 fallback 처리)
+
+    Raises:
+        asyncio.TimeoutError: 마감 시각 안에 응답을 받지 못한 경우 (판정을 가정하지 않도록 파싱 실패와 구분)
+    """
+    _count(node, "calls")
+    try:
+        structured = model.with_structured_output(schema, include_raw=True)
+    except NotImplementedError:
+        # 구조화 출력을 지원하지 않는 모델은 일반 호출 후 파싱
+        structured = None
+
+    try:
+        if structured is not None:
+            output = await ainvoke_before_deadline(structured, prompt, config)
+            if output.get("parsed") is not None:
+                _count(node, "parsed")
+                return output["parsed"]
+            raw = output.get("raw")
+            logger.warning(f"[{node}] 구조화 출력 파싱 실패: {output.get('parsing_error')}")
+        else:
+            raw = await ainvoke_before_deadline(model, prompt, config)
+    except asyncio.TimeoutError:
+        _count(node, "timed_out")
+        raise
+
+    for candidate in _raw_candidates(raw):
+        try:
+            result = schema.model_validate(parse_json_tolerant(candidate))
+        except (ValueError, ValidationError):
+            continue
+        _count(node, "repaired" if structured is not None else "parsed")
+        return result
+
+    _count(node, "failed")
+    logger.error(f"[{node}] 응답 복구 실패")
+    return None
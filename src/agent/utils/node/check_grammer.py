@@ -1,100 +1,168 @@
-import json
-from typing import Optional
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple
 
-from langchain_anthropic import ChatAnthropic
 from langchain_core.runnables import RunnableConfig
-from langchain_openai import ChatOpenAI
 
-from agent.utils.config.config import DEFAULT_MODEL
+from agent.utils.config.config import (
+    GRAMMAR_LINT_CONFIDENCE_THRESHOLD,
+    get_model_name,
+    model_fingerprint,
+)
+from agent.utils.dto.verification_schema import GrammarCheck
+from agent.utils.memo import node_memo, prompt_version
+from agent.utils.model.model_registry import get_model
+from agent.utils.model.structured_output import ainvoke_structured
+from agent.utils.rules.grammar_lint import lint_record, lint_verdict, split_sentences
+from agent.utils.rules.sentence_verdicts import (
+    SentenceVerdicts,
+    cached_result,
+    changed_sentences,
+    record_verdicts,
+)
 from agent.utils.state.state import StudentState
+from agent.utils.stats import register_stats
 from src.static.prompt import (
     GRAMMAR_AND_VOCABULARY_CHECK_PROMPT,
+    GRAMMAR_SENTENCE_CHECK_PROMPT,
 )
 from src.utils.logger import setup_logger
 
 # 로거 설정
 logger = setup_logger(__name__)
 
+# 문법 검증 프롬프트 버전 (메모이제이션 키)
+PROMPT_VERSION = prompt_version(GRAMMAR_AND_VOCABULARY_CHECK_PROMPT, GRAMMAR_SENTENCE_CHECK_PROMPT)
+
+# 린트 검사 횟수 / LLM 문법 검증으로 넘어간 횟수 / LLM에 보낸 문장 수 / 캐시된 판정을 재사용한 문장 수
+_grammar_stats = {"checks": 0, "llm_escalations": 0, "sentences_checked": 0, "sentences_reused": 0}
+
+
+def get_grammar_stats() -> Dict[str, Any]:
+    """로컬 린트에서 LLM 검증으로 넘어간 비율과 문장 판정 재사용 비율 반환."""
+    checks = _grammar_stats["checks"]
+    sentences = _grammar_stats["sentences_checked"] + _grammar_stats["sentences_reused"]
+    return {
+        **_grammar_stats,
+        "escalation_rate": round(_grammar_stats["llm_escalations"] / checks, 4) if checks else 0.0,
+        "sentence_reuse_rate": round(_grammar_stats["sentences_reused"] / sentences, 4) if sentences else 0.0,
+    }
+
 
-def check_grammar_and_vocabulary(state: StudentState, config: Optional[RunnableConfig] = None) -> StudentState:
-    """생성된 세특의 문법과 어휘를 검증하는 노드
+register_stats("grammar_lint", get_grammar_stats)
+
+
+async def _check_with_llm(
+    record_content: str,
+    lint: Dict[str, Any],
+    verdicts: SentenceVerdicts,
+    config: Optional[RunnableConfig]
+) -> Tuple[Dict[str, Any], SentenceVerdicts, str]:
+    """LLM으로 문법과 어휘를 검증하고 GrammarCheck 형식의 결과, 갱신된 문장 판정, 검증 방식을 반환.
+
+    이전 버전에서 판정받은 문장은 캐시된 판정을 재사용하고, 바뀐 문장만 LLM에 보냅니다.
     """
-    # 필요한 정보 추출 (없으면 KeyError 발생 → FastAPI에서 처리)
-    detailed_record = state["detailed_record"]
+    sentences = split_sentences(record_content)
+    changed = changed_sentences(sentences, verdicts)
+    unchanged: List[str] = [sentence for sentence in sentences if sentence not in changed]
+    _grammar_stats["sentences_checked"] += len(changed)
+    _grammar_stats["sentences_reused"] += len(set(unchanged))
+    
+    # 모든 문장이 이미 판정된 경우 LLM 호출 없이 캐시된 판정으로 결론
+    if not changed:
+        return cached_result(unchanged, verdicts), verdicts, "lint+cache"
     
-    # 모델 선택 (도구 바인딩 없이)
-    model_name = DEFAULT_MODEL
-    if config and hasattr(config, 'configurable'):
-        model_name = config.configurable.get("model_name", DEFAULT_MODEL)
+    # 공유 레지스트리에서 모델 조회
+    model = get_model(get_model_name(config), node="check_grammar")
     
-    # 도구 바인딩 없는 모델 직접 생성
-    if model_name == "openai":
-        model = ChatOpenAI(temperature=0.5, model_name="gpt-4o-mini")
-    elif model_name == "anthropic":
-        model = ChatAnthropic(temperature=0.5, model_name="claude-3-sonnet-20240229")
+    # 처음 검증하는 세특은 전체를, 문법 수정 후에는 바뀐 문장만 검증
+    if unchanged:
+        prompt = GRAMMAR_SENTENCE_CHECK_PROMPT.format(
+            sentences="\n".join(f"{idx}. {sentence}" for idx, sentence in enumerate(changed, 1))
+        )
+        checker = "lint+llm(incremental)"
     else:
-        raise Exception(f"지원하지 않는 모델입니다.: {model_name}")
+        prompt = GRAMMAR_AND_VOCABULARY_CHECK_PROMPT.format(
+            generated_content=record_content
+        )
+        checker = "lint+llm"
     
-    # 문법 검증 프롬프트 생성
-    prompt = GRAMMAR_AND_VOCABULARY_CHECK_PROMPT.format(
-        generated_content=detailed_record['content']
-    )
+    # 문법 및 어휘 검증 수행 (구조화 출력, 실패 시 관대한 파서로 복구)
+    try:
+        grammar_check = await ainvoke_structured(model, prompt, GrammarCheck, node="check_grammar", config=config)
+    except asyncio.TimeoutError:
+        # 마감 시각 안에 검증하지 못함: 린트 결과로 통과 처리하지 않고 미검증(실패)으로 표시
+        fallback = lint_verdict(lint)
+        return {"is_valid": False, "issues": fallback["issues"]}, verdicts, f"{checker}(timed_out)"
+    if grammar_check is None:
+        # 복구까지 실패하면 통과 처리하지 않고 린트 결과로 판단 (캐시에는 기록하지 않음)
+        return lint_verdict(lint), verdicts, f"{checker}(parse_failed)"
     
-    # 문법 및 어휘 검증 수행
-    response = model.invoke(prompt)
-    logger.debug("\n\n------------------------- response --------------------------\n\n")
-    logger.debug(f"{response}")
-    logger.debug("\n\n------------------------- response --------------------------\n\n")
+    result = grammar_check.model_dump()
+    verdicts = record_verdicts(verdicts, changed, result["issues"], result["is_valid"])
+    reused = cached_result(unchanged, verdicts)
+    return {
+        "is_valid": result["is_valid"] and reused["is_valid"],
+        "issues": reused["issues"] + result["issues"],
+    }, verdicts, checker
 
-    try:
-        # response.content가 문자열인지 확인하고 JSON 파싱 시도
-        if hasattr(response, 'content'):
-            content = response.content
+
+async def check_grammar_and_vocabulary(state: StudentState, config: Optional[RunnableConfig] = None) -> Dict[str, Any]:
+    """생성된 세특의 문법과 어휘를 검증하는 노드.
+
+    로컬 린트를 먼저 수행하고, 린트에 실패하거나 신뢰도가 낮을 때만 LLM으로 검증합니다.
+    LLM 판정은 문장 단위로 Run 안에서 캐시하므로 문법 수정 후에는 바뀐 문장만 다시 검증합니다.
+    입력 검증과 병렬로 실행되므로 grammar_result와 문장 판정 캐시만 반환하고, 최종 승인은 합류 노드에서 정합니다.
+    """
+    # 필요한 정보 추출 (없으면 KeyError 발생 → FastAPI에서 처리)
+    detailed_record = state["detailed_record"]
+    content = detailed_record['content']
+    
+    # 로컬 린트 (금지어, 띄어쓰기/조사, 종결 어미, 분량)
+    lint = lint_record(content, GRAMMAR_LINT_CONFIDENCE_THRESHOLD)
+    _grammar_stats["checks"] += 1
+    verdicts = state.get("sentence_verdicts") or {}
+    llm_calls = 0
+    
+    if lint["escalate"]:
+        _grammar_stats["llm_escalations"] += 1
+        # 같은 본문을 이미 검증했으면 (다른 Run 포함) 저장된 판정 재사용
+        memo_key = node_memo.make_key(
+            "check_grammar", PROMPT_VERSION, model_fingerprint(get_model_name(config), "check_grammar"), content
+        )
+        memoized = await node_memo.get("check_grammar", memo_key)
+        if memoized is not None:
+            grammar_result = memoized["result"]
+            verdicts = {**verdicts, **memoized["verdicts"]}
+            checker = "lint+memo"
         else:
-            content = str(response)
-            
-        # JSON 부분만 추출 (```json 블록이 있을 수 있음)
-        if '```json' in content:
-            start = content.find('```json') + 7
-            end = content.find('```', start)
-            content = content[start:end].strip()
-        elif '{' in content:
-            # 첫 번째 { 부터 마지막 } 까지 추출
-            start = content.find('{')
-            end = content.rfind('}') + 1
-            content = content[start:end]
-            
-        grammar_result = json.loads(content)
-    except (json.JSONDecodeError, AttributeError) as e:
-        logger.error(f"JSON 파싱 실패: {e}")
-        logger.debug(f"Response content: {content if 'content' in locals() else 'N/A'}")
-        # 기본값 설정
-        grammar_result = {
-            "is_valid": True,  # 파싱 실패시 일단 통과로 처리
-            "issues": [],
-            "check_details": {
-                "grammar_correct": True,
-                "vocabulary_appropriate": True,
-                "spelling_correct": True,
-                "readability_good": True,
-                "tone_appropriate": True,
-                "no_inappropriate_words": True
-            },
-            "overall_quality": "good",
-            "suggestions": "자동 검증 실패로 기본값 사용"
-        }
+            grammar_result, verdicts, checker = await _check_with_llm(content, lint, verdicts, config)
+            llm_calls = 0 if checker == "lint+cache" else 1
+            if not checker.endswith(("(parse_failed)", "(timed_out)")):
+                await node_memo.set("check_grammar", memo_key, {
+                    "result": grammar_result,
+                    "verdicts": {sentence: verdicts[sentence] for sentence in split_sentences(content) if sentence in verdicts}
+                })
+    else:
+        logger.debug(f"린트 통과 (confidence: {lint['confidence']}), LLM 문법 검증 생략")
+        grammar_result = {"is_valid": True, "issues": []}
+        checker = "lint"
+    
+    # 금지어는 LLM 판단과 관계없이 반드시 수정 대상
+    banned_issues = [issue for issue in lint["issues"] if issue["severity"] == "high"]
     
     # 새로운 통합 grammar_result 구조로 저장 (validation_result와 동일 구조)
-    state["grammar_result"] = {
-        "status": "completed",
-        "is_valid": grammar_result.get("is_valid", False),
-        "issues": grammar_result.get("issues", []),  # 문법 오류만
-        "details": {}  # 필요시 추가 정보
+    return {
+        "grammar_result": {
+            "status": "completed",
+            "is_valid": grammar_result.get("is_valid", False) and not banned_issues,
+            "issues": grammar_result.get("issues", []) + banned_issues,  # 문법 오류만
+            # 린트 결과 (임계값 튜닝용), 마감 시각 때문에 검증하지 못했으면 degraded (합류 노드에서 state에 반영)
+            "details": {
+                "checker": checker,
+                "lint": lint,
+                "llm_calls": llm_calls,
+                "degraded": checker.endswith("(timed_out)"),
+            }
+        },
+        "sentence_verdicts": verdicts
     }
-    
-    # 최종 승인 상태 설정 (validation과 grammar 모두 확인)
-    validation_valid = state.get("validation_result", {}).get("is_valid", False)
-    grammar_valid = state["grammar_result"]["is_valid"]
-    state["final_approval"] = validation_valid and grammar_valid
-    
-    return state
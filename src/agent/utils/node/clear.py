@@ -3,11 +3,14 @@ from typing import Optional
 
 from langchain_core.runnables import RunnableConfig
 
+from agent.utils.node.repair_record import record_repair_fallback
 from agent.utils.state.state import StudentState
 
 
-def clear_and_prepare_regeneration(state: StudentState, config: Optional[RunnableConfig] = None) -> StudentState:
-    """검증 실패 시 기존 세특을 삭제하고 재생성을 위한 상태로 초기화하는 노드
+async def clear_and_prepare_regeneration(state: StudentState, config: Optional[RunnableConfig] = None) -> StudentState:
+    """검증 실패 시 기존 세특을 삭제하고 재생성을 위한 상태로 초기화하는 노드.
+
+    누락 정보 보완(repair_missing)으로도 해결되지 않았을 때 마지막 수단으로 실행됩니다.
     """
     # validation_result 확인 - is_valid가 False면 재생성 필요
     validation_result = state.get("validation_result", {})
@@ -17,8 +20,13 @@ def clear_and_prepare_regeneration(state: StudentState, config: Optional[Runnabl
         # 재생성이 필요없으면 그대로 반환
         return state
     
-    # 기존 세특 삭제
+    # 보완을 시도했는데도 누락된 경우 (보완 실패로 기록)
+    if state.get("repair_result"):
+        record_repair_fallback()
+    
+    # 기존 세특 삭제 (새 세특은 다시 보완 대상이 됨)
     state["detailed_record"] = None
+    state["repair_result"] = None
     
     # 생성 상태를 pending으로 변경 (다시 generate_detailed_record를 호출할 준비)
     state["generation_status"] = "pending"
@@ -26,16 +34,7 @@ def clear_and_prepare_regeneration(state: StudentState, config: Optional[Runnabl
     # 에러 정보 초기화
     state["error_info"] = None
     
-    # 재생성 시도 횟수 추적 (무한 루프 방지용)
-    if "regeneration_attempts" not in state:
-        state["regeneration_attempts"] = 0
-    state["regeneration_attempts"] += 1
-    
-    # 최대 3번까지만 재생성 시도
-    if state["regeneration_attempts"] > 3:
-        raise Exception(
-            error_code="429",
-            message="재생성 시도 횟수를 초과했습니다. (최대 3회)"
-        )
+    # 재생성 시도 횟수 추적 (한도는 라우팅에서 확인하고, 넘으면 finalize로 종료)
+    state["regeneration_attempts"] = state.get("regeneration_attempts", 0) + 1
     
     return state
\ No newline at end of file
@@ -0,0 +1,48 @@
+"""시간/반복 한도를 넘었을 때 지금까지의 최선 세특을 최종 결과로 고르는 노드."""
+from typing import Any, Dict, Optional
+
+from langchain_core.runnables import RunnableConfig
+
+from agent.utils.dto.types import DetailedRecord
+from agent.utils.rules.run_budget import termination_reason
+from agent.utils.state.state import StudentState
+from agent.utils.stats import register_stats
+from src.utils.logger import setup_logger
+
+# 로거 설정
+logger = setup_logger(__name__)
+
+# 한도 초과 종료 이유별 횟수
+_termination_stats = {"deadline": 0, "llm_call_limit": 0, "regeneration_limit": 0, "grammar_fix_limit": 0}
+
+
+def get_termination_stats() -> Dict[str, Any]:
+    """반복 한도에 걸려 best_effort로 종료한 Run 수 반환."""
+    return {**_termination_stats, "total": sum(_termination_stats.values())}
+
+
+register_stats("run_limits", get_termination_stats)
+
+
+async def finalize_best_candidate(state: StudentState, config: Optional[RunnableConfig] = None) -> StudentState:
+    """시간/반복 한도를 넘었을 때 지금까지 가장 나은 세특을 best_effort로 표시해 반환하는 노드.
+
+    예외(504 등)로 Run을 실패시키지 않고, 검증을 통과하지 못했다는 표시와 함께 결과를 돌려줍니다.
+    요청 마감 시각 때문에 종료했거나 LLM 호출을 줄였다면 degraded로도 표시합니다.
+    """
+    reason = termination_reason(state, config)
+    _termination_stats[reason] += 1
+
+    best = state.get("best_candidate") or {}
+    record = best.get("record") or state["detailed_record"]
+
+    logger.warning(
+        f"반복 한도 초과로 종료 ({reason}): LLM 호출 {state.get('llm_call_count', 0)}회, "
+        f"재생성 {state.get('regeneration_attempts', 0)}회, 문법 수정 {state.get('grammar_fix_attempts', 0)}회"
+    )
+
+    degraded = reason == "deadline" or bool(state.get("degraded"))
+    state["detailed_record"] = DetailedRecord(**{**record, "best_effort": True, "degraded": degraded})
+    state["termination_reason"] = reason
+    state["final_approval"] = False
+    return state
@@ -1,17 +1,43 @@
+import asyncio
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from langchain_core.runnables import RunnableConfig
 
-from agent.utils.config.config import DEFAULT_MODEL
+from agent.utils.config.config import get_model_name
 from agent.utils.dto.types import DetailedRecord
-from agent.utils.node.helper_nodes import _get_model
+from agent.utils.model.deadline import ainvoke_before_deadline
+from agent.utils.model.model_registry import get_model
+from agent.utils.rules.grammar_patch import patch_record
 from agent.utils.state.state import StudentState
+from agent.utils.stats import register_stats
 from src.static.prompt import FIX_GRAMMAR_PROMPT
+from src.utils.logger import setup_logger
 
+# 로거 설정
+logger = setup_logger(__name__)
 
-def fix_grammar_and_regenerate(state: StudentState, config: Optional[RunnableConfig] = None) -> StudentState:
-    """문법 문제를 수정하여 세특을 재생성하는 노드
+# 수정 횟수 / 로컬 치환만으로 끝난 횟수 / LLM 재작성 횟수 / 치환한 문제 수
+_fix_stats = {"fixes": 0, "patch_only": 0, "llm_rewrites": 0, "patched_issues": 0}
+
+
+def get_fix_stats() -> Dict[str, Any]:
+    """문법 수정 중 LLM 재작성 없이 끝난 비율 반환."""
+    fixes = _fix_stats["fixes"]
+    return {
+        **_fix_stats,
+        "patch_only_rate": round(_fix_stats["patch_only"] / fixes, 4) if fixes else 0.0,
+    }
+
+
+register_stats("grammar_fix", get_fix_stats)
+
+
+async def fix_grammar_and_regenerate(state: StudentState, config: Optional[RunnableConfig] = None) -> StudentState:
+    """문법 문제를 수정하여 세특을 재생성하는 노드.
+
+    문제 구간(text)이 본문과 정확히 일치하면 suggestion으로 바로 치환하고,
+    치환할 수 없는 문제가 남은 경우에만 LLM으로 재작성합니다.
     """
     # 필요한 정보 추출
     detailed_record = state.get("detailed_record")
@@ -28,38 +54,46 @@ def fix_grammar_and_regenerate(state: StudentState, config: Optional[RunnableCon
     # 현재 content 저장
     current_content = detailed_record.get('content', '')
     
-    # 문법 수정 시도 횟수 추적 (임시 변수 사용)
-    fix_attempts = state.get("_grammar_fix_attempts", 0) + 1
-    state["_grammar_fix_attempts"] = fix_attempts
+    # 문법 수정 시도 횟수 추적 (한도는 라우팅에서 확인하고, 넘으면 finalize로 종료)
+    state["grammar_fix_attempts"] = state.get("grammar_fix_attempts", 0) + 1
     
-    # 최대 3번까지만 수정 시도
-    if fix_attempts > 3:
-        # 3번 시도해도 문법 문제가 해결되지 않으면 현재 상태로 승인
-        state["final_approval"] = True
-        state["grammar_result"]["details"]["max_attempts_reached"] = True
-        return state
-    
-    # 모델 선택
-    model_name = DEFAULT_MODEL
-    if config and hasattr(config, 'configurable'):
-        model_name = config.configurable.get("model_name", DEFAULT_MODEL)
-    model = _get_model(model_name)
+    # 1. 정확히 일치하는 구간은 제안대로 직접 치환
+    patch = patch_record(current_content, grammar_issues)
+    fixed_content = patch["content"]
+    _fix_stats["fixes"] += 1
+    _fix_stats["patched_issues"] += len(patch["applied"])
     
-    # 문법 문제 포맷팅
-    issues_text = "\n".join([
-        f"- {issue.get('type', '문제')}: {issue.get('text', '')} → {issue.get('suggestion', '수정 필요')}"
-        for issue in grammar_issues
-    ])
-    
-    # 문법 수정 프롬프트 생성
-    prompt = FIX_GRAMMAR_PROMPT.format(
-        current_content=current_content,
-        grammar_issues=issues_text if issues_text else "문법 및 어휘 개선 필요"
-    )
+    # 2. 치환할 수 없는 문제가 남았거나 문제 목록이 비어 있으면 LLM으로 재작성
+    llm_rewrite = bool(patch["unpatched"]) or not grammar_issues
+    if llm_rewrite:
+        _fix_stats["llm_rewrites"] += 1
+        
+        # 공유 레지스트리에서 모델 조회 (수정 단계는 검색 도구를 쓰지 않으므로 바인딩 없음)
+        model = get_model(get_model_name(config), node="fix_grammar")
+        
+        # 남은 문법 문제 포맷팅
+        issues_text = "\n".join([
+            f"- {issue.get('type', '문제')}: {issue.get('text', '')} → {issue.get('suggestion', '수정 필요')}"
+            for issue in patch["unpatched"]
+        ])
+        
+        # 문법 수정 프롬프트 생성 (치환이 적용된 본문 기준)
+        prompt = FIX_GRAMMAR_PROMPT.format(
+            current_content=fixed_content,
+            grammar_issues=issues_text if issues_text else "문법 및 어휘 개선 필요"
+        )
+        
+        # 문법 수정된 세특 생성 (마감 시각 안에 끝나지 않으면 직접 치환한 본문만 사용)
+        try:
+            response = await ainvoke_before_deadline(model, prompt, config)
+            fixed_content = response.content
+        except asyncio.TimeoutError:
+            state["degraded"] = True
+        state["llm_call_count"] = state.get("llm_call_count", 0) + 1
+    else:
+        _fix_stats["patch_only"] += 1
     
-    # 문법 수정된 세특 생성
-    response = model.invoke(prompt)
-    fixed_content = response.content
+    logger.debug(f"문법 수정: 치환 {len(patch['applied'])}건, LLM 재작성 {'수행' if llm_rewrite else '생략'}")
     
     # DetailedRecord 업데이트 (version 증가)
     current_version = detailed_record.get('version', 1)
@@ -80,7 +114,11 @@ def fix_grammar_and_regenerate(state: StudentState, config: Optional[RunnableCon
         "status": "fixed",  # 수정됨 표시
         "is_valid": False,  # 재검증 필요
         "issues": [],  # 수정 후 재검증 필요
-        "details": {"fixed_at": datetime.now().isoformat()}
+        "details": {
+            "fixed_at": datetime.now().isoformat(),
+            "patched_issues": len(patch["applied"]),
+            "llm_rewrite": llm_rewrite
+        }
     }
         
     return state
\ No newline at end of file
@@ -1,19 +1,20 @@
+import asyncio
 from datetime import datetime
 from typing import Optional
 
-from langchain_anthropic import ChatAnthropic
 from langchain_core.runnables import RunnableConfig
-from langchain_openai import ChatOpenAI
 
-from agent.utils.config.config import DEFAULT_MODEL
+from agent.utils.config.config import get_model_name
 from agent.utils.dto.types import DetailedRecord
+from agent.utils.model.deadline import ainvoke_before_deadline
+from agent.utils.model.model_registry import get_model
 from agent.utils.state.state import StudentState
 from src.static.prompt import (
     GENERATE_DETAILED_RECORD_PROMPT,
 )
 
 
-def generate_detailed_record(state: StudentState, config: Optional[RunnableConfig] = None) -> StudentState:
+async def generate_detailed_record(state: StudentState, config: Optional[RunnableConfig] = None) -> StudentState:
     """세부능력 특기사항을 생성하는 노드
     """
     # 선생님 입력 정보 추출 (없으면 KeyError 발생 → FastAPI에서 처리)
@@ -22,19 +23,8 @@ def generate_detailed_record(state: StudentState, config: Optional[RunnableConfi
     # 상태 업데이트
     state["generation_status"] = "in_progress"
     
-    # 모델 선택 (도구 바인딩 없이)
-    model_name = DEFAULT_MODEL
-    if config and hasattr(config, 'configurable'):
-        model_name = config.configurable.get("model_name", DEFAULT_MODEL)
-    
-    # 도구 바인딩 없는 모델 직접 생성
-    if model_name == "openai":
-        model = ChatOpenAI(temperature=0.5, model_name="gpt-4o-mini")
-    elif model_name == "anthropic":
-        model = ChatAnthropic(temperature=0.5, model_name="claude-3-sonnet-20240229")
-    else:
-        # 지원하지 않는 모델이면 ValueError 발생 → FastAPI에서 처리
-        raise ValueError(f"지원하지 않는 모델입니다: {model_name}")
+    # 공유 레지스트리에서 모델 조회 (지원하지 않는 모델이면 ValueError 발생 → FastAPI에서 처리)
+    model = get_model(get_model_name(config), node="generate")
     
     # 프롬프트 생성
     prompt = GENERATE_DETAILED_RECORD_PROMPT.format(
@@ -46,9 +36,20 @@ def generate_detailed_record(state: StudentState, config: Optional[RunnableConfi
         additional_notes=teacher_input.get('additional_notes', '없음')
     )
     
-    # 세특 생성
-    response = model.invoke(prompt)
+    # 세특 생성 (config를 넘겨야 stream_mode="messages"로 토큰이 실시간 전달됨, 마감 시각이 있으면 남은 시간 안에서만 호출)
+    try:
+        response = await ainvoke_before_deadline(model, prompt, config)
+    except asyncio.TimeoutError:
+        best = state.get("best_candidate")
+        if not best:
+            raise
+        # 재생성 중 마감 시각을 넘기면 지금까지 가장 나은 세특으로 되돌림 (검증 후 종료 노드로 이동)
+        state["detailed_record"] = best["record"]
+        state["generation_status"] = "completed"
+        state["degraded"] = True
+        return state
     generated_content = response.content
+    state["llm_call_count"] = state.get("llm_call_count", 0) + 1
     
     # DetailedRecord 생성
     detailed_record = DetailedRecord(
@@ -0,0 +1,34 @@
+"""병렬 검증 결과(입력 반영, 문법)를 합쳐 라우팅에 쓸 state를 만드는 노드."""
+from typing import Any, Dict, Optional
+
+from langchain_core.runnables import RunnableConfig
+
+from agent.utils.rules.run_budget import pick_best_candidate
+from agent.utils.state.state import StudentState
+
+
+async def merge_verification_results(state: StudentState, config: Optional[RunnableConfig] = None) -> Dict[str, Any]:
+    """병렬로 실행된 입력 검증과 문법 검증 결과를 합쳐 최종 승인 여부를 정하는 노드.
+
+    두 검증 노드는 같은 키를 동시에 쓸 수 없으므로 각자의 LLM 호출 수와 마감 시각 초과 여부를 details에 남기고,
+    여기서 Run 전체 호출 수와 degraded에 반영합니다.
+    """
+    validation_result = state.get("validation_result") or {}
+    grammar_result = state.get("grammar_result") or {}
+    
+    # validation과 grammar 모두 통과해야 최종 승인
+    validation_valid = validation_result.get("is_valid", False)
+    grammar_valid = grammar_result.get("is_valid", False)
+    
+    llm_calls = sum(
+        (result.get("details") or {}).get("llm_calls", 0) for result in (validation_result, grammar_result)
+    )
+    
+    update = {
+        "final_approval": validation_valid and grammar_valid,
+        "llm_call_count": state.get("llm_call_count", 0) + llm_calls,
+        "best_candidate": pick_best_candidate(state),
+    }
+    if any((result.get("details") or {}).get("degraded") for result in (validation_result, grammar_result)):
+        update["degraded"] = True
+    return update
@@ -0,0 +1,99 @@
+"""누락된 입력 항목만 세특에 보완하는 노드 (재생성 전 단계)."""
+import asyncio
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from langchain_core.runnables import RunnableConfig
+
+from agent.utils.config.config import get_model_name
+from agent.utils.dto.types import DetailedRecord
+from agent.utils.model.deadline import ainvoke_before_deadline
+from agent.utils.model.model_registry import get_model
+from agent.utils.model.rate_limiter import estimate_tokens
+from agent.utils.rules.input_repair import missing_info_text, repair_deterministic
+from agent.utils.state.state import StudentState
+from agent.utils.stats import register_stats
+from src.static.prompt import REPAIR_MISSING_INPUTS_PROMPT
+from src.utils.logger import setup_logger
+
+# 로거 설정
+logger = setup_logger(__name__)
+
+# 보완 시도 / 규칙만으로 보완 / LLM 문장 추가 / 보완 후에도 재생성한 횟수 / 전체 재생성 대비 절약한 응답 토큰(추정)
+_repair_stats = {"attempts": 0, "deterministic": 0, "llm_edits": 0, "fallbacks": 0, "tokens_saved": 0}
+
+
+def get_repair_stats() -> Dict[str, Any]:
+    """누락 정보 보완 성공률과 절약 토큰 반환."""
+    attempts = _repair_stats["attempts"]
+    return {
+        **_repair_stats,
+        "success_rate": round((attempts - _repair_stats["fallbacks"]) / attempts, 4) if attempts else 0.0,
+        "avg_tokens_saved": round(_repair_stats["tokens_saved"] / attempts, 1) if attempts else 0.0,
+    }
+
+
+def record_repair_fallback() -> None:
+    """보완한 세특이 검증에 실패해 전체 재생성으로 넘어간 경우 기록."""
+    _repair_stats["fallbacks"] += 1
+
+
+register_stats("input_repair", get_repair_stats)
+
+
+async def repair_missing_inputs(state: StudentState, config: Optional[RunnableConfig] = None) -> StudentState:
+    """누락된 입력 정보만 보완하는 노드 (전체 재생성 대신 수행).
+
+    점수와 이름처럼 규칙으로 넣을 수 있는 항목은 직접 삽입하고,
+    나머지 항목만 LLM에 덧붙일 문장을 요청합니다. 보완한 세특은 다시 검증하며,
+    그래도 누락되면 clear_for_regeneration으로 전체 재생성합니다.
+    """
+    # 필요한 정보 추출 (없으면 KeyError 발생 → FastAPI에서 처리)
+    teacher_input = state["teacher_input"]
+    detailed_record = state["detailed_record"]
+    missing_items = state["validation_result"].get("missing_items", [])
+    original_content = detailed_record["content"]
+    _repair_stats["attempts"] += 1
+
+    # 1. 규칙으로 보완 가능한 항목 직접 삽입
+    repair = repair_deterministic(teacher_input, original_content, missing_items)
+    content = repair["content"]
+    added_text = ""
+
+    # 2. 남은 항목은 덧붙일 문장만 LLM으로 생성
+    if repair["remaining"]:
+        _repair_stats["llm_edits"] += 1
+        model = get_model(get_model_name(config), node="repair")
+        prompt = REPAIR_MISSING_INPUTS_PROMPT.format(
+            current_content=content,
+            missing_info=missing_info_text(teacher_input, repair["remaining"])
+        )
+        # 마감 시각 안에 끝나지 않으면 규칙으로 보완한 본문만 사용
+        try:
+            response = await ainvoke_before_deadline(model, prompt, config)
+            added_text = response.content.strip()
+            content = f"{content.rstrip()} {added_text}"
+        except asyncio.TimeoutError:
+            state["degraded"] = True
+        state["llm_call_count"] = state.get("llm_call_count", 0) + 1
+    else:
+        _repair_stats["deterministic"] += 1
+
+    # 전체 재생성 시 다시 만들었을 응답 토큰 대비 절약량
+    _repair_stats["tokens_saved"] += max(0, estimate_tokens(original_content) - estimate_tokens(added_text))
+
+    logger.debug(f"누락 정보 보완: 규칙 {repair['repaired']}, LLM {repair['remaining']}")
+
+    state["detailed_record"] = DetailedRecord(
+        student_id=detailed_record["student_id"],
+        subject=detailed_record["subject"],
+        content=content,
+        generated_at=datetime.now().isoformat(),
+        version=detailed_record.get("version", 1) + 1
+    )
+    state["repair_result"] = {
+        "missing_items": missing_items,
+        "deterministic": repair["repaired"],
+        "llm": repair["remaining"],
+    }
+    return state
@@ -1,59 +1,121 @@
-import json
-from typing import Optional
+import asyncio
+from typing import Any, Dict, Optional
 
-from langchain_anthropic import ChatAnthropic
 from langchain_core.runnables import RunnableConfig
-from langchain_openai import ChatOpenAI
 
-from agent.utils.config.config import DEFAULT_MODEL
+from agent.utils.config.config import get_model_name, model_fingerprint
+from agent.utils.dto.verification_schema import AdditionalNotesCheck
+from agent.utils.memo import node_memo, prompt_version
+from agent.utils.model.model_registry import get_model
+from agent.utils.model.structured_output import ainvoke_structured
+from agent.utils.rules.input_inclusion import check_input_inclusion
 from agent.utils.state.state import StudentState
+from agent.utils.stats import register_stats
 from src.static.prompt import (
-    VALIDATE_INPUT_PROMPT,
+    VALIDATE_ADDITIONAL_NOTES_PROMPT,
 )
+from src.utils.logger import setup_logger
 
+# 로거 설정
+logger = setup_logger(__name__)
 
-def validate_input_inclusion(state: StudentState, config: Optional[RunnableConfig] = None) -> StudentState:
-    """생성된 세특에 선생님이 입력한 정보가 모두 포함되어 있는지 검증하는 노드
+# 추가사항 확인 프롬프트 버전 (메모이제이션 키)
+PROMPT_VERSION = prompt_version(VALIDATE_ADDITIONAL_NOTES_PROMPT)
+
+# 규칙 검증 횟수 / LLM fallback 호출 횟수
+_validation_stats = {"checks": 0, "llm_fallbacks": 0}
+
+
+def get_validation_stats() -> Dict[str, Any]:
+    """규칙 기반 검증의 LLM fallback 비율 반환."""
+    checks = _validation_stats["checks"]
+    return {
+        **_validation_stats,
+        "fallback_rate": round(_validation_stats["llm_fallbacks"] / checks, 4) if checks else 0.0,
+    }
+
+
+register_stats("input_validation", get_validation_stats)
+
+
+async def validate_input_inclusion(state: StudentState, config: Optional[RunnableConfig] = None) -> Dict[str, Any]:
+    """생성된 세특에 선생님이 입력한 정보가 모두 포함되어 있는지 검증하는 노드.
+
+    이름/과목/점수는 규칙으로 확인하고, 규칙으로 판단할 수 없는
+    추가사항 반영 여부만 LLM으로 확인합니다.
+    문법 검증과 병렬로 실행되므로 validation_result만 반환합니다.
     """
     # 필요한 정보 추출 (없으면 KeyError 발생 → FastAPI에서 처리)
     teacher_input = state["teacher_input"]
     detailed_record = state["detailed_record"]
     
-    # 모델 선택 (도구 바인딩 없이)
-    model_name = DEFAULT_MODEL
-    if config and hasattr(config, 'configurable'):
-        model_name = config.configurable.get("model_name", DEFAULT_MODEL)
+    # 규칙 기반 검증
+    result = check_input_inclusion(teacher_input, detailed_record['content'])
+    _validation_stats["checks"] += 1
+    validator = "rule"
+    llm_calls = 0
+    degraded = False
     
-    # 도구 바인딩 없는 모델 직접 생성
-    if model_name == "openai":
-        model = ChatOpenAI(temperature=0.5, model_name="gpt-4o-mini")
-    elif model_name == "anthropic":
-        model = ChatAnthropic(temperature=0.5, model_name="claude-3-sonnet-20240229")
-    else:
-        raise ValueError(f"지원하지 않는 모델입니다: {model_name}")
+    if not result["conclusive"]:
+        # 추가사항 의역 여부만 LLM으로 확인 (같은 입력과 본문을 이미 확인했으면 재사용)
+        model_name = get_model_name(config)
+        memo_key = node_memo.make_key(
+            "validate_input",
+            PROMPT_VERSION,
+            model_fingerprint(model_name, "validate_input"),
+            detailed_record['content'],
+            dict(teacher_input),
+        )
+        memoized = await node_memo.get("validate_input", memo_key)
+        if memoized is not None:
+            notes_included = memoized["additional_notes_included"]
+            validator = "rule+memo"
+        else:
+            _validation_stats["llm_fallbacks"] += 1
+            validator = "rule+llm"
+            llm_calls = 1
+            model = get_model(model_name, node="validate_input")
+            prompt = VALIDATE_ADDITIONAL_NOTES_PROMPT.format(
+                additional_notes=teacher_input.get('additional_notes', '없음'),
+                generated_content=detailed_record['content']
+            )
+            try:
+                notes_check = await ainvoke_structured(
+                    model, prompt, AdditionalNotesCheck, node="validate_input", config=config
+                )
+            except asyncio.TimeoutError:
+                notes_check = None
+                degraded = True
+            if degraded:
+                # 마감 시각 안에 확인하지 못함: 반영 여부를 가정하지 않고 누락으로 처리 (합류 후 degraded로 종료)
+                notes_included = False
+                validator = "rule+llm(timed_out)"
+            elif notes_check is None:
+                # 응답 복구 실패: 반영 여부를 알 수 없으므로 승인하지 않고 누락으로 보고 보완 단계로 보냄 (저장하지 않음)
+                notes_included = False
+                validator = "rule+llm(parse_failed)"
+            else:
+                notes_included = notes_check.additional_notes_included
+                await node_memo.set("validate_input", memo_key, {"additional_notes_included": notes_included})
+        
+        result["validation_details"]["additional_notes_included"] = notes_included
+        if not notes_included:
+            result["missing_items"].append("additional_notes")
+        result["is_valid"] = not result["missing_items"]
     
-    # 검증 프롬프트 생성
-    prompt = VALIDATE_INPUT_PROMPT.format(
-        name=teacher_input['name'],
-        student_id=teacher_input['student_id'],
-        subject=teacher_input['subject'],
-        midterm_score=teacher_input['midterm_score'],
-        final_score=teacher_input['final_score'],
-        additional_notes=teacher_input.get('additional_notes', '없음'),
-        generated_content=detailed_record['content']
-    )
-    
-    # 검증 수행
-    response = model.invoke(prompt)
-    result = json.loads(response.content)
+    logger.debug(f"입력 정보 검증 ({validator}): {result['missing_items'] or '누락 없음'}")
     
     # 새로운 통합 validation_result 구조로 저장
-    state["validation_result"] = {
-        "status": "completed",
-        "is_valid": result.get("is_valid", False),
-        "missing_items": result.get("missing_items", []),
-        "details": result.get("validation_details", {})
+    return {
+        "validation_result": {
+            "status": "completed",
+            "is_valid": result["is_valid"],
+            "missing_items": result["missing_items"],
+            "details": {
+                **result["validation_details"],
+                "validator": validator,
+                "llm_calls": llm_calls,
+                "degraded": degraded,
+            }
+        }
     }
-    
-    return state
-
@@ -0,0 +1,106 @@
+"""입력 반영과 문법을 LLM 호출 한 번으로 함께 검증하는 통합 검증 노드."""
+import asyncio
+from typing import Optional
+
+from langchain_core.runnables import RunnableConfig
+
+from agent.utils.config.config import GRAMMAR_LINT_CONFIDENCE_THRESHOLD, get_model_name
+from agent.utils.dto.verification_schema import FusedVerification
+from agent.utils.model.model_registry import get_model
+from agent.utils.model.structured_output import ainvoke_structured
+from agent.utils.rules.grammar_lint import lint_record, lint_verdict
+from agent.utils.rules.input_inclusion import check_input_inclusion
+from agent.utils.rules.run_budget import pick_best_candidate
+from agent.utils.state.state import StudentState
+from src.static.prompt import (
+    FUSED_VERIFICATION_PROMPT,
+)
+from src.utils.logger import setup_logger
+
+# 로거 설정
+logger = setup_logger(__name__)
+
+
+async def verify_detailed_record(state: StudentState, config: Optional[RunnableConfig] = None) -> StudentState:
+    """입력 정보 포함 여부와 문법을 한 번의 LLM 호출로 함께 검증하는 노드 (verification_mode="fused").
+
+    규칙 검증과 로컬 린트로 결론이 나면 LLM을 호출하지 않고,
+    필요할 때만 두 검증 결과를 함께 반환하는 구조화 출력 호출을 한 번 수행합니다.
+    """
+    # 필요한 정보 추출 (없으면 KeyError 발생 → FastAPI에서 처리)
+    teacher_input = state["teacher_input"]
+    detailed_record = state["detailed_record"]
+    content = detailed_record['content']
+
+    inclusion = check_input_inclusion(teacher_input, content)
+    lint = lint_record(content, GRAMMAR_LINT_CONFIDENCE_THRESHOLD)
+    validation_details = dict(inclusion["validation_details"])
+    grammar_valid = True
+    grammar_issues = []
+    checker = "rule+lint"
+
+    # 입력 정보가 확실히 누락되었으면 어차피 재생성하므로 문법 검증 불필요
+    definitely_missing = inclusion["conclusive"] and not inclusion["is_valid"]
+    if not definitely_missing and (not inclusion["conclusive"] or lint["escalate"]):
+        checker = "fused_llm"
+        model = get_model(get_model_name(config), node="verify")
+        prompt = FUSED_VERIFICATION_PROMPT.format(
+            name=teacher_input['name'],
+            student_id=teacher_input['student_id'],
+            subject=teacher_input['subject'],
+            midterm_score=teacher_input['midterm_score'],
+            final_score=teacher_input['final_score'],
+            additional_notes=teacher_input.get('additional_notes', '없음'),
+            generated_content=content
+        )
+        try:
+            result = await ainvoke_structured(model, prompt, FusedVerification, node="verify", config=config)
+            state["llm_call_count"] = state.get("llm_call_count", 0) + 1
+        except asyncio.TimeoutError:
+            # 마감 시각 안에 검증하지 못함: 확인하지 못한 항목은 누락, 문법은 미검증(실패)으로 보고 degraded로 종료
+            result = None
+            checker = "fused_llm(timed_out)"
+            state["degraded"] = True
+
+        if result is None:
+            # 응답 복구 실패/시간 초과: 규칙으로 확인하지 못한 항목은 승인하지 않고 누락으로 처리
+            # 문법은 응답 복구 실패면 린트로 판단하고, 시간 초과면 미검증으로 처리
+            if checker == "fused_llm":
+                checker = "fused_llm(parse_failed)"
+            llm_details = {}
+            fallback = lint_verdict(lint)
+            grammar_valid = fallback["is_valid"] and not state.get("degraded")
+            grammar_issues = [issue for issue in fallback["issues"] if issue["severity"] != "high"]
+        else:
+            llm_details = result.validation.validation_details.model_dump()
+            if lint["escalate"]:
+                grammar_valid = result.grammar.is_valid
+                grammar_issues = [issue.model_dump() for issue in result.grammar.issues]
+
+        # 규칙으로 판단하지 못한 항목만 LLM 판단 사용
+        for key, value in validation_details.items():
+            if value is None:
+                validation_details[key] = llm_details.get(key, False)
+
+    missing_items = [key.replace("_included", "") for key, value in validation_details.items() if not value]
+    # 금지어는 LLM 판단과 관계없이 반드시 수정 대상
+    banned_issues = [issue for issue in lint["issues"] if issue["severity"] == "high"]
+
+    logger.debug(f"통합 검증 ({checker}): 누락 {missing_items or '없음'}, 문법 문제 {len(grammar_issues + banned_issues)}건")
+
+    state["validation_result"] = {
+        "status": "completed",
+        "is_valid": not missing_items,
+        "missing_items": missing_items,
+        "details": {**validation_details, "validator": checker}
+    }
+    state["grammar_result"] = {
+        "status": "completed",
+        "is_valid": grammar_valid and not banned_issues,
+        "issues": grammar_issues + banned_issues,
+        "details": {"checker": checker, "lint": lint}
+    }
+    state["final_approval"] = state["validation_result"]["is_valid"] and state["grammar_result"]["is_valid"]
+    state["best_candidate"] = pick_best_candidate(state)
+
+    return state
@@ -0,0 +1,168 @@
+"""LLM 없이 세특 본문의 문법/형식 문제를 찾는 규칙 검사."""
+import re
+from typing import Any, Dict, List
+
+# 세특에 쓰면 안 되는 비속어/부정적 표현
+BANNED_WORDS = (
+    "씨발", "시발", "병신", "존나", "졸라", "개새", "ㅋㅋ", "ㅎㅎ", "ㅠㅠ",
+    "멍청", "바보", "한심", "게으름뱅이", "쓰레기", "문제아", "최악",
+)
+
+# (받침 있을 때, 받침 없을 때) 조사 쌍 - 두 형태가 겹쳐 쓰인 경우 검출
+PARTICLE_PAIRS = (("을", "를"), ("은", "는"), ("이", "가"), ("과", "와"))
+# 마지막 음절이 조사 형태와 같은 명사 ("높이가", "결과와"는 조사 중복이 아님)
+# 목록이 완전할 수 없으므로 조사 중복은 확정 문제가 아닌 LLM 확인용 의심 사례로만 다룸
+PARTICLE_LIKE_NOUNS = (
+    "높이", "길이", "넓이", "깊이", "놀이", "풀이", "먹이", "걸이", "잡이", "벌이", "살이", "돋이", "꽂이",
+    "결과", "성과", "학과", "일과", "인과", "실과", "전과",
+)
+
+# GENERATE_DETAILED_RECORD_PROMPT의 "300-500자 내외"
+LENGTH_RANGE = (300, 500)
+LENGTH_TOLERANCE = 0.1
+
+SEVERITY_PENALTY = {"high": 1.0, "medium": 0.25, "low": 0.1}
+
+MARKDOWN_PATTERN = re.compile(r"(\*\*|__|^#+\s|^\s*[-*]\s)", re.MULTILINE)
+# 문장 부호 뒤 공백/줄바꿈에서만 나눔 ("3.5점" 같은 소수점은 나누지 않음)
+SENTENCE_BOUNDARY_PATTERN = re.compile(r"(?<=[.!?])\s+|\n+")
+
+
+def split_sentences(content: str) -> List[str]:
+    """본문을 문장 단위로 분리 (앞뒤 공백 제거, 빈 문장 제외)."""
+    return [sentence.strip() for sentence in SENTENCE_BOUNDARY_PATTERN.split(content) if sentence.strip()]
+
+
+def _has_final_consonant(char: str, consonant_index: int) -> bool:
+    code = ord(char) - 0xAC00
+    return 0 <= code <= 11171 and code % 28 == consonant_index
+
+
+def _has_batchim(char: str) -> bool:
+    code = ord(char) - 0xAC00
+    return 0 <= code <= 11171 and code % 28 != 0
+
+
+def _ending_style(sentence: str) -> str:
+    """문장 종결 형태 분류 (개조식 ~함/~음, 서술식 ~다, 경어체 ~요)."""
+    hangul = re.sub(r"[^가-힣]", "", sentence)
+    if not hangul:
+        return "unknown"
+    last = hangul[-1]
+    if _has_final_consonant(last, 16):  # 받침 ㅁ: 함, 음, 임, 됨, 보임 ...
+        return "nominal"
+    if last == "다":
+        return "declarative"
+    if last == "요":
+        return "polite"
+    return "unknown"
+
+
+def dominant_ending(content: str) -> str:
+    """본문에서 가장 많이 쓰인 종결 형태 ("nominal" 또는 "declarative", 기본값 nominal)."""
+    styles = [_ending_style(sentence) for sentence in split_sentences(content)]
+    return "declarative" if styles.count("declarative") > styles.count("nominal") else "nominal"
+
+
+def _issue(issue_type: str, text: str, suggestion: str, severity: str) -> Dict[str, str]:
+    return {"type": issue_type, "text": text, "suggestion": suggestion, "severity": severity}
+
+
+def _banned_word_issues(content: str) -> List[Dict[str, str]]:
+    return [
+        _issue("inappropriate", word, "교육 문서에 적절한 표현으로 수정", "high")
+        for word in BANNED_WORDS
+        if word in content
+    ]
+
+
+def _spacing_issues(content: str) -> List[Dict[str, str]]:
+    issues = []
+    for match in re.finditer(r"[가-힣]+ {2,}[가-힣]+", content):
+        text = match.group()
+        issues.append(_issue("spelling", text, re.sub(r" {2,}", " ", text), "low"))
+    for match in re.finditer(r"[가-힣]+ +[.,!?]", content):
+        text = match.group()
+        issues.append(_issue("spelling", text, re.sub(r" +", "", text), "low"))
+    for match in re.finditer(r"[가-힣]+[.,!?][가-힣]+", content):
+        text = match.group()
+        issues.append(_issue("spelling", text, re.sub(r"([.,!?])", r"\1 ", text), "low"))
+    return issues
+
+
+def _particle_suspects(content: str) -> List[Dict[str, str]]:
+    """조사 중복으로 보이는 어절 ("어린이가"처럼 정상일 수 있어 대체 문구 없이 반환)."""
+    suspects = []
+    for match in re.finditer(r"[가-힣]+", content):
+        word = match.group()
+        if len(word) < 3:
+            continue
+        # 마지막 조사 앞이 명사 자체로 끝나면 조사가 하나뿐인 정상 표현
+        if word[:-1].endswith(PARTICLE_LIKE_NOUNS):
+            continue
+        stem = word[:-2]
+        for with_batchim, without_batchim in PARTICLE_PAIRS:
+            correct = with_batchim if _has_batchim(stem[-1]) else without_batchim
+            other = without_batchim if correct == with_batchim else with_batchim
+            # 앞 조사가 어간에 맞는 형태일 때만 중복으로 판단 ("차이가", "사과와"는 정상)
+            if word[-2:] == correct + other:
+                suspects.append(_issue("grammar", word, "", "medium"))
+                break
+    return suspects
+
+
+def _ending_issues(content: str) -> List[Dict[str, str]]:
+    styles = {_ending_style(sentence): sentence for sentence in split_sentences(content)}
+    styles.pop("unknown", None)
+
+    issues = []
+    if "polite" in styles:
+        issues.append(_issue("grammar", styles["polite"], "~함/~음 형태의 개조식 종결로 수정", "medium"))
+    if "nominal" in styles and "declarative" in styles:
+        issues.append(_issue("grammar", styles["declarative"], "~함/~음 형태로 종결 어미 통일", "medium"))
+    return issues
+
+
+def _format_issues(content: str) -> List[Dict[str, str]]:
+    issues = []
+    length = len(content.strip())
+    low, high = LENGTH_RANGE
+    if length < low * (1 - LENGTH_TOLERANCE) or length > high * (1 + LENGTH_TOLERANCE):
+        issues.append(_issue("length", "", f"{low}-{high}자 내외로 조정 (현재 {length}자)", "medium"))
+    if MARKDOWN_PATTERN.search(content):
+        issues.append(_issue("format", "", "마크다운 기호 없이 문장으로 작성", "medium"))
+    return issues
+
+
+def lint_record(content: str, confidence_threshold: float = 0.8) -> Dict[str, Any]:
+    """세특 본문을 로컬 규칙으로 빠르게 점검.
+
+    Returns:
+        issues: GRAMMAR_AND_VOCABULARY_CHECK_PROMPT 응답과 같은 형식의 문제 목록
+        confidence: 1.0에서 문제 심각도별 감점을 뺀 신뢰도
+        suspects: 규칙으로 확정할 수 없어 LLM 확인만 요청하는 의심 사례 (issues/패치에는 넣지 않음)
+        escalate: LLM 문법 검증이 필요한지 여부
+    """
+    suspects = _particle_suspects(content)
+    issues = (
+        _banned_word_issues(content)
+        + _spacing_issues(content)
+        + _ending_issues(content)
+        + _format_issues(content)
+    )
+    confidence = max(0.0, 1.0 - sum(SEVERITY_PENALTY[issue["severity"]] for issue in issues))
+    failed = any(issue["severity"] in ("high", "medium") for issue in issues)
+
+    return {
+        "issues": issues,
+        "suspects": suspects,
+        "confidence": round(confidence, 2),
+        "length": len(content.strip()),
+        "escalate": failed or bool(suspects) or confidence < confidence_threshold,
+    }
+
+
+def lint_verdict(lint: Dict[str, Any]) -> Dict[str, Any]:
+    """린트 결과만으로 만든 문법 검증 결과 (LLM 응답을 쓸 수 없을 때 사용)."""
+    issues = [issue for issue in lint["issues"] if issue["severity"] in ("high", "medium")]
+    return {"is_valid": not issues, "issues": lint["issues"]}
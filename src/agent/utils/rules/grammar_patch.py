@@ -0,0 +1,56 @@
+"""검증에서 찾은 치환형 문제를 본문에 직접 적용하는 규칙 패치."""
+import re
+from typing import Any, Dict, List, Tuple
+
+# "~함/~음 형태로 수정"처럼 대체 문구가 아닌 수정 지시로 보이는 제안
+INSTRUCTION_PATTERN = re.compile(r"(~|수정$|통일$|조정$|작성$|변경$|삭제$|필요$|바랍니다$|하세요$)")
+
+# 제안이 원문보다 이 배수 이상 길면 대체 문구가 아닌 설명으로 판단
+MAX_SUGGESTION_RATIO = 3
+
+
+def _is_replacement(issue: Dict[str, Any]) -> bool:
+    text = issue.get("text") or ""
+    suggestion = (issue.get("suggestion") or "").strip()
+    if not text.strip() or not suggestion or suggestion == text:
+        return False
+    if INSTRUCTION_PATTERN.search(suggestion):
+        return False
+    return len(suggestion) <= len(text) * MAX_SUGGESTION_RATIO + 5
+
+
+def patch_record(content: str, issues: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """문법 문제의 text 구간을 suggestion으로 직접 치환.
+
+    text가 본문에 정확히 한 번만 나오고 suggestion이 대체 문구인 경우에만 적용하며,
+    적용 구간이 서로 겹치면 먼저 나온 문제만 적용합니다.
+
+    Returns:
+        content: 치환이 적용된 본문
+        applied: 적용한 문제 목록
+        unpatched: 로컬에서 고칠 수 없어 LLM 수정이 필요한 문제 목록
+    """
+    spans: List[Tuple[int, int, Dict[str, Any]]] = []
+    unpatched = []
+    for issue in issues:
+        text = issue.get("text") or ""
+        if not _is_replacement(issue) or content.count(text) != 1:
+            unpatched.append(issue)
+            continue
+        start = content.index(text)
+        end = start + len(text)
+        if any(start < other_end and other_start < end for other_start, other_end, _ in spans):
+            unpatched.append(issue)
+            continue
+        spans.append((start, end, issue))
+
+    patched = content
+    # 뒤에서부터 치환해야 앞 구간의 위치가 바뀌지 않음
+    for start, end, issue in sorted(spans, key=lambda span: span[0], reverse=True):
+        patched = patched[:start] + issue["suggestion"].strip() + patched[end:]
+
+    return {
+        "content": patched,
+        "applied": [issue for _, _, issue in sorted(spans, key=lambda span: span[0])],
+        "unpatched": unpatched,
+    }
@@ -0,0 +1,136 @@
+"""선생님 입력(이름, 점수, 특이사항)이 세특에 반영되었는지 확인하는 규칙 검사."""
+import re
+from typing import Any, Dict, List, Optional
+
+from agent.utils.dto.types import TeacherInput
+
+# 단어 끝에 붙는 조사 (긴 것부터 제거)
+KOREAN_PARTICLES = (
+    "에서는", "으로는", "에게서", "이라는", "라는", "에서", "에게", "으로", "까지", "부터",
+    "처럼", "보다", "이나", "은", "는", "이", "가", "을", "를", "에", "로", "와", "과",
+    "의", "도", "만", "나",
+)
+
+# 추가사항 키워드에서 제외할 일반 용언/부사
+NOTE_STOPWORDS = {
+    "있음", "있어", "있다", "있는", "없음", "없어", "보임", "보여", "보이", "하다", "하는",
+    "하여", "했음", "했다", "함", "좀", "더", "매우", "아주", "조금", "필요", "필요가",
+}
+
+NO_NOTES_VALUES = {"", "없음", "없다", "none", "null"}
+
+# 일치한 표현 바로 뒤에 오면 뜻이 뒤집히는 부정 표현 ("부족함 없이", "집중하지 않음")
+NEGATION_WORDS = ("없이", "없음", "없어", "없는", "없고", "없다", "않음", "않고", "않는", "않아", "않다", "아님", "아닌", "못함")
+# 일치한 표현 바로 앞에 오면 뜻이 뒤집히는 부정 부사
+NEGATION_PREFIXES = ("안", "못")
+
+# "50점", "50 점", "50.5점" (앞자리 숫자 일부만 잡지 않도록 lookbehind)
+SCORE_PATTERN = re.compile(r"(?<![\d.])(\d+(?:\.\d+)?)\s*점")
+
+
+def _compact(text: str) -> str:
+    return re.sub(r"\s+", "", text)
+
+
+def _strip_particle(token: str) -> str:
+    for particle in KOREAN_PARTICLES:
+        if token.endswith(particle) and len(token) - len(particle) >= 2:
+            return token[: -len(particle)]
+    return token
+
+
+def _mentioned_scores(content: str) -> List[float]:
+    scores = [float(match) for match in SCORE_PATTERN.findall(content)]
+    if "만점" in content:
+        scores.append(100.0)
+    return scores
+
+
+def _name_included(name: str, content: str) -> bool:
+    compact = _compact(content)
+    if _compact(name) in compact:
+        return True
+    # 성을 뺀 이름으로만 언급한 경우 ("길동이는")
+    given_name = name[1:] if len(name) >= 3 else ""
+    return bool(given_name) and given_name in compact
+
+
+def _stems(text: str) -> List[str]:
+    """어절별로 조사를 뗀 형태 목록."""
+    return [_strip_particle(token) for token in re.findall(r"[가-힣A-Za-z0-9]+", text)]
+
+
+def _is_keyword(stem: str) -> bool:
+    return len(stem) >= 2 and stem not in NOTE_STOPWORDS
+
+
+def _compact_match(note: str, compact: str) -> bool:
+    """공백을 뺀 추가사항이 본문에 그대로 있고, 바로 뒤가 부정 표현이 아닌지 여부."""
+    start = compact.find(note)
+    while start != -1:
+        end = start + len(note)
+        # "20시간"이 "120시간" 안에서 일치한 경우처럼 숫자가 이어지면 같은 값이 아님
+        glued_number = note[0].isdigit() and start > 0 and compact[start - 1].isdigit()
+        negated = compact.startswith(NEGATION_WORDS, end) or compact[:start].endswith(NEGATION_PREFIXES)
+        if not glued_number and not negated:
+            return True
+        start = compact.find(note, start + 1)
+    return False
+
+
+def _token_match(keywords: List[str], content: str) -> bool:
+    """조사를 뗀 추가사항 어절이 본문에 같은 순서로 이어서 나오고, 앞뒤가 부정 표현이 아닌지 여부."""
+    stems = _stems(content)
+    positions = [index for index, stem in enumerate(stems) if _is_keyword(stem)]
+    for offset in range(len(positions) - len(keywords) + 1):
+        window = positions[offset:offset + len(keywords)]
+        if [stems[index] for index in window] != keywords:
+            continue
+        after = stems[window[-1] + 1] if window[-1] + 1 < len(stems) else ""
+        before = stems[window[0] - 1] if window[0] > 0 else ""
+        if after not in NEGATION_WORDS and before not in NEGATION_PREFIXES:
+            return True
+    return False
+
+
+def _notes_included(notes: Optional[str], content: str) -> Optional[bool]:
+    """추가사항 포함 여부 (그대로 반영된 경우만 True, 그 외 의역/부정/다른 수치 여부는 판단하지 않고 None)."""
+    if notes is None or notes.strip().lower() in NO_NOTES_VALUES:
+        return True
+    if _compact_match(_compact(notes), _compact(content)):
+        return True
+    keywords = [stem for stem in _stems(notes) if _is_keyword(stem)]
+    # 추가사항 자체에 부정 표현이 있으면 어절 일치만으로는 의미를 확신할 수 없음
+    negated_note = any(stem in NEGATION_WORDS or stem in NEGATION_PREFIXES for stem in _stems(notes))
+    if keywords and not negated_note and _token_match(keywords, content):
+        return True
+    # 의역 여부는 규칙으로 판단할 수 없음 → LLM 확인 필요
+    return None
+
+
+def check_input_inclusion(teacher_input: TeacherInput, content: str) -> Dict[str, Any]:
+    """선생님 입력 정보 포함 여부를 규칙으로 검증.
+
+    VALIDATE_INPUT_PROMPT의 응답 형식과 같은 구조를 반환하며,
+    규칙으로 판단할 수 없는 항목은 validation_details에서 None으로 표시하고
+    conclusive를 False로 설정합니다.
+    """
+    scores = _mentioned_scores(content)
+    details: Dict[str, Optional[bool]] = {
+        "name_included": _name_included(teacher_input["name"], content),
+        "student_number_included": True,  # 학생 번호는 포함되지 않아도 됨
+        "subject_included": _compact(teacher_input["subject"]) in _compact(content),
+        "midterm_score_included": float(teacher_input["midterm_score"]) in scores,
+        "final_score_included": float(teacher_input["final_score"]) in scores,
+        "additional_notes_included": _notes_included(teacher_input.get("additional_notes"), content),
+    }
+
+    missing_items = [key.replace("_included", "") for key, value in details.items() if value is False]
+    conclusive = bool(missing_items) or all(value is not None for value in details.values())
+
+    return {
+        "is_valid": not missing_items and conclusive,
+        "missing_items": missing_items,
+        "validation_details": details,
+        "conclusive": conclusive,
+    }
@@ -0,0 +1,74 @@
+"""누락된 입력 항목을 문장으로 만들어 세특에 끼워 넣는 규칙 보완."""
+import re
+from typing import Any, Dict, List
+
+from agent.utils.dto.types import TeacherInput
+from agent.utils.rules.grammar_lint import dominant_ending
+
+# 이름 없이 학생을 가리키는 첫머리 ("본 학생은", "해당 학생은", "학생은")
+ANONYMOUS_SUBJECT_PATTERN = re.compile(r"^\s*(?:(?:본|이|해당)\s*)?학생은")
+
+# 첫 문장 끝 (첫 문장 다음에 점수 문장을 넣음)
+FIRST_SENTENCE_END_PATTERN = re.compile(r"[.!?](?=\s|$)")
+
+# 누락 항목 이름 (missing_items 키 → 보완 프롬프트 표시명)
+ITEM_LABELS = {
+    "name": "학생 이름",
+    "subject": "과목명",
+    "midterm_score": "2학기 중간 수행평가",
+    "final_score": "2학기 기말 수행평가",
+    "additional_notes": "추가사항",
+}
+
+
+def _score_sentence(teacher_input: TeacherInput, missing: List[str], style: str) -> str:
+    ending = "기록하였다." if style == "declarative" else "기록함."
+    if "midterm_score" in missing and "final_score" in missing:
+        return (
+            f"2학기 중간 수행평가 {teacher_input['midterm_score']}점, "
+            f"기말 수행평가 {teacher_input['final_score']}점을 {ending}"
+        )
+    if "midterm_score" in missing:
+        return f"2학기 중간 수행평가에서 {teacher_input['midterm_score']}점을 {ending}"
+    return f"2학기 기말 수행평가에서 {teacher_input['final_score']}점을 {ending}"
+
+
+def insert_after_first_sentence(content: str, sentence: str) -> str:
+    """첫 문장 뒤에 문장 삽입 (문장 구분이 없으면 끝에 추가)."""
+    match = FIRST_SENTENCE_END_PATTERN.search(content)
+    if match is None:
+        return f"{content.rstrip()} {sentence}"
+    position = match.end()
+    return f"{content[:position]} {sentence}{content[position:]}"
+
+
+def repair_deterministic(teacher_input: TeacherInput, content: str, missing_items: List[str]) -> Dict[str, Any]:
+    """규칙만으로 보완할 수 있는 누락 항목을 본문에 직접 삽입.
+
+    - 점수: 본문 종결 형태에 맞춘 점수 문장을 첫 문장 뒤에 삽입
+    - 이름: "본 학생은"처럼 이름 없이 시작하면 이름으로 교체
+
+    Returns:
+        content: 보완된 본문
+        repaired: 규칙으로 보완한 항목
+        remaining: LLM 보완이 필요한 항목
+    """
+    repaired = []
+    scores_missing = [item for item in missing_items if item in ("midterm_score", "final_score")]
+    if scores_missing:
+        content = insert_after_first_sentence(
+            content, _score_sentence(teacher_input, scores_missing, dominant_ending(content))
+        )
+        repaired.extend(scores_missing)
+
+    if "name" in missing_items and ANONYMOUS_SUBJECT_PATTERN.match(content):
+        content = ANONYMOUS_SUBJECT_PATTERN.sub(f"{teacher_input['name']} 학생은", content, count=1)
+        repaired.append("name")
+
+    remaining = [item for item in missing_items if item not in repaired and item in ITEM_LABELS]
+    return {"content": content, "repaired": repaired, "remaining": remaining}
+
+
+def missing_info_text(teacher_input: TeacherInput, items: List[str]) -> str:
+    """REPAIR_MISSING_INPUTS_PROMPT에 넣을 누락 정보 목록."""
+    return "\n".join(f"- {ITEM_LABELS[item]}: {teacher_input.get(item)}" for item in items)
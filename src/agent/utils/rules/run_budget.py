@@ -0,0 +1,85 @@
+"""Run별 LLM 호출/시간/반복 한도 확인과 종료 사유 판단."""
+from typing import Any, Dict, List, Optional
+
+from langchain_core.runnables import RunnableConfig
+
+from agent.utils.config.config import (
+    DEADLINE_MIN_CYCLE_SECONDS,
+    MAX_GRAMMAR_FIX_ATTEMPTS,
+    MAX_LLM_CALLS_PER_RUN,
+    MAX_REGENERATION_ATTEMPTS,
+    remaining_time,
+)
+
+# 수정 단계 하나의 최대 LLM 호출 수 (생성/수정/보완 1회 + 병렬 검증 2회)
+CALLS_PER_CYCLE = 3
+
+
+def within_llm_budget(state: Dict[str, Any]) -> bool:
+    """다음 수정·검증 단계를 마쳐도 Run의 LLM 호출 한도를 넘지 않는지 여부."""
+    return (state.get("llm_call_count") or 0) + CALLS_PER_CYCLE <= MAX_LLM_CALLS_PER_RUN
+
+
+def within_time_budget(state: Dict[str, Any], config: Optional[RunnableConfig] = None) -> bool:
+    """요청 마감 시각 전에 수정·검증 단계를 하나 더 마칠 시간이 남았는지 여부 (마감 시각이 없으면 True).
+
+    마감 시각 때문에 LLM 호출을 이미 생략/중단했다면 더 진행하지 않음
+    """
+    if state.get("degraded"):
+        return False
+    remaining = remaining_time(config)
+    return remaining is None or remaining >= DEADLINE_MIN_CYCLE_SECONDS
+
+
+def limit_reason(state: Dict[str, Any], route: str, config: Optional[RunnableConfig] = None) -> Optional[str]:
+    """검증 후 route로 진행하면 시간/반복 한도를 넘는 경우 그 이유, 진행 가능하면 None.
+
+    마감 시각 때문에 LLM 호출을 생략/중단한 Run은 검증을 통과했더라도 degraded로 표시되도록 종료 노드로 보냄
+    """
+    if state.get("degraded"):
+        return "deadline"
+    if route == "end":
+        return None
+    if not within_time_budget(state, config):
+        return "deadline"
+    if not within_llm_budget(state):
+        return "llm_call_limit"
+    if route == "clear_for_regeneration" and (state.get("regeneration_attempts") or 0) >= MAX_REGENERATION_ATTEMPTS:
+        return "regeneration_limit"
+    if route == "fix_grammar" and (state.get("grammar_fix_attempts") or 0) >= MAX_GRAMMAR_FIX_ATTEMPTS:
+        return "grammar_fix_limit"
+    return None
+
+
+def candidate_score(state: Dict[str, Any]) -> List[int]:
+    """검증 결과로 세특 후보 점수 계산 (입력 정보 포함 > 문법 통과 > 문법 문제 수 순으로 비교)."""
+    validation_result = state.get("validation_result") or {}
+    grammar_result = state.get("grammar_result") or {}
+    return [
+        int(bool(validation_result.get("is_valid"))),
+        int(bool(grammar_result.get("is_valid"))),
+        -len(grammar_result.get("issues") or []),
+    ]
+
+
+def pick_best_candidate(state: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """방금 검증한 세특과 지금까지의 최선 후보 중 나은 쪽 반환 (같은 점수면 나중 버전)."""
+    best = state.get("best_candidate")
+    record = state.get("detailed_record")
+    if not record:
+        return best
+    score = candidate_score(state)
+    if best is None or score >= best["score"]:
+        return {"record": record, "score": score}
+    return best
+
+
+def termination_reason(state: Dict[str, Any], config: Optional[RunnableConfig] = None) -> str:
+    """limit_reason으로 종료가 결정된 state의 종료 이유 (입력 누락이면 재생성, 아니면 문법 수정 한도)."""
+    if not within_time_budget(state, config):
+        return "deadline"
+    if not within_llm_budget(state):
+        return "llm_call_limit"
+    if not (state.get("validation_result") or {}).get("is_valid", True):
+        return "regeneration_limit"
+    return "grammar_fix_limit"
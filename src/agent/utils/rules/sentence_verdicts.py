@@ -0,0 +1,56 @@
+"""문장별 문법 판정을 저장해 수정 후 바뀐 문장만 다시 검증하기 위한 유틸리티."""
+from typing import Any, Dict, List, Optional, Tuple
+
+# 문장 원문 → {"is_valid": bool, "issues": [...]} (한 Run 안에서만 유지되는 문장별 문법 판정)
+SentenceVerdicts = Dict[str, Dict[str, Any]]
+
+
+def assign_issues(sentences: List[str], issues: List[Dict[str, Any]]) -> Tuple[Dict[str, List[Dict[str, Any]]], List[Dict[str, Any]]]:
+    """문법 문제를 text가 포함된 문장에 배정.
+
+    Returns:
+        문장별 문제 목록, 어느 한 문장에도 속하지 않는 문제 목록 (여러 문장에 걸치거나 본문 전체에 대한 지적)
+    """
+    per_sentence: Dict[str, List[Dict[str, Any]]] = {sentence: [] for sentence in sentences}
+    unassigned = []
+    for issue in issues:
+        text = (issue.get("text") or "").strip()
+        owners = [sentence for sentence in sentences if text and text in sentence]
+        if len(owners) == 1:
+            per_sentence[owners[0]].append(issue)
+        else:
+            unassigned.append(issue)
+    return per_sentence, unassigned
+
+
+def changed_sentences(sentences: List[str], verdicts: Optional[SentenceVerdicts]) -> List[str]:
+    """이전 버전에서 판정받지 않은 (새로 쓰였거나 수정된) 문장 목록 (순서 유지, 중복 제거)."""
+    verdicts = verdicts or {}
+    return list(dict.fromkeys(sentence for sentence in sentences if sentence not in verdicts))
+
+
+def record_verdicts(verdicts: Optional[SentenceVerdicts], sentences: List[str], issues: List[Dict[str, Any]],
+                    is_valid: bool) -> SentenceVerdicts:
+    """LLM으로 검증한 문장들의 판정을 캐시에 추가 (새 dict 반환).
+
+    문장에 배정되지 않은 문제가 있으면 어느 문장이 문제인지 알 수 없으므로 문제가 배정된 문장만 기록하고,
+    나머지 문장은 전체 판정이 통과이거나 모든 문제가 문장에 배정된 경우에만 통과로 기록합니다.
+    """
+    updated = dict(verdicts or {})
+    per_sentence, unassigned = assign_issues(sentences, issues)
+    trust_clean = is_valid or (bool(issues) and not unassigned)
+    for sentence, sentence_issues in per_sentence.items():
+        if sentence_issues:
+            updated[sentence] = {"is_valid": is_valid, "issues": sentence_issues}
+        elif trust_clean:
+            updated[sentence] = {"is_valid": True, "issues": []}
+    return updated
+
+
+def cached_result(sentences: List[str], verdicts: SentenceVerdicts) -> Dict[str, Any]:
+    """캐시된 문장 판정을 합쳐 GrammarCheck 형식의 결과 생성 (문장이 없으면 통과)."""
+    sentences = list(dict.fromkeys(sentences))
+    return {
+        "is_valid": all(verdicts[sentence]["is_valid"] for sentence in sentences),
+        "issues": [issue for sentence in sentences for issue in verdicts[sentence]["issues"]],
+    }
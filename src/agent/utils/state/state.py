@@ -22,5 +22,23 @@ class StudentState(TypedDict):
     validation_result: Optional[Dict[str, Any]]  # 검증 결과 + 상태 + 재생성 정보 통합
     grammar_result: Optional[Dict[str, Any]]     # 문법 결과 + 상태 + 수정 정보 통합
     
+    # 문장별 LLM 문법 판정 캐시 (문장 원문 → 판정, 문법 수정 후 바뀐 문장만 다시 검증하기 위해 Run 동안 유지)
+    sentence_verdicts: Optional[Dict[str, Dict[str, Any]]]
+    
+    # 누락 정보 보완 결과 (현재 세특에 보완을 이미 시도했는지 여부, 재생성 시 초기화)
+    repair_result: Optional[Dict[str, Any]]
+    
     # 최종 승인 (1개)
-    final_approval: Optional[bool]
\ No newline at end of file
+    final_approval: Optional[bool]
+    
+    # 반복 횟수 (선언하지 않은 키는 슈퍼스텝 사이에 유지되지 않으므로 반드시 선언)
+    regeneration_attempts: int
+    grammar_fix_attempts: int
+    llm_call_count: int  # Run 전체 LLM 호출 수 (병렬 검증 노드 호출은 합류 노드에서 합산)
+    
+    # 지금까지 검증한 세특 중 가장 나은 후보 {"record", "score"}와 한도 초과로 종료한 이유
+    best_candidate: Optional[Dict[str, Any]]
+    termination_reason: Optional[Literal["deadline", "llm_call_limit", "regeneration_limit", "grammar_fix_limit"]]
+    
+    # 요청 마감 시각 때문에 LLM 호출을 생략하거나 중단한 적이 있는지 여부
+    degraded: Optional[bool]
\ No newline at end of file
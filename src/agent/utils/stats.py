@@ -0,0 +1,15 @@
+"""에이전트 구성요소별 통계 제공 함수 등록/수집."""
+from typing import Any, Callable, Dict
+
+# 이름 → 통계 반환 함수 (모델 레지스트리, 검증기 등 에이전트 내부 구성요소)
+_stats_providers: Dict[str, Callable[[], Dict[str, Any]]] = {}
+
+
+def register_stats(name: str, provider: Callable[[], Dict[str, Any]]) -> None:
+    """통계 제공 함수 등록."""
+    _stats_providers[name] = provider
+
+
+def collect_stats() -> Dict[str, Dict[str, Any]]:
+    """등록된 모든 구성요소의 통계 수집."""
+    return {name: provider() for name, provider in _stats_providers.items()}
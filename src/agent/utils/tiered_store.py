@@ -0,0 +1,148 @@
+"""메모리 LRU를 1차, SQLite를 2차로 쓰는 키-값 저장소 (노드 결과 메모, 응답 캐시에서 공용)."""
+import asyncio
+import copy
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+
+class TieredStore:
+    """메모리 LRU + 선택적 SQLite 2단 저장소.
+
+    디스크 적중 항목은 메모리로 올리고, 용량을 넘으면 오래된 항목부터 내보냅니다.
+    ttl_seconds가 주어지면 만료된 항목은 조회하지 않고 정리합니다.
+    적중/미적중 집계는 호출부 몫이고, 저장소는 축출/만료 횟수만 셉니다.
+    """
+
+    def __init__(self, table: str, max_entries: int, db_path: str = "", db_max_entries: int = 10000,
+                 ttl_seconds: Optional[float] = None):
+        """저장소 초기화.
+
+        Args:
+            table: SQLite 테이블 이름
+            max_entries: 메모리 LRU 최대 항목 수
+            db_path: SQLite 파일 경로 (빈 값이면 디스크 저장소 미사용)
+            db_max_entries: SQLite 최대 항목 수 (초과 시 오래된 항목부터 삭제)
+            ttl_seconds: 항목 유효 시간(초, None이면 만료 없음)
+        """
+        self.table = table
+        self.max_entries = max_entries
+        self.db_max_entries = db_max_entries
+        self.ttl_seconds = ttl_seconds
+        self._memory: OrderedDict[str, Tuple[float, Dict[str, Any]]] = OrderedDict()
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()
+        self.counters = {"memory_evictions": 0, "disk_evictions": 0, "expired": 0}
+        if db_path:
+            self._open_db(db_path)
+
+    def _open_db(self, db_path: str) -> None:
+        """SQLite 파일을 열고 테이블/인덱스 생성."""
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(db_path, check_same_thread=False)
+        self._db.execute(
+            f"CREATE TABLE IF NOT EXISTS {self.table} ("
+            " key TEXT PRIMARY KEY, value TEXT NOT NULL, created_at REAL NOT NULL)"
+        )
+        self._db.execute(f"CREATE INDEX IF NOT EXISTS idx_{self.table}_created ON {self.table}(created_at)")
+        self._db.commit()
+
+    @property
+    def disk_enabled(self) -> bool:
+        """SQLite 2차 저장소 사용 여부."""
+        return self._db is not None
+
+    def __len__(self) -> int:
+        """메모리 항목 수."""
+        return len(self._memory)
+
+    def _expired(self, created_at: float) -> bool:
+        """TTL이 설정되어 있고 항목이 만료되었으면 True."""
+        return self.ttl_seconds is not None and time.time() - created_at > self.ttl_seconds
+
+    async def get(self, key: str) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """항목 조회 (메모리 → 디스크 순서).
+
+        Returns:
+            (적중 계층 "memory"/"disk", 값 사본), 없으면 (None, None)
+        """
+        entry = self._memory.get(key)
+        if entry is not None:
+            created_at, value = entry
+            if not self._expired(created_at):
+                self._memory.move_to_end(key)
+                return "memory", copy.deepcopy(value)
+            del self._memory[key]
+            self.counters["expired"] += 1
+
+        if self._db is not None:
+            row = await asyncio.to_thread(self._db_get, key)
+            if row is not None:
+                created_at, value = row
+                self._put_memory(key, created_at, value)
+                return "disk", value
+
+        return None, None
+
+    async def set(self, key: str, value: Dict[str, Any]) -> None:
+        """항목 저장 (디스크 저장 실패 시 sqlite3.Error 전달, 메모리에는 이미 저장됨)."""
+        created_at = time.time()
+        self._put_memory(key, created_at, value)
+        if self._db is not None:
+            await asyncio.to_thread(self._db_set, key, created_at, value)
+
+    def _put_memory(self, key: str, created_at: float, value: Dict[str, Any]) -> None:
+        """메모리에 사본 저장 후 용량 초과분을 오래된 순서로 축출."""
+        self._memory[key] = (created_at, copy.deepcopy(value))
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self.counters["memory_evictions"] += 1
+
+    def _db_get(self, key: str) -> Optional[Tuple[float, Dict[str, Any]]]:
+        """디스크 항목 조회 (만료 항목은 삭제하고 None)."""
+        with self._db_lock:
+            row = self._db.execute(f"SELECT value, created_at FROM {self.table} WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            value, created_at = row
+            if self._expired(created_at):
+                self._db.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+                self._db.commit()
+                self.counters["expired"] += 1
+                return None
+            return created_at, json.loads(value)
+
+    def _db_set(self, key: str, created_at: float, value: Dict[str, Any]) -> None:
+        """디스크 항목 저장 후 만료/용량 초과 항목 정리."""
+        with self._db_lock:
+            self._db.execute(
+                f"INSERT OR REPLACE INTO {self.table} (key, value, created_at) VALUES (?, ?, ?)",
+                (key, json.dumps(value, ensure_ascii=False, default=str), created_at),
+            )
+            # TTL 만료 항목 정리 후 용량 초과분은 오래된 순서로 삭제
+            if self.ttl_seconds is not None:
+                self.counters["expired"] += self._db.execute(
+                    f"DELETE FROM {self.table} WHERE created_at < ?", (time.time() - self.ttl_seconds,)
+                ).rowcount
+            self.counters["disk_evictions"] += self._db.execute(
+                f"DELETE FROM {self.table} WHERE key IN ("
+                f" SELECT key FROM {self.table} ORDER BY created_at DESC LIMIT -1 OFFSET ?)",
+                (self.db_max_entries,),
+            ).rowcount
+            self._db.commit()
+
+    def clear_memory(self) -> None:
+        """메모리 항목 초기화 (디스크 항목은 유지)."""
+        self._memory.clear()
+
+    def close(self) -> None:
+        """SQLite 연결 종료."""
+        if self._db is not None:
+            with self._db_lock:
+                self._db.close()
+            self._db = None
@@ -0,0 +1,23 @@
+"""LangGraph Server에 추가하는 HTTP 라우트 (langgraph.json의 http.app).
+
+에이전트 구성요소 통계는 그래프가 실행되는 LangGraph Server 프로세스에 쌓이므로
+프록시가 이 라우트로 조회해 /metrics에 함께 보여줍니다.
+"""
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+# 그래프 모듈을 import해야 노드/모델 레지스트리 등의 통계 제공 함수가 등록됨
+import agent.agent  # noqa: F401
+from agent.utils.stats import collect_stats
+
+AGENT_STATS_PATH = "/agent/stats"
+
+
+async def agent_stats(request: Request) -> JSONResponse:
+    """등록된 에이전트 구성요소 통계 반환."""
+    return JSONResponse(collect_stats())
+
+
+app = Starlette(routes=[Route(AGENT_STATS_PATH, agent_stats, methods=["GET"])])
@@ -1,8 +1,11 @@
 """FastAPI 애플리케이션 설정 모듈
 """
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from src.api.config.http_client_config import HttpClientPool
 from src.config.env_config import EnvConfig
 from src.utils.logger import setup_logger
 from src.api.exception.global_exception_handler import register_exception_handlers
@@ -26,6 +29,9 @@ class AppConfig:
         self.langgraph_server_url = self.config["langgraph_server_url"]
         self.assistant_id = self.config["assistant_id"]
         
+        # 공유 HTTP 커넥션 풀 (lifespan에서 생성/종료)
+        self.http_client_pool = HttpClientPool(self.config)
+        
         # FastAPI 앱 인스턴스 생성
         self.app = self._create_app()
     
@@ -34,7 +40,8 @@ class AppConfig:
         app = FastAPI(
             title="세부능력 특기사항 생성 API",
             description="LangGraph Server를 활용한 세특 생성 서비스",
-            version="1.0.0"
+            version="1.0.0",
+            lifespan=self._lifespan
         )
         
         # CORS 미들웨어 설정
@@ -54,6 +61,23 @@ class AppConfig:
         
         return app
     
+    @asynccontextmanager
+    async def _lifespan(self, app: FastAPI):
+        """앱 수명 동안 공유 HTTP 클라이언트를 생성하고 서비스에 주입, 배치 작업 워커 실행."""
+        # 순환 import 방지를 위해 함수 내부에서 import
+        from src.api.services.batch_job_service import batch_job_service
+        from src.api.services.langgraph_service import langgraph_service
+        
+        client = self.http_client_pool.start()
+        langgraph_service.bind_client(client)
+        await batch_job_service.start()
+        try:
+            yield
+        finally:
+            await batch_job_service.stop()
+            langgraph_service.bind_client(None)
+            await self.http_client_pool.close()
+    
     def get_app(self) -> FastAPI:
         """FastAPI 앱 인스턴스 반환"""
         return self.app
@@ -77,4 +101,5 @@ app_config = AppConfig()
 app = app_config.get_app()
 logger = app_config.get_logger()
 LANGGRAPH_SERVER_URL = app_config.langgraph_server_url
-ASSISTANT_ID = app_config.assistant_id
\ No newline at end of file
+ASSISTANT_ID = app_config.assistant_id
+http_client_pool = app_config.http_client_pool
\ No newline at end of file
@@ -0,0 +1,116 @@
+"""LangGraph Server 통신용 공유 HTTP 클라이언트 설정 모듈."""
+import importlib.util
+from typing import Any, Dict, Optional
+
+import httpx
+
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class _InstrumentedTransport(httpx.AsyncBaseTransport):
+    """요청 수와 동시 요청 수를 집계하는 transport 래퍼."""
+
+    def __init__(self, transport: httpx.AsyncHTTPTransport):
+        self._transport = transport
+        self.total_requests = 0
+        self.failed_requests = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.total_requests += 1
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            return await self._transport.handle_async_request(request)
+        except Exception:
+            self.failed_requests += 1
+            raise
+        finally:
+            self.in_flight -= 1
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+    def pool_stats(self) -> Dict[str, int]:
+        """커넥션 풀 상태 반환 (전체/사용 중/유휴 연결 수)."""
+        pool = getattr(self._transport, "_pool", None)
+        connections = list(getattr(pool, "connections", []))
+        idle = sum(1 for conn in connections if conn.is_idle())
+        return {
+            "connections": len(connections),
+            "active": len(connections) - idle,
+            "idle": idle,
+        }
+
+
+class HttpClientPool:
+    """keep-alive 커넥션 풀을 공유하는 httpx.AsyncClient 관리 클래스.
+
+    FastAPI lifespan에서 start/close 되며, 생성된 클라이언트는
+    LangGraphService 등에 주입되어 모든 요청이 같은 풀을 재사용합니다.
+    """
+
+    def __init__(self, config: Dict[str, Any]):
+        """환경 설정에서 커넥션 풀 한도와 HTTP/2 사용 여부를 읽어 초기화 (클라이언트는 start에서 생성)."""
+        self.max_connections = config["http_max_connections"]
+        self.max_keepalive_connections = config["http_max_keepalive_connections"]
+        self.keepalive_expiry = config["http_keepalive_expiry"]
+        self.http2 = config["http2_enabled"]
+        self._transport: Optional[_InstrumentedTransport] = None
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def start(self) -> httpx.AsyncClient:
+        """공유 클라이언트 생성."""
+        if self._client is not None:
+            return self._client
+
+        if self.http2 and importlib.util.find_spec("h2") is None:
+            # HTTP/2는 h2 패키지가 있어야 사용 가능 (pip install httpx[http2])
+            logger.warning("h2 패키지가 없어 HTTP/1.1로 동작합니다.")
+            self.http2 = False
+
+        limits = httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+        self._transport = _InstrumentedTransport(
+            httpx.AsyncHTTPTransport(limits=limits, http2=self.http2)
+        )
+        self._client = httpx.AsyncClient(transport=self._transport, timeout=30.0)
+        logger.info(
+            f"공유 HTTP 클라이언트 생성 - max_connections: {self.max_connections}, "
+            f"keepalive: {self.max_keepalive_connections}, http2: {self.http2}"
+        )
+        return self._client
+
+    async def close(self) -> None:
+        """공유 클라이언트 종료."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._transport = None
+
+    @property
+    def client(self) -> Optional[httpx.AsyncClient]:
+        """공유 HTTP 클라이언트 (start 전이나 close 후에는 None)."""
+        return self._client
+
+    def stats(self) -> Dict[str, Any]:
+        """커넥션 풀 사용 현황 반환 (풀 크기 산정용)."""
+        if self._transport is None:
+            return {"started": False}
+        return {
+            "started": True,
+            "max_connections": self.max_connections,
+            "max_keepalive_connections": self.max_keepalive_connections,
+            "http2": self.http2,
+            "total_requests": self._transport.total_requests,
+            "failed_requests": self._transport.failed_requests,
+            "in_flight": self._transport.in_flight,
+            "peak_in_flight": self._transport.peak_in_flight,
+            **self._transport.pool_stats(),
+        }
@@ -1,6 +1,6 @@
 """API 요청 DTO
 """
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from pydantic import BaseModel
 
@@ -27,4 +27,13 @@ class TeacherInputRequest(BaseModel):
             "midterm_score": self.midterm_score,
             "final_score": self.final_score,
             "additional_notes": self.additional_notes
-        }
\ No newline at end of file
+        }
+    
+    def to_graph_input(self) -> Dict[str, Any]:
+        """워크플로우 입력 state로 변환."""
+        return {
+            "teacher_input": self.to_dict(),
+            "generation_status": "pending",
+            "semester": self.semester,
+            "academic_year": self.academic_year
+        }
@@ -1,6 +1,7 @@
 """API 응답 DTO
 """
 from datetime import datetime
+from typing import List, Optional
 
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel
@@ -16,6 +17,8 @@ class DetailedRecordResponse(BaseModel):
     generated_at: datetime
     version: int
     status: str = "success"
+    best_effort: bool = False  # 반복 한도에 걸려 검증을 통과하지 못한 채 반환된 세특
+    degraded: bool = False  # 마감 시각에 걸려 일부 단계를 생략하거나 대체 결과로 반환된 세특
     
     @classmethod
     def from_dict(cls, data: DetailedRecord):
@@ -33,4 +36,33 @@ class ErrorResponse(BaseModel):
         return JSONResponse(
             status_code=status_code,
             content=self.model_dump()
-        )
\ No newline at end of file
+        )
+
+class BatchJobResponse(BaseModel):
+    """배치 작업 진행 현황 응답 모델."""
+    job_id: str
+    status: str  # "pending", "running", "completed"
+    total: int
+    pending: int
+    running: int
+    succeeded: int
+    failed: int
+    created_at: datetime
+    updated_at: datetime
+
+
+class BatchJobItemResponse(BaseModel):
+    """배치 작업의 학생별 결과 모델."""
+    index: int
+    student_id: int
+    status: str  # "pending", "running", "success", "failed"
+    result: Optional[DetailedRecordResponse] = None
+    error: Optional[str] = None
+
+
+class BatchJobResultsResponse(BaseModel):
+    """배치 작업 결과 페이지 응답 모델."""
+    job: BatchJobResponse
+    offset: int
+    limit: int
+    items: List[BatchJobItemResponse]
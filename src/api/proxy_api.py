@@ -1,13 +1,32 @@
 """LangGraph Server와 통신하는 프록시 API.
 """
 from datetime import datetime
-from typing import List
-import httpx
+from typing import List, Optional
 
-from src.api.config.app_config import LANGGRAPH_SERVER_URL, app
+from fastapi import Header, HTTPException, Query
+from fastapi.responses import StreamingResponse
+
+from src.api.config.app_config import LANGGRAPH_SERVER_URL, app, http_client_pool, logger
+from src.api.services.batch_job_service import batch_job_service
 from src.api.services.generate_service import generate_service
+from src.api.services.langgraph_service import langgraph_service
 from src.api.dto.request_dto import TeacherInputRequest
-from src.api.dto.response_dto import DetailedRecordResponse, ErrorResponse
+from src.api.utils.stream_util import accepts_gzip, gzip_stream, ndjson_line, sse_event
+from src.api.dto.response_dto import (
+    BatchJobResponse,
+    BatchJobResultsResponse,
+    DetailedRecordResponse,
+    ErrorResponse,
+)
+
+
+def _use_cache(cache_control: Optional[str]) -> bool:
+    """`Cache-Control: no-cache` 헤더가 있으면 캐시를 무시하고 새로 생성."""
+    return not (cache_control and "no-cache" in cache_control.lower())
+
+
+# `X-Request-Timeout: <초>` 헤더로 요청별 처리 시간 예산 지정 (없으면 REQUEST_TIMEOUT)
+RequestTimeout = Header(default=None, alias="X-Request-Timeout", gt=0)
 
 
 @app.post(
@@ -20,8 +39,51 @@ from src.api.dto.response_dto import DetailedRecordResponse, ErrorResponse
     summary="세부능력 특기사항 생성",
     tags=["세특 생성"]
 )
-async def generate_detailed_record(request: TeacherInputRequest):
-    return await generate_service.generate_single_student(request)
+async def generate_detailed_record(
+    request: TeacherInputRequest,
+    cache_control: Optional[str] = Header(default=None),
+    request_timeout: Optional[float] = RequestTimeout
+):
+    return await generate_service.generate_single_student(
+        request, use_cache=_use_cache(cache_control), timeout=request_timeout
+    )
+
+
+# 프록시(nginx 등)가 이벤트를 모아서 보내지 않도록 버퍼링 비활성화
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+
+@app.post(
+    "/api/v1/generate/stream",
+    responses={200: {"content": {"text/event-stream": {}}}},
+    summary="세부능력 특기사항 생성 (SSE 스트리밍)",
+    tags=["세특 생성"]
+)
+async def stream_detailed_record(
+    request: TeacherInputRequest,
+    cache_control: Optional[str] = Header(default=None),
+    request_timeout: Optional[float] = RequestTimeout
+):
+    """생성 과정을 Server-Sent Events로 실시간 전달합니다.
+    
+    - `token`: 생성 중인 세특 텍스트 조각
+    - `node`: 노드 완료 (입력 검증 결과, 문법 문제 수, 수정 버전 등)
+    - `result`: 최종 세특 (`cached`: 캐시 사용 여부)
+    - `error`: 실패 사유 (스트림 종료)
+    """
+    async def events():
+        try:
+            async for event, data in generate_service.stream_single_student(
+                request, use_cache=_use_cache(cache_control), timeout=request_timeout
+            ):
+                yield sse_event(event, data)
+        except HTTPException as e:
+            yield sse_event("error", {"status_code": e.status_code, "message": e.detail})
+        except Exception as e:
+            logger.error(f"스트리밍 생성 실패: {type(e).__name__}: {str(e)}")
+            yield sse_event("error", {"status_code": 500, "message": f"서버 오류: {str(e)}"})
+    
+    return StreamingResponse(events(), media_type="text/event-stream", headers=SSE_HEADERS)
 
 
 @app.post(
@@ -34,24 +96,138 @@ async def generate_detailed_record(request: TeacherInputRequest):
     summary="세부능력 특기사항 배치 생성",
     tags=["세특 생성"]
 )
-async def generate_batch_detailed_records(requests: List[TeacherInputRequest]):
+async def generate_batch_detailed_records(
+    requests: List[TeacherInputRequest],
+    cache_control: Optional[str] = Header(default=None),
+    request_timeout: Optional[float] = RequestTimeout
+):
     """여러 학생의 세부능력 특기사항을 동시에 생성합니다.
     
     병렬 처리로 빠른 속도를 보장합니다.
     """
-    return await generate_service.generate_batch_students(requests)
+    return await generate_service.generate_batch_students(
+        requests, use_cache=_use_cache(cache_control), timeout=request_timeout
+    )
+
+
+@app.post(
+    "/api/v1/generate-batch/stream",
+    responses={
+        200: {"content": {"application/x-ndjson": {}}},
+        400: {"model": ErrorResponse}
+    },
+    summary="세부능력 특기사항 배치 생성 (NDJSON 스트리밍)",
+    tags=["세특 생성"]
+)
+async def stream_batch_detailed_records(
+    requests: List[TeacherInputRequest],
+    cache_control: Optional[str] = Header(default=None),
+    request_timeout: Optional[float] = RequestTimeout,
+    accept_encoding: Optional[str] = Header(default=None)
+):
+    """학생별 결과를 완료되는 순서대로 한 줄씩(NDJSON) 보냅니다.
+    
+    각 줄은 `index`(요청 순서), `student_id`, `status`와 함께 성공 시 `result`, 실패 시 `error`를 포함합니다.
+    `Accept-Encoding: gzip` 요청이면 줄 단위로 flush되는 gzip으로 압축합니다.
+    """
+    async def lines():
+        async for item in generate_service.stream_batch_students(
+            requests, use_cache=_use_cache(cache_control), timeout=request_timeout
+        ):
+            yield ndjson_line(item)
+    
+    # 같은 URL이 Accept-Encoding에 따라 압축 여부가 달라지므로 중간 캐시가 구분하도록 Vary 명시
+    headers = {"Vary": "Accept-Encoding"}
+    if accepts_gzip(accept_encoding):
+        return StreamingResponse(
+            gzip_stream(lines()),
+            media_type="application/x-ndjson",
+            headers={**headers, "Content-Encoding": "gzip"}
+        )
+    return StreamingResponse(lines(), media_type="application/x-ndjson", headers=headers)
+
+
+@app.post(
+    "/api/v1/jobs",
+    response_model=BatchJobResponse,
+    status_code=202,
+    responses={400: {"model": ErrorResponse}},
+    summary="세부능력 특기사항 배치 작업 제출",
+    tags=["배치 작업"]
+)
+async def submit_batch_job(requests: List[TeacherInputRequest]):
+    """학급 단위 생성을 백그라운드 작업으로 제출하고 job_id를 바로 반환합니다.
+    
+    진행 현황은 `/api/v1/jobs/{job_id}` 폴링 또는 `/api/v1/jobs/{job_id}/events` 구독으로,
+    결과는 `/api/v1/jobs/{job_id}/results`에서 페이지 단위로 조회합니다.
+    """
+    return await batch_job_service.submit(requests)
+
+
+@app.get(
+    "/api/v1/jobs/{job_id}",
+    response_model=BatchJobResponse,
+    responses={404: {"model": ErrorResponse}},
+    summary="배치 작업 진행 현황 조회",
+    tags=["배치 작업"]
+)
+async def get_batch_job(job_id: str):
+    """배치 작업의 상태와 학생별 처리 현황을 반환합니다."""
+    return await batch_job_service.get_job(job_id)
+
+
+@app.get(
+    "/api/v1/jobs/{job_id}/results",
+    response_model=BatchJobResultsResponse,
+    responses={404: {"model": ErrorResponse}},
+    summary="배치 작업 결과 조회",
+    tags=["배치 작업"]
+)
+async def get_batch_job_results(
+    job_id: str,
+    offset: int = Query(default=0, ge=0),
+    limit: int = Query(default=50, ge=1, le=500)
+):
+    """학생별 결과를 입력 순서대로 offset부터 limit명씩 반환합니다."""
+    return await batch_job_service.get_results(job_id, offset, limit)
+
+
+@app.get(
+    "/api/v1/jobs/{job_id}/events",
+    responses={404: {"model": ErrorResponse}},
+    summary="배치 작업 진행 현황 구독 (SSE)",
+    tags=["배치 작업"]
+)
+async def stream_batch_job_events(job_id: str):
+    """진행 현황이 바뀔 때마다 `progress` 이벤트를 보내고, 작업이 끝나면 `completed` 이벤트 후 종료합니다."""
+    # 없는 작업이면 스트림 시작 전에 404 반환
+    await batch_job_service.get_job(job_id)
+    
+    async def events():
+        while True:
+            job = await batch_job_service.get_job(job_id)
+            event = "completed" if job.status == "completed" else "progress"
+            yield sse_event(event, job.model_dump(mode="json"))
+            if job.status == "completed":
+                return
+            # 변화가 없어도 주기적으로 현황을 보내 연결 유지
+            await batch_job_service.wait_for_update(job_id, timeout=15.0)
+    
+    return StreamingResponse(events(), media_type="text/event-stream", headers=SSE_HEADERS)
 
 
 @app.get("/health", tags=["시스템"])
 async def health_check():
     """헬스 체크 엔드포인트"""
-    # LangGraph Server 상태도 체크
-    try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            response = await client.get(f"{LANGGRAPH_SERVER_URL}/health")
+    # LangGraph Server 상태도 체크 (in-process 백엔드는 서버를 사용하지 않음)
+    if generate_service.backend is not langgraph_service:
+        langgraph_status = "in_process"
+    else:
+        try:
+            response = await langgraph_service.client.get(f"{LANGGRAPH_SERVER_URL}/health", timeout=5.0)
             langgraph_status = "healthy" if response.status_code == 200 else "unhealthy"
-    except Exception:
-        langgraph_status = "unreachable"
+        except Exception:
+            langgraph_status = "unreachable"
     
     return {
         "status": "healthy",
@@ -60,6 +236,20 @@ async def health_check():
     }
 
 
+@app.get("/metrics", tags=["시스템"])
+async def metrics():
+    """운영 지표 엔드포인트 (대시보드/용량 산정용)."""
+    return {
+        "http_pool": http_client_pool.stats(),
+        "backend": generate_service.backend.stats(),
+        # 에이전트 통계는 그래프를 실행하는 프로세스에 있음 (remote 백엔드는 LangGraph Server에서 조회)
+        "agent": await generate_service.backend.agent_stats(),
+        **generate_service.stats(),
+        "batch_jobs": batch_job_service.stats(),
+        "timestamp": datetime.now().isoformat()
+    }
+
+
 @app.get("/", tags=["시스템"])
 async def root():
     """API 정보"""
@@ -67,7 +257,8 @@ async def root():
         "name": "세부능력 특기사항 생성 API",
         "version": "1.0.0",
         "docs": "/docs",
-        "health": "/health"
+        "health": "/health",
+        "metrics": "/metrics"
     }
 
 
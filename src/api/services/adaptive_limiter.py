@@ -0,0 +1,166 @@
+"""업스트림 부하에 맞춰 동시 실행 수를 조절하는 AIMD 동시성 제한 모듈."""
+import asyncio
+import math
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Deque, Dict, Optional
+
+import httpx
+from fastapi import HTTPException
+
+
+def is_overload_signal(error: BaseException) -> bool:
+    """업스트림 과부하로 볼 수 있는 예외인지 여부 (요청 자체 오류인 4xx는 제외)."""
+    if isinstance(error, HTTPException):
+        return error.status_code >= 500
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code >= 500 or error.response.status_code == 429
+    return isinstance(error, (httpx.TimeoutException, httpx.TransportError, asyncio.TimeoutError))
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD 동시성 제한.
+
+    - 실행이 정상 지연 시간 안에 끝나면 한도를 조금씩(1/limit) 늘림 → 한 바퀴에 +1
+    - 타임아웃/5xx가 나거나 지연 시간이 기준의 latency_tolerance배를 넘으면 한도를 backoff배로 줄임
+    - 기준 지연 시간은 최근 성공한 Run 지연 시간의 baseline_percentile 백분위
+      (Run마다 수정 단계 수가 달라 지연 시간이 몇 배씩 차이 나므로 최솟값이 아닌 분포의 위쪽을 기준으로 사용)
+    - 한도를 넘는 요청은 max_queue 크기의 FIFO 대기열에서 기다리고, 대기열이 차면 asyncio.QueueFull
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 10,
+        min_limit: int = 1,
+        max_limit: int = 100,
+        max_queue: int = 1000,
+        latency_tolerance: float = 2.0,
+        backoff: float = 0.7,
+        baseline_percentile: float = 90,
+        latency_window: int = 100,
+        min_samples: int = 10,
+    ):
+        """제한기 초기화.
+
+        Args:
+            initial_limit: 시작 동시 실행 수
+            min_limit: 최소 동시 실행 수
+            max_limit: 최대 동시 실행 수
+            max_queue: 한도 초과 시 대기할 수 있는 요청 수
+            latency_tolerance: 기준 지연 시간 대비 과부하로 판단할 배수
+            backoff: 과부하 시 한도에 곱할 값
+            baseline_percentile: 기준 지연 시간으로 쓸 최근 지연 시간 백분위
+            latency_window: 기준 지연 시간 계산에 쓸 최근 표본 수
+            min_samples: 지연 시간으로 과부하를 판단하기 시작할 최소 표본 수 (그 전에는 오류만 반영)
+        """
+        self.limit = float(initial_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.max_queue = max_queue
+        self.latency_tolerance = latency_tolerance
+        self.backoff = backoff
+        self.baseline_percentile = baseline_percentile
+        self.min_samples = min_samples
+        self.baseline_latency: Optional[float] = None
+        self._latencies: Deque[float] = deque(maxlen=latency_window)
+        self._in_flight = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._last_decrease = 0.0
+        self._stats = {"increases": 0, "decreases": 0, "rejected": 0, "max_queue_depth": 0}
+
+    def _has_capacity(self) -> bool:
+        return self._in_flight < int(self.limit)
+
+    def _wake_waiters(self) -> None:
+        # 늘어난 한도/반환된 슬롯만큼 대기열 앞에서부터 실행 허가
+        while self._waiters and self._has_capacity():
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+            self._in_flight += 1
+            waiter.set_result(None)
+
+    async def acquire(self) -> None:
+        """실행 슬롯 획득 (한도 초과 시 대기열에서 순서대로 대기)."""
+        if self._has_capacity() and not self._waiters:
+            self._in_flight += 1
+            return
+        if len(self._waiters) >= self.max_queue:
+            self._stats["rejected"] += 1
+            raise asyncio.QueueFull()
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self._stats["max_queue_depth"] = max(self._stats["max_queue_depth"], len(self._waiters))
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # 슬롯을 받은 직후 취소된 경우 반환
+                self.release()
+            elif waiter in self._waiters:
+                self._waiters.remove(waiter)
+            raise
+
+    def release(self) -> None:
+        """실행 슬롯 반환."""
+        self._in_flight -= 1
+        self._wake_waiters()
+
+    def _update_baseline(self, latency: float) -> None:
+        """성공한 실행의 지연 시간을 표본에 추가하고 기준 지연 시간(백분위) 갱신."""
+        self._latencies.append(latency)
+        if len(self._latencies) < max(1, self.min_samples):
+            return
+        ordered = sorted(self._latencies)
+        index = min(len(ordered) - 1, math.ceil(len(ordered) * self.baseline_percentile / 100) - 1)
+        self.baseline_latency = ordered[max(0, index)]
+
+    def on_result(self, latency: float, overloaded: bool) -> None:
+        """실행 결과로 한도 조정 (오류는 바로 과부하, 지연 시간은 표본이 충분할 때만 기준과 비교)."""
+        now = time.monotonic()
+        slow = self.baseline_latency is not None and latency > self.baseline_latency * self.latency_tolerance
+        if not overloaded:
+            self._update_baseline(latency)
+
+        if overloaded or slow:
+            # 같은 과부하 구간에서 연속으로 줄이지 않도록 기준 지연 시간 동안은 한 번만 감소
+            if now - self._last_decrease >= (self.baseline_latency or 0.0):
+                self.limit = max(float(self.min_limit), self.limit * self.backoff)
+                self._last_decrease = now
+                self._stats["decreases"] += 1
+        elif self.limit < self.max_limit:
+            self.limit = min(float(self.max_limit), self.limit + 1.0 / self.limit)
+            self._stats["increases"] += 1
+            self._wake_waiters()
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """슬롯을 점유한 채 실행하고, 지연 시간과 오류로 한도를 조정."""
+        await self.acquire()
+        started = time.monotonic()
+        try:
+            yield
+        except asyncio.CancelledError:
+            # 클라이언트 취소는 지연 시간 표본으로 쓰지 않음
+            raise
+        except Exception as e:
+            # 4xx 등 요청 자체 오류는 업스트림 부하와 무관하므로 한도 조정에 반영하지 않음
+            if is_overload_signal(e):
+                self.on_result(time.monotonic() - started, overloaded=True)
+            raise
+        else:
+            self.on_result(time.monotonic() - started, overloaded=False)
+        finally:
+            self.release()
+
+    def stats(self) -> Dict[str, Any]:
+        """현재 한도와 대기열 상태 반환."""
+        return {
+            **self._stats,
+            "limit": int(self.limit),
+            "in_flight": self._in_flight,
+            "queue_depth": len(self._waiters),
+            "baseline_latency": round(self.baseline_latency, 3) if self.baseline_latency is not None else None,
+        }
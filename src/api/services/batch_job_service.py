@@ -0,0 +1,170 @@
+"""학급 단위 세특 생성을 백그라운드 작업으로 처리하는 서비스 모듈."""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from fastapi import HTTPException
+
+from src.api.config.app_config import app_config, logger
+from src.api.dto.request_dto import TeacherInputRequest
+from src.api.dto.response_dto import (
+    BatchJobItemResponse,
+    BatchJobResponse,
+    BatchJobResultsResponse,
+)
+from src.api.services.batch_job_store import BatchJobStore
+
+GenerateFn = Callable[[TeacherInputRequest], Awaitable[Dict[str, Any]]]
+
+
+class BatchJobService:
+    """배치 작업 서비스.
+
+    제출된 학생들을 SQLite에 저장한 뒤 고정 크기 워커 풀이 한 명씩 처리하며,
+    프록시가 재시작되면 끝나지 않은 학생만 이어서 처리함
+    """
+
+    def __init__(self, db_path: str, workers: int = 10, generate: Optional[GenerateFn] = None):
+        """서비스 초기화.
+
+        Args:
+            db_path: 작업 상태를 저장할 SQLite 파일 경로
+            workers: 동시에 처리할 학생 수 (워커 수)
+            generate: 학생 1명 생성 함수 (기본값: generate_service.generate_record)
+        """
+        self.db_path = db_path
+        self.workers = workers
+        self.logger = logger
+        self._generate = generate
+        self.store: Optional[BatchJobStore] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._updates: Dict[str, asyncio.Event] = {}
+        self._stats = {"processed": 0, "failed": 0, "recovered": 0}
+
+    async def start(self) -> None:
+        """저장소를 열고 끝나지 않은 항목을 다시 대기열에 넣은 뒤 워커 시작 (lifespan 시작 시 호출)."""
+        if self._generate is None:
+            # 순환 import 방지를 위해 함수 내부에서 import
+            from src.api.services.generate_service import generate_service
+            self._generate = generate_service.generate_record
+
+        self.store = await asyncio.to_thread(BatchJobStore, self.db_path)
+        self._queue = asyncio.Queue()
+        unfinished = await asyncio.to_thread(self.store.recover_unfinished)
+        for item in unfinished:
+            self._queue.put_nowait(item)
+        self._stats["recovered"] += len(unfinished)
+        if unfinished:
+            self.logger.info(f"미완료 배치 항목 {len(unfinished)}건 이어서 처리")
+
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+    async def stop(self) -> None:
+        """워커 중지 및 저장소 종료 (처리 중이던 항목은 다음 시작 시 다시 처리)."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        if self.store is not None:
+            self.store.close()
+            self.store = None
+
+    def _require_store(self) -> BatchJobStore:
+        if self.store is None:
+            raise RuntimeError("배치 작업 저장소가 초기화되지 않았습니다. (앱 lifespan 밖에서 호출됨)")
+        return self.store
+
+    async def submit(self, requests: List[TeacherInputRequest]) -> BatchJobResponse:
+        """배치 작업 생성 후 진행 현황 반환 (생성은 백그라운드에서 진행)."""
+        if not requests:
+            raise HTTPException(status_code=400, detail="생성할 학생이 없습니다")
+        store = self._require_store()
+        job_id = await asyncio.to_thread(store.create_job, [request.model_dump() for request in requests])
+        for idx in range(len(requests)):
+            self._queue.put_nowait((job_id, idx))
+        self.logger.info(f"배치 작업 생성: {job_id} ({len(requests)}명)")
+        return await self.get_job(job_id)
+
+    async def get_job(self, job_id: str) -> BatchJobResponse:
+        """작업 진행 현황 조회."""
+        job = await asyncio.to_thread(self._require_store().get_job, job_id)
+        if job is None:
+            raise HTTPException(status_code=404, detail=f"배치 작업을 찾을 수 없습니다: {job_id}")
+        if job["pending"] + job["running"] == 0:
+            status = "completed"
+        elif job["pending"] == job["total"]:
+            status = "pending"
+        else:
+            status = "running"
+        return BatchJobResponse(status=status, **job)
+
+    async def get_results(self, job_id: str, offset: int = 0, limit: int = 50) -> BatchJobResultsResponse:
+        """작업 결과를 입력 순서대로 페이지 단위 조회."""
+        job = await self.get_job(job_id)
+        items = await asyncio.to_thread(self._require_store().get_items, job_id, offset, limit)
+        return BatchJobResultsResponse(
+            job=job,
+            offset=offset,
+            limit=limit,
+            items=[BatchJobItemResponse(**item) for item in items]
+        )
+
+    async def wait_for_update(self, job_id: str, timeout: float) -> bool:
+        """작업에 변화가 생길 때까지 최대 timeout초 대기 (변화가 있으면 True)."""
+        event = self._updates.setdefault(job_id, asyncio.Event())
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    def _notify(self, job_id: str) -> None:
+        event = self._updates.pop(job_id, None)
+        if event is not None:
+            event.set()
+
+    async def _worker(self) -> None:
+        """대기열에서 학생을 하나씩 꺼내 생성하고 결과 저장."""
+        while True:
+            job_id, idx = await self._queue.get()
+            try:
+                await self._process_item(job_id, idx)
+            except Exception as e:
+                # 저장소 오류 등으로 워커가 멈추지 않도록 기록만 하고 계속 처리
+                self.logger.error(f"배치 항목 처리 오류 ({job_id}#{idx}): {type(e).__name__}: {str(e)}")
+            finally:
+                self._queue.task_done()
+
+    async def _process_item(self, job_id: str, idx: int) -> None:
+        request = await asyncio.to_thread(self.store.start_item, job_id, idx)
+        if request is None:
+            return
+        self._notify(job_id)
+
+        try:
+            result = await self._generate(TeacherInputRequest(**request))
+        except HTTPException as e:
+            await asyncio.to_thread(self.store.finish_item, job_id, idx, error=str(e.detail))
+            self._stats["failed"] += 1
+        except Exception as e:
+            await asyncio.to_thread(self.store.finish_item, job_id, idx, error=f"{type(e).__name__}: {str(e)}")
+            self._stats["failed"] += 1
+        else:
+            await asyncio.to_thread(self.store.finish_item, job_id, idx, result=result)
+        self._stats["processed"] += 1
+        self._notify(job_id)
+
+    def stats(self) -> Dict[str, Any]:
+        """워커 풀 현황 반환."""
+        return {
+            **self._stats,
+            "workers": len(self._tasks),
+            "queue_depth": self._queue.qsize() if self._queue is not None else 0
+        }
+
+
+# 싱글톤 인스턴스 생성
+batch_job_service = BatchJobService(
+    db_path=app_config.config["batch_job_db_path"],
+    workers=app_config.config["batch_job_workers"]
+)
@@ -0,0 +1,161 @@
+"""배치 작업 상태를 SQLite에 저장하는 모듈 (프록시 재시작 후 이어서 처리)."""
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# 학생별 처리 상태
+ITEM_PENDING = "pending"
+ITEM_RUNNING = "running"
+ITEM_SUCCESS = "success"
+ITEM_FAILED = "failed"
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS batch_jobs ("
+    " job_id TEXT PRIMARY KEY, total INTEGER NOT NULL, created_at REAL NOT NULL, updated_at REAL NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS batch_items ("
+    " job_id TEXT NOT NULL, idx INTEGER NOT NULL, student_id INTEGER NOT NULL,"
+    " request TEXT NOT NULL, status TEXT NOT NULL, result TEXT, error TEXT, updated_at REAL NOT NULL,"
+    " PRIMARY KEY (job_id, idx))",
+    "CREATE INDEX IF NOT EXISTS idx_batch_items_status ON batch_items(status)",
+)
+
+
+class BatchJobStore:
+    """배치 작업 저장소.
+
+    작업(batch_jobs)과 학생별 항목(batch_items)을 SQLite에 저장하며,
+    모든 메서드는 동기 함수이므로 서비스에서 asyncio.to_thread로 호출
+    """
+
+    def __init__(self, db_path: str):
+        """저장소 초기화.
+
+        Args:
+            db_path: SQLite 파일 경로 (":memory:"이면 메모리 DB)
+        """
+        if db_path != ":memory:":
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(db_path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            for statement in _SCHEMA:
+                self._db.execute(statement)
+            self._db.commit()
+
+    def create_job(self, requests: List[Dict[str, Any]]) -> str:
+        """작업과 학생별 항목을 생성하고 job_id 반환."""
+        job_id = str(uuid.uuid4())
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT INTO batch_jobs (job_id, total, created_at, updated_at) VALUES (?, ?, ?, ?)",
+                (job_id, len(requests), now, now),
+            )
+            self._db.executemany(
+                "INSERT INTO batch_items (job_id, idx, student_id, request, status, updated_at)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (job_id, idx, request["student_id"], json.dumps(request, ensure_ascii=False), ITEM_PENDING, now)
+                    for idx, request in enumerate(requests)
+                ],
+            )
+            self._db.commit()
+        return job_id
+
+    def recover_unfinished(self) -> List[Tuple[str, int]]:
+        """재시작 시 처리 중이던 항목을 대기 상태로 되돌리고, 처리할 항목 목록을 작업 생성 순서로 반환."""
+        with self._lock:
+            self._db.execute(
+                "UPDATE batch_items SET status = ? WHERE status = ?", (ITEM_PENDING, ITEM_RUNNING)
+            )
+            self._db.commit()
+            rows = self._db.execute(
+                "SELECT i.job_id, i.idx FROM batch_items i JOIN batch_jobs j ON i.job_id = j.job_id"
+                " WHERE i.status = ? ORDER BY j.created_at, i.idx",
+                (ITEM_PENDING,),
+            ).fetchall()
+        return [(job_id, idx) for job_id, idx in rows]
+
+    def start_item(self, job_id: str, idx: int) -> Optional[Dict[str, Any]]:
+        """항목을 처리 중으로 표시하고 원본 요청 반환 (이미 처리된 항목이면 None)."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT request, status FROM batch_items WHERE job_id = ? AND idx = ?", (job_id, idx)
+            ).fetchone()
+            if row is None or row[1] != ITEM_PENDING:
+                return None
+            self._update_item(job_id, idx, ITEM_RUNNING)
+        return json.loads(row[0])
+
+    def finish_item(self, job_id: str, idx: int, result: Optional[Dict[str, Any]] = None,
+                    error: Optional[str] = None) -> None:
+        """항목 처리 결과 저장."""
+        with self._lock:
+            self._update_item(
+                job_id,
+                idx,
+                ITEM_FAILED if error is not None else ITEM_SUCCESS,
+                json.dumps(result, ensure_ascii=False, default=str) if result is not None else None,
+                error,
+            )
+
+    def _update_item(self, job_id: str, idx: int, status: str, result: Optional[str] = None,
+                     error: Optional[str] = None) -> None:
+        now = time.time()
+        self._db.execute(
+            "UPDATE batch_items SET status = ?, result = ?, error = ?, updated_at = ? WHERE job_id = ? AND idx = ?",
+            (status, result, error, now, job_id, idx),
+        )
+        self._db.execute("UPDATE batch_jobs SET updated_at = ? WHERE job_id = ?", (now, job_id))
+        self._db.commit()
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """작업 진행 현황 (상태별 항목 수) 반환, 없으면 None."""
+        with self._lock:
+            job = self._db.execute(
+                "SELECT total, created_at, updated_at FROM batch_jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+            if job is None:
+                return None
+            counts = dict(self._db.execute(
+                "SELECT status, COUNT(*) FROM batch_items WHERE job_id = ? GROUP BY status", (job_id,)
+            ).fetchall())
+        total, created_at, updated_at = job
+        return {
+            "job_id": job_id,
+            "total": total,
+            "pending": counts.get(ITEM_PENDING, 0),
+            "running": counts.get(ITEM_RUNNING, 0),
+            "succeeded": counts.get(ITEM_SUCCESS, 0),
+            "failed": counts.get(ITEM_FAILED, 0),
+            "created_at": created_at,
+            "updated_at": updated_at,
+        }
+
+    def get_items(self, job_id: str, offset: int, limit: int) -> List[Dict[str, Any]]:
+        """작업 항목을 입력 순서대로 offset부터 limit개 반환."""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT idx, student_id, status, result, error FROM batch_items"
+                " WHERE job_id = ? ORDER BY idx LIMIT ? OFFSET ?",
+                (job_id, limit, offset),
+            ).fetchall()
+        return [
+            {
+                "index": idx,
+                "student_id": student_id,
+                "status": status,
+                "result": json.loads(result) if result else None,
+                "error": error,
+            }
+            for idx, student_id, status, result, error in rows
+        ]
+
+    def close(self) -> None:
+        """SQLite 연결 종료."""
+        with self._lock:
+            self._db.close()
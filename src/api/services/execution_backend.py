@@ -0,0 +1,77 @@
+"""세특 생성 워크플로우 실행 백엔드 선택 모듈."""
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+
+from typing_extensions import Protocol
+
+from src.api.config.app_config import app_config
+from src.api.dto.request_dto import TeacherInputRequest
+
+
+class ExecutionBackend(Protocol):
+    """GenerateService가 사용하는 워크플로우 실행 백엔드 인터페이스."""
+    
+    async def process_single_student(
+        self, student: TeacherInputRequest, deadline: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """단일 학생 워크플로우 실행 후 detailed_record 반환 (deadline: 요청 마감 시각, epoch 초)."""
+        ...
+    
+    def stream_single_student(
+        self, student: TeacherInputRequest, deadline: Optional[float] = None
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """단일 학생 워크플로우를 스트리밍 실행.
+        
+        ("token", 생성 중인 텍스트 조각) 또는 ("update", {노드 이름: 노드가 반환한 state}) 를 순서대로 반환
+        """
+        ...
+    
+    def stats(self) -> Dict[str, Any]:
+        """백엔드 운영 지표 반환."""
+        ...
+    
+    async def agent_stats(self) -> Dict[str, Any]:
+        """그래프를 실행하는 프로세스의 에이전트 구성요소 통계 반환 (모델 레지스트리, 검증기, 호출 제한 등)."""
+        ...
+
+
+# 토큰을 스트리밍할 노드 (검증 노드의 JSON 응답은 사용자에게 보내지 않음)
+TOKEN_STREAM_NODES = ("generate",)
+
+
+def message_text(content: Any) -> str:
+    """메시지 content(문자열 또는 content block 목록)에서 텍스트만 추출."""
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        return "".join(
+            block if isinstance(block, str) else block.get("text", "")
+            for block in content
+            if isinstance(block, str) or block.get("type") == "text"
+        )
+    return ""
+
+
+def build_run_config(deadline: Optional[float] = None) -> Dict[str, Any]:
+    """워크플로우 실행용 CustomConfig 생성 (deadline이 있으면 노드가 남은 시간에 맞춰 수정 단계와 LLM 호출 시간을 줄임)."""
+    configurable: Dict[str, Any] = {
+        "model_name": "openai",
+        "verification_mode": app_config.config["verification_mode"]
+    }
+    if deadline is not None:
+        configurable["deadline"] = deadline
+    return {"configurable": configurable}
+
+
+def get_execution_backend(name: str) -> ExecutionBackend:
+    """설정 이름에 해당하는 실행 백엔드 반환.
+    
+    - remote: 별도 LangGraph Server에 HTTP로 요청
+    - inprocess: 프록시 프로세스 안에서 graph.ainvoke 직접 호출
+    """
+    if name == "remote":
+        from src.api.services.langgraph_service import langgraph_service
+        return langgraph_service
+    if name == "inprocess":
+        from src.api.services.inprocess_graph_service import inprocess_graph_service
+        return inprocess_graph_service
+    raise ValueError(f"지원하지 않는 실행 백엔드입니다: {name}")
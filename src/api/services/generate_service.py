@@ -1,14 +1,46 @@
 """세부능력 특기사항 생성 비즈니스 로직을 담당하는 서비스 모듈."""
 import asyncio
-from typing import List, Dict, Any
+import time
+from typing import AsyncIterator, List, Dict, Any, Optional, Tuple
 
 import httpx
 from fastapi import HTTPException
 
 from src.api.dto.request_dto import TeacherInputRequest
-from src.api.services.langgraph_service import langgraph_service
+from src.api.services.execution_backend import build_run_config, get_execution_backend
+from src.api.services.response_cache import create_response_cache, make_request_key
+from src.api.services.single_flight import SingleFlight
 from src.api.utils.response_util import ResponseUtil
-from src.api.config.app_config import logger
+from src.api.config.app_config import app_config, logger
+
+
+def _summarize_node_update(node: str, update: Dict[str, Any]) -> Dict[str, Any]:
+    """노드가 반환한 state에서 진행 상황 표시에 필요한 값만 추출.
+    
+    생성 노드는 전체 state를 반환하므로 노드별로 해당 노드가 만든 값만 사용
+    """
+    summary: Dict[str, Any] = {"node": node}
+    if node in ("generate", "fix_grammar", "repair_missing", "finalize") and update.get("detailed_record"):
+        summary["version"] = update["detailed_record"].get("version")
+    if node in ("validate_input", "verify") and update.get("validation_result"):
+        summary["input_valid"] = update["validation_result"].get("is_valid")
+        summary["missing_items"] = update["validation_result"].get("missing_items", [])
+    if node in ("check_grammar", "verify") and update.get("grammar_result"):
+        summary["grammar_valid"] = update["grammar_result"].get("is_valid")
+        summary["grammar_issues"] = len(update["grammar_result"].get("issues", []))
+    if node in ("merge_verification", "verify") and "final_approval" in update:
+        summary["final_approval"] = update["final_approval"]
+    if node == "finalize":
+        summary["termination_reason"] = update.get("termination_reason")
+        summary["degraded"] = bool(update.get("degraded"))
+    return summary
+
+
+def _deadline(timeout: Optional[float]) -> Optional[float]:
+    """요청 처리 마감 시각 (epoch초, X-Request-Timeout 헤더가 없으면 REQUEST_TIMEOUT, 0이면 마감 없음)."""
+    if timeout is None:
+        timeout = app_config.config["request_timeout"]
+    return time.time() + timeout if timeout and timeout > 0 else None
 
 
 class GenerateService:
@@ -16,14 +48,113 @@ class GenerateService:
     
     def __init__(self):
         """서비스 초기화."""
-        self.langgraph_service = langgraph_service
+        # 워크플로우 실행 백엔드 (remote: LangGraph Server, inprocess: 프록시 내 직접 실행)
+        self.backend = get_execution_backend(app_config.config["execution_backend"])
+        # 동일 입력 응답 캐시 (비활성화 시 None)
+        self.cache = create_response_cache()
+        # 동시에 들어온 동일 입력 요청 병합
+        self.single_flight = SingleFlight()
         self.logger = logger
     
-    async def generate_single_student(self, request: TeacherInputRequest):
-        """단일 학생 세부능력 특기사항 생성."""
+    async def generate_record(
+        self, student: TeacherInputRequest, use_cache: bool = True, timeout: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """캐시를 확인한 뒤 없으면 실행 백엔드로 생성하고 결과를 캐시에 저장.
+        
+        같은 입력으로 이미 실행 중인 생성이 있으면 새로 실행하지 않고 그 결과를 함께 기다림
+        (마감 시각은 캐시/병합 키에 포함되지 않으므로 먼저 시작한 요청의 마감 시각을 따름)
+        """
+        deadline = _deadline(timeout)
+        run_config = build_run_config()
+        if self.cache is not None:
+            key = self.cache.make_key(student, run_config)
+            if use_cache:
+                cached = await self.cache.get(key)
+                if cached is not None:
+                    self.logger.debug(f"캐시 적중: student_id={student.student_id}")
+                    return cached
+            else:
+                self.cache.record_bypass()
+        else:
+            key = make_request_key(student, run_config)
+        
+        return await self.single_flight.do(key, lambda: self._run_and_store(student, key, deadline))
+    
+    async def _run_and_store(
+        self, student: TeacherInputRequest, key: str, deadline: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """실행 백엔드로 생성 (실패한 생성은 예외로 전달되므로 성공 결과만 캐시에 저장됨).
+        
+        반복 한도나 마감 시각에 걸려 best_effort로 반환된 세특은 다시 요청하면 더 나은 결과가 나올 수 있으므로 저장하지 않음
+        """
+        try:
+            detailed_record = await self.backend.process_single_student(student, deadline)
+        except asyncio.TimeoutError:
+            # 마감 전까지 돌려줄 세특이 하나도 만들어지지 않은 경우
+            raise HTTPException(status_code=504, detail="요청 처리 시간 초과")
+        if self.cache is not None and not (detailed_record.get("best_effort") or detailed_record.get("degraded")):
+            await self.cache.set(key, detailed_record)
+        return detailed_record
+    
+    async def stream_single_student(
+        self, student: TeacherInputRequest, use_cache: bool = True, timeout: Optional[float] = None
+    ) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """단일 학생 생성 과정을 (event, data) 단위로 반환.
+        
+        - token: 생성 노드가 만드는 텍스트 조각
+        - node: 노드 완료 시 요약 (검증 결과, 문법 문제 수, 수정 버전 등)
+        - result: 최종 세특 (캐시 적중 시 바로 반환)
+        """
+        key = self.cache.make_key(student, build_run_config()) if self.cache is not None else None
+        if self.cache is not None:
+            cached = await self.cache.get(key) if use_cache else None
+            if cached is not None:
+                yield "result", {**ResponseUtil.success(cached).model_dump(), "cached": True}
+                return
+            if not use_cache:
+                self.cache.record_bypass()
+        
+        detailed_record = None
+        try:
+            async for kind, data in self.backend.stream_single_student(student, _deadline(timeout)):
+                if kind == "token":
+                    yield "token", {"text": data}
+                    continue
+                for node, update in data.items():
+                    if not isinstance(update, dict):
+                        continue
+                    if update.get("detailed_record"):
+                        detailed_record = update["detailed_record"]
+                    yield "node", _summarize_node_update(node, update)
+        except asyncio.TimeoutError:
+            raise HTTPException(status_code=504, detail="요청 처리 시간 초과")
+        
+        if not detailed_record:
+            raise HTTPException(status_code=500, detail="세특 생성 결과를 찾을 수 없습니다")
+        if self.cache is not None and not (detailed_record.get("best_effort") or detailed_record.get("degraded")):
+            await self.cache.set(key, detailed_record)
+        yield "result", {**ResponseUtil.success(detailed_record).model_dump(), "cached": False}
+    
+    def stats(self) -> Dict[str, Any]:
+        """응답 캐시(비활성화 시 None)와 중복 요청 병합 지표 반환."""
+        return {
+            "response_cache": self.cache.stats() if self.cache is not None else None,
+            "single_flight": self.single_flight.stats()
+        }
+    
+    async def generate_single_student(
+        self, request: TeacherInputRequest, use_cache: bool = True, timeout: Optional[float] = None
+    ):
+        """단일 학생 세부능력 특기사항 생성.
+        
+        Args:
+            request: 선생님 입력 정보
+            use_cache: False면 캐시를 무시하고 새로 생성 (결과는 캐시에 갱신)
+            timeout: 처리 시간 예산(초), 마감이 가까우면 그때까지의 최선의 세특을 degraded로 반환
+        """
         try:
-            # LangGraph 서비스 사용
-            detailed_record = await self.langgraph_service.process_single_student(request)
+            # 캐시 확인 후 실행 백엔드 사용
+            detailed_record = await self.generate_record(request, use_cache, timeout)
             
             # 성공 응답
             return ResponseUtil.success(detailed_record)
@@ -41,13 +172,15 @@ class GenerateService:
                 detail=f"서버 오류: {str(e)}"
             )
     
-    async def generate_batch_students(self, requests: List[TeacherInputRequest]):
+    async def generate_batch_students(
+        self, requests: List[TeacherInputRequest], use_cache: bool = True, timeout: Optional[float] = None
+    ):
         """여러 학생의 세부능력 특기사항을 동시에 생성."""
         try:
             # 모든 학생을 병렬로 처리
             tasks = []
             for student in requests:
-                task = self.langgraph_service.process_single_student(student)
+                task = self.generate_record(student, use_cache, timeout)
                 tasks.append(task)
             
             # 모든 작업 동시 실행
@@ -78,6 +211,50 @@ class GenerateService:
                 detail=f"배치 처리 오류: {str(e)}"
             )
 
+    
+    async def _generate_indexed(
+        self, index: int, student: TeacherInputRequest, use_cache: bool, timeout: Optional[float] = None
+    ) -> Tuple[int, Optional[Dict[str, Any]], Optional[Exception]]:
+        """생성 결과를 입력 순서(index)와 함께 반환 (예외도 결과로 반환)."""
+        try:
+            return index, await self.generate_record(student, use_cache, timeout), None
+        except Exception as e:
+            return index, None, e
+    
+    async def stream_batch_students(
+        self, requests: List[TeacherInputRequest], use_cache: bool = True, timeout: Optional[float] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """여러 학생을 동시에 생성하고 끝나는 순서대로 학생별 결과를 반환.
+        
+        실패한 학생도 error 항목으로 반환하며, 소비자가 중간에 멈추면(클라이언트 연결 종료) 남은 생성은 취소함
+        """
+        tasks = [
+            asyncio.ensure_future(self._generate_indexed(index, student, use_cache, timeout))
+            for index, student in enumerate(requests)
+        ]
+        try:
+            for completed in asyncio.as_completed(tasks):
+                index, detailed_record, error = await completed
+                student = requests[index]
+                if error is None:
+                    yield {
+                        "index": index,
+                        "student_id": student.student_id,
+                        "status": "success",
+                        "result": ResponseUtil.success(detailed_record).model_dump()
+                    }
+                else:
+                    self.logger.warning(f"학생 처리 실패 ({index}, {student.name}): {str(error)}")
+                    yield {
+                        "index": index,
+                        "student_id": student.student_id,
+                        "status": "failed",
+                        "error": error.detail if isinstance(error, HTTPException) else str(error)
+                    }
+        finally:
+            for task in tasks:
+                task.cancel()
+
 
 # 싱글톤 인스턴스 생성
 generate_service = GenerateService()
\ No newline at end of file
@@ -0,0 +1,119 @@
+"""프록시 프로세스 안에서 LangGraph 워크플로우를 직접 실행하는 서비스 모듈."""
+import asyncio
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+
+from fastapi import HTTPException
+
+from src.api.config.app_config import app_config, logger
+from src.api.dto.request_dto import TeacherInputRequest
+from src.api.services.execution_backend import (
+    TOKEN_STREAM_NODES,
+    build_run_config,
+    message_text,
+)
+
+
+class InProcessGraphService:
+    """In-process 워크플로우 실행 서비스.
+
+    LangGraph Server 없이 컴파일된 graph를 같은 프로세스에서 ainvoke로 실행하므로
+    네트워크 왕복, state JSON 직렬화, 결과 폴링이 모두 사라짐
+    """
+    
+    def __init__(self, max_concurrency: int = 10):
+        """서비스 초기화.
+        
+        Args:
+            max_concurrency: 동시에 실행할 수 있는 워크플로우 수
+        """
+        self.logger = logger
+        self.max_concurrency = max_concurrency
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._graph = None
+        self._in_flight = 0
+        self._completed = 0
+        self._failed = 0
+    
+    @property
+    def graph(self):
+        """컴파일된 워크플로우 (첫 사용 시 import)."""
+        if self._graph is None:
+            # remote 백엔드에서는 모델/도구 의존성을 불러오지 않도록 지연 import
+            from agent.agent import graph
+            self._graph = graph
+        return self._graph
+    
+    async def process_single_student(
+        self, student: TeacherInputRequest, deadline: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """단일 학생 처리 (graph.ainvoke → detailed_record 반환)."""
+        async with self._semaphore:
+            self._in_flight += 1
+            try:
+                result = await self.graph.ainvoke(student.to_graph_input(), config=build_run_config(deadline))
+            except Exception as e:
+                self._failed += 1
+                self.logger.error(f"처리 실패: {type(e).__name__}: {str(e)}")
+                raise
+            finally:
+                self._in_flight -= 1
+        
+        detailed_record = result.get("detailed_record") if isinstance(result, dict) else None
+        if not detailed_record:
+            self._failed += 1
+            self.logger.error("detailed_record를 찾을 수 없음")
+            raise HTTPException(status_code=500, detail="세특 생성 결과를 찾을 수 없습니다")
+        
+        self._completed += 1
+        self.logger.info(f"세특 결과 (content): {detailed_record.get('content', '내용 없음')}")
+        return detailed_record
+    
+    async def stream_single_student(
+        self, student: TeacherInputRequest, deadline: Optional[float] = None
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """단일 학생 스트리밍 처리 (graph.astream의 messages/updates 모드 중계)."""
+        async with self._semaphore:
+            self._in_flight += 1
+            try:
+                async for mode, chunk in self.graph.astream(
+                    student.to_graph_input(),
+                    config=build_run_config(deadline),
+                    stream_mode=["messages", "updates"]
+                ):
+                    if mode == "messages":
+                        message, metadata = chunk
+                        if metadata.get("langgraph_node") in TOKEN_STREAM_NODES:
+                            text = message_text(message.content)
+                            if text:
+                                yield "token", text
+                    else:
+                        yield "update", chunk
+            except Exception as e:
+                self._failed += 1
+                self.logger.error(f"스트리밍 처리 실패: {type(e).__name__}: {str(e)}")
+                raise
+            finally:
+                self._in_flight -= 1
+        self._completed += 1
+    
+    def stats(self) -> Dict[str, Any]:
+        """동시 실행 현황 반환."""
+        return {
+            "backend": "inprocess",
+            "max_concurrency": self.max_concurrency,
+            "in_flight": self._in_flight,
+            "completed": self._completed,
+            "failed": self._failed,
+        }
+    
+    async def agent_stats(self) -> Dict[str, Any]:
+        """같은 프로세스에 등록된 에이전트 구성요소 통계 반환."""
+        from agent.utils.stats import collect_stats
+        
+        return collect_stats()
+
+
+# 싱글톤 인스턴스 생성
+inprocess_graph_service = InProcessGraphService(
+    max_concurrency=app_config.config["inprocess_max_concurrency"]
+)
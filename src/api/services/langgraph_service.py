@@ -1,182 +1,372 @@
 """LangGraph 서버와의 통신을 담당하는 서비스 모듈."""
 import asyncio
 import json
-from typing import Dict, Any
+import time
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+
 import httpx
 from fastapi import HTTPException
+
+from src.api.config.app_config import (
+    ASSISTANT_ID,
+    LANGGRAPH_SERVER_URL,
+    app_config,
+    logger,
+)
 from src.api.dto.request_dto import TeacherInputRequest
-from src.api.config.app_config import logger, LANGGRAPH_SERVER_URL, ASSISTANT_ID
+from src.api.services.adaptive_limiter import AdaptiveConcurrencyLimiter
+from src.api.services.execution_backend import (
+    TOKEN_STREAM_NODES,
+    build_run_config,
+    message_text,
+)
+
+# 현재 학생 처리 중 LangGraph Server로 보낸 요청 수 (학생별 task 단위로 격리)
+_upstream_requests: ContextVar[int] = ContextVar("upstream_requests", default=0)
+
+# LangGraph Server의 에이전트 통계 라우트 (agent.webapp, langgraph.json의 http.app)
+AGENT_STATS_PATH = "/agent/stats"
+
+# 마감 시각 초과 예외 이름 (agent.utils.model.deadline.DeadlineExceeded, 원격 에러는 클래스 이름으로 전달됨)
+DEADLINE_ERROR_NAME = "DeadlineExceeded"
+
+
+def _is_deadline_error(error: Any) -> bool:
+    """LangGraph Server가 전달한 워크플로우 에러({"error": 예외 이름, "message": ...})가 마감 초과인지 여부."""
+    return isinstance(error, dict) and error.get("error") == DEADLINE_ERROR_NAME
+
+
+async def _iter_sse(response: httpx.Response) -> AsyncIterator[Tuple[str, Any]]:
+    """LangGraph Server SSE 응답을 (event, data) 단위로 파싱."""
+    event, data_lines = "message", []
+    async for line in response.aiter_lines():
+        if not line:
+            if data_lines:
+                yield event, json.loads("\n".join(data_lines))
+            event, data_lines = "message", []
+        elif line.startswith("event:"):
+            event = line[len("event:"):].strip()
+        elif line.startswith("data:"):
+            data_lines.append(line[len("data:"):].strip())
 
 
 class LangGraphService:
-    """
-    LangGraph 서버 통신 서비스.
-    랭그래프 생성을 요청할때에는 총 3단계로 나뉨
+    """LangGraph 서버 통신 서비스.
+
+    thread 모드에서는 랭그래프 생성을 요청할때 총 3단계로 나뉨
     1. 쓰레드 생성
     2. 런 실행
-    3. 결과 가져오기
+    3. 결과 가져오기 (join 대기, 실패 시 폴링으로 대체)
+    stateless 모드에서는 쓰레드 없이 한 번의 요청으로 실행하고 최종 결과를 받음
     """
     
-    def __init__(self):
-        """서비스 초기화."""
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        """서비스 초기화.
+        
+        Args:
+            client: 공유 httpx.AsyncClient (보통 FastAPI lifespan에서 주입)
+        """
         self.server_url = LANGGRAPH_SERVER_URL
         self.assistant_id = ASSISTANT_ID
         self.logger = logger
+        self._client = client
+        
+        # 결과 대기 방식: "join" (서버에서 완료까지 대기) 또는 "poll" (상태 폴링)
+        self.completion_mode = app_config.config["langgraph_completion_mode"]
+        self.join_timeout = app_config.config["langgraph_join_timeout"]
+        # 마감 시각 이후 그래프가 최선의 결과를 정리해 반환할 때까지 더 기다릴 시간
+        self.deadline_grace = app_config.config["request_deadline_grace"]
+        
+        # 실행 방식: "thread" (쓰레드 생성 후 실행) 또는 "stateless" (단일 요청)
+        self.run_mode = app_config.config["langgraph_run_mode"]
+        
+        # 실행 방식별 생성 건수와 업스트림 요청 수 집계
+        self._upstream_stats: Dict[str, Dict[str, int]] = {}
+        
+        # 서버 부하(지연 시간/오류)에 맞춰 동시에 실행할 Run 수 조절
+        self.concurrency_limiter = AdaptiveConcurrencyLimiter(
+            initial_limit=app_config.config["langgraph_initial_concurrency"],
+            min_limit=app_config.config["langgraph_min_concurrency"],
+            max_limit=app_config.config["langgraph_max_concurrency"],
+            max_queue=app_config.config["langgraph_queue_size"],
+            latency_tolerance=app_config.config["langgraph_latency_tolerance"]
+        )
+    
+    def bind_client(self, client: Optional[httpx.AsyncClient]) -> None:
+        """공유 HTTP 클라이언트 주입 (lifespan 시작/종료 시 호출)."""
+        self._client = client
+    
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """공유 HTTP 클라이언트 반환."""
+        if self._client is None:
+            raise RuntimeError("HTTP 클라이언트가 초기화되지 않았습니다. (앱 lifespan 밖에서 호출됨)")
+        return self._client
+    
+    async def _request(self, method: str, path: str, **kwargs) -> httpx.Response:
+        """LangGraph Server 요청 (업스트림 요청 수 집계 포함)."""
+        _upstream_requests.set(_upstream_requests.get() + 1)
+        return await self.client.request(method, f"{self.server_url}{path}", **kwargs)
+    
+    def _wait_timeout(self, timeout: float, deadline: Optional[float]) -> float:
+        """결과 대기 타임아웃 (마감 시각이 있으면 마감 시각 + 유예 시간까지만 대기)."""
+        if deadline is None:
+            return timeout
+        return max(1.0, min(timeout, deadline - time.time() + self.deadline_grace))
+    
+    def _build_run_payload(self, student_data: TeacherInputRequest, deadline: Optional[float] = None) -> Dict[str, Any]:
+        """Run 요청 payload 생성 (input + CustomConfig)."""
+        # 디버깅: student_data 내용 확인
+        teacher_dict = student_data.to_dict()
+        self.logger.debug(f"[DEBUG] TeacherInputRequest.to_dict(): {teacher_dict}")
+        self.logger.debug(f"[DEBUG] student_number in teacher_dict: {teacher_dict.get('student_number', 'NOT_FOUND')}")
+        
+        return {
+            "assistant_id": self.assistant_id,
+            "input": student_data.to_graph_input(),
+            "config": build_run_config(deadline)
+        }
     
     async def create_thread(self) -> str:
         """LangGraph Thread 생성."""
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                f"{self.server_url}/threads",
-                json={
-                    "metadata": {
-                        "workflow": "세부능력특기사항생성",
-                        "created_by": "api"
-                    }
+        response = await self._request(
+            "POST",
+            "/threads",
+            json={
+                "metadata": {
+                    "workflow": "세부능력특기사항생성",
+                    "created_by": "api"
                 }
-            )
+            },
+            timeout=30.0
+        )
 
-            if response.status_code != 200:
-                raise HTTPException(
-                    status_code=response.status_code, 
-                    detail=f"Thread 생성 실패: {response.text}"
-                )
-            
-            data = response.json()
-            return data["thread_id"]
-    
-    async def run_workflow(self, thread_id: str, student_data: TeacherInputRequest) -> str:
-        """워크플로우 실행 (Run 생성)."""
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            # 디버깅: student_data 내용 확인
-            teacher_dict = student_data.to_dict()
-            self.logger.debug(f"[DEBUG] TeacherInputRequest.to_dict(): {teacher_dict}")
-            self.logger.debug(f"[DEBUG] student_number in teacher_dict: {teacher_dict.get('student_number', 'NOT_FOUND')}")
-            
-            payload = {
-                "assistant_id": self.assistant_id,
-                "input": {
-                    "teacher_input": teacher_dict,
-                    "generation_status": "pending",
-                    "semester": student_data.semester,
-                    "academic_year": student_data.academic_year
-                },
-                "config": {
-                    "configurable": {
-                        "model_name": "openai"
-                    }
-                }
-            }
-            
-            response = await client.post(
-                f"{self.server_url}/threads/{thread_id}/runs",
-                json=payload
+        if response.status_code != 200:
+            raise HTTPException(
+                status_code=response.status_code, 
+                detail=f"Thread 생성 실패: {response.text}"
             )
+        
+        data = response.json()
+        return data["thread_id"]
+    
+    async def run_workflow(
+        self, thread_id: str, student_data: TeacherInputRequest, deadline: Optional[float] = None
+    ) -> str:
+        """워크플로우 실행 (Run 생성, deadline은 CustomConfig로 그래프에 전달)."""
+        response = await self._request(
+            "POST",
+            f"/threads/{thread_id}/runs",
+            json=self._build_run_payload(student_data, deadline),
+            timeout=30.0
+        )
 
+        if response.status_code != 200:
+            raise HTTPException(
+                status_code=response.status_code, 
+                detail=f"Run 실행 실패: {response.text}"
+            )
+        
+        data = response.json()
+        return data["run_id"]
+    
+    async def run_stateless(self, student_data: TeacherInputRequest, deadline: Optional[float] = None) -> Dict[str, Any]:
+        """쓰레드 없이 Run을 실행하고 최종 state를 한 번의 요청으로 반환 (stateless 모드)."""
+        response = await self._request(
+            "POST",
+            "/runs/wait",
+            json=self._build_run_payload(student_data, deadline),
+            timeout=self._wait_timeout(self.join_timeout, deadline)
+        )
+        
+        if response.status_code != 200:
+            raise HTTPException(
+                status_code=response.status_code, 
+                detail=f"Run 실행 실패: {response.text}"
+            )
+        
+        values = response.json()
+        if not isinstance(values, dict):
+            raise HTTPException(status_code=500, detail="values가 예상치 못한 타입")
+        self._raise_for_run_error(values)
+        return values
+    
+    def _raise_for_run_error(self, values: Dict[str, Any]) -> None:
+        """최종 state에 담긴 워크플로우 에러(__error__)를 예외로 변환 (마감 초과는 504, 그 외는 500)."""
+        if "__error__" in values:
+            error = values["__error__"]
+            if _is_deadline_error(error):
+                # 마감 전까지 돌려줄 세특이 하나도 만들어지지 않은 경우 (in-process 실행과 같은 504)
+                raise HTTPException(status_code=504, detail="요청 처리 시간 초과")
+            error_msg = error.get("message", "워크플로우 실행 실패") if isinstance(error, dict) else str(error)
+            self.logger.error(f"워크플로우 에러: {error_msg}")
+            raise HTTPException(status_code=500, detail=error_msg)
+    
+    async def get_run_result(self, thread_id: str, run_id: str, deadline: Optional[float] = None) -> Dict[str, Any]:
+        """Run 결과 가져오기.
+        
+        join 모드에서는 Run이 끝날 때까지 서버에서 대기한 뒤 최종 state를 한 번에 받고,
+        join 엔드포인트를 쓸 수 없으면 폴링으로 대체합니다.
+        마감 시각이 있으면 마감 시각 + 유예 시간까지만 기다립니다.
+        """
+        if self.completion_mode == "join":
+            result = await self._join_run_result(thread_id, run_id, deadline)
+            if result is not None:
+                return result
+            self.logger.warning("join 대기 실패, 폴링으로 결과 조회")
+        return await self._poll_run_result(thread_id, run_id, deadline)
+    
+    async def _join_run_result(
+        self, thread_id: str, run_id: str, deadline: Optional[float] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Run 완료까지 대기 후 최종 state 반환 (join 엔드포인트).
+        
+        Returns:
+            최종 state values, join을 사용할 수 없으면 None
+        """
+        try:
+            response = await self._request(
+                "GET",
+                f"/threads/{thread_id}/runs/{run_id}/join",
+                timeout=self._wait_timeout(self.join_timeout, deadline)
+            )
+        except (httpx.TimeoutException, httpx.RemoteProtocolError) as e:
+            self.logger.warning(f"join 요청 실패: {type(e).__name__}")
+            return None
+        
+        if response.status_code != 200:
+            self.logger.warning(f"join 응답 코드: {response.status_code}")
+            return None
+        
+        values = response.json()
+        if not isinstance(values, dict):
+            self.logger.warning(f"join 결과가 예상치 못한 타입: {type(values)}")
+            return None
+        
+        # 워크플로우 에러는 __error__ 키로 전달됨
+        self._raise_for_run_error(values)
+        return values
+    
+    async def _poll_run_result(self, thread_id: str, run_id: str, deadline: Optional[float] = None) -> Dict[str, Any]:
+        """Run 결과 가져오기 (폴링, 마감 시각이 있으면 횟수 대신 마감 시각 + 유예 시간까지 폴링)."""
+        max_attempts = 100  # 더 많은 시도 횟수 (간격이 짧아졌으므로)
+        
+        attempt = 0
+        while attempt < max_attempts if deadline is None else time.time() < deadline + self.deadline_grace:
+            # Run 상태 확인
+            response = await self._request(
+                "GET",
+                f"/threads/{thread_id}/runs/{run_id}",
+                timeout=60.0
+            )
+            
             if response.status_code != 200:
                 raise HTTPException(
                     status_code=response.status_code, 
-                    detail=f"Run 실행 실패: {response.text}"
+                    detail=f"Run 상태 조회 실패: {response.text}"
                 )
             
-            data = response.json()
-            return data["run_id"]
-    
-    async def get_run_result(self, thread_id: str, run_id: str) -> Dict[str, Any]:
-        """Run 결과 가져오기 (폴링)."""
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            max_attempts = 100  # 더 많은 시도 횟수 (간격이 짧아졌으므로)
+            run_data = response.json()
+            status = run_data.get("status")
+            
+            # 5번마다만 로그 출력 (또는 상태가 변경될 때)
+            if attempt % 5 == 0 or status in ["success", "error"]:
+                self.logger.debug(f"Run 상태: {status} (attempt {attempt + 1}/{max_attempts})")
             
-            for attempt in range(max_attempts):
-                # Run 상태 확인
-                response = await client.get(
-                    f"{self.server_url}/threads/{thread_id}/runs/{run_id}"
+            if status == "success":
+                # 실제 결과 가져오기 (state endpoint 사용)
+                result_response = await self._request(
+                    "GET",
+                    f"/threads/{thread_id}/state",
+                    timeout=60.0
                 )
                 
-                if response.status_code != 200:
-                    raise HTTPException(
-                        status_code=response.status_code, 
-                        detail=f"Run 상태 조회 실패: {response.text}"
-                    )
+                self.logger.debug(f"런 실행 결과 State 응답 코드: {result_response.status_code}")
                 
-                run_data = response.json()
-                status = run_data.get("status")
-                
-                # 5번마다만 로그 출력 (또는 상태가 변경될 때)
-                if attempt % 5 == 0 or status in ["success", "error"]:
-                    self.logger.debug(f"Run 상태: {status} (attempt {attempt + 1}/{max_attempts})")
-                
-                if status == "success":
-                    # 실제 결과 가져오기 (state endpoint 사용)
-                    result_response = await client.get(
-                        f"{self.server_url}/threads/{thread_id}/state"
-                    )
+                if result_response.status_code == 200:
+                    state_data = result_response.json()
                     
-                    self.logger.debug(f"런 실행 결과 State 응답 코드: {result_response.status_code}")
-                    
-                    if result_response.status_code == 200:
-                        state_data = result_response.json()
+                    # values는 현재 state의 모든 필드를 담고 있는 dict
+                    if "values" in state_data:
+                        values = state_data["values"]
                         
-                        # values는 현재 state의 모든 필드를 담고 있는 dict
-                        if "values" in state_data:
-                            values = state_data["values"]
+                        if isinstance(values, dict):
+                            # values가 state 자체인 경우
                             
-                            if isinstance(values, dict):
-                                # values가 state 자체인 경우
-                                
-                                # detailed_record가 있는지 확인
-                                if "detailed_record" in values:
-                                    return values  # 전체 state 반환
-                                else:
-                                    self.logger.warning("values에 detailed_record 없음")
-                                    self.logger.debug(f"values 내용 일부: {str(values)[:500]}...")
-                                    return values
-                            elif isinstance(values, list) and len(values) > 0:
-                                # 리스트인 경우 마지막 값
-                                final_state = values[-1]
-                                self.logger.info(
-                                    f"최종 상태 (리스트): "
-                                    f"{final_state.keys() if isinstance(final_state, dict) else type(final_state)}"
-                                )
-                                return final_state
+                            # detailed_record가 있는지 확인
+                            if "detailed_record" in values:
+                                return values  # 전체 state 반환
                             else:
-                                self.logger.warning(f"values가 예상치 못한 타입: {type(values)}")
-                                raise HTTPException(status_code=500, detail="values가 예상치 못한 타입")
+                                self.logger.warning("values에 detailed_record 없음")
+                                self.logger.debug(f"values 내용 일부: {str(values)[:500]}...")
+                                return values
+                        elif isinstance(values, list) and len(values) > 0:
+                            # 리스트인 경우 마지막 값
+                            final_state = values[-1]
+                            self.logger.info(
+                                f"최종 상태 (리스트): "
+                                f"{final_state.keys() if isinstance(final_state, dict) else type(final_state)}"
+                            )
+                            return final_state
                         else:
-                            self.logger.warning("values 키 없음, 전체 state 반환")
-                            raise HTTPException(status_code=500, detail="values 키 없음")
+                            self.logger.warning(f"values가 예상치 못한 타입: {type(values)}")
+                            raise HTTPException(status_code=500, detail="values가 예상치 못한 타입")
                     else:
-                        self.logger.error(f"State 조회 실패: {result_response.text[:200]}")
-                        raise HTTPException(status_code=500, detail="워크플로우 결과 조회 실패")
-                        
-                elif status == "error":
-                    error_msg = run_data.get("error", "워크플로우 실행 실패")
-                    self.logger.error(f"워크플로우 에러: {error_msg}")
-                    raise HTTPException(status_code=500, detail=error_msg)
-                
-                # 점진적 백오프 패턴으로 대기
-                if attempt < 10:
-                    await asyncio.sleep(0.3)  # 처음 10번은 0.3초 (3초간)
-                elif attempt < 30:
-                    await asyncio.sleep(0.5)  # 다음 20번은 0.5초 (10초간)
+                        self.logger.warning("values 키 없음, 전체 state 반환")
+                        raise HTTPException(status_code=500, detail="values 키 없음")
                 else:
-                    await asyncio.sleep(1.0)  # 그 이후는 1초
+                    self.logger.error(f"State 조회 실패: {result_response.text[:200]}")
+                    raise HTTPException(status_code=500, detail="워크플로우 결과 조회 실패")
+                    
+            elif status == "error":
+                error_msg = run_data.get("error", "워크플로우 실행 실패")
+                self.logger.error(f"워크플로우 에러: {error_msg}")
+                raise HTTPException(status_code=500, detail=error_msg)
             
-            raise HTTPException(status_code=504, detail="워크플로우 실행 시간 초과")
+            # 점진적 백오프 패턴으로 대기
+            if attempt < 10:
+                await asyncio.sleep(0.3)  # 처음 10번은 0.3초 (3초간)
+            elif attempt < 30:
+                await asyncio.sleep(0.5)  # 다음 20번은 0.5초 (10초간)
+            else:
+                await asyncio.sleep(1.0)  # 그 이후는 1초
+            attempt += 1
+        
+        raise HTTPException(status_code=504, detail="워크플로우 실행 시간 초과")
     
-    async def process_single_student(self, student: TeacherInputRequest) -> Dict[str, Any]:
-        """단일 학생 처리 (Thread 생성 → Run 실행 → 결과 반환)."""
+    async def process_single_student(
+        self, student: TeacherInputRequest, deadline: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """단일 학생 처리 (동시 실행 한도를 넘으면 대기열에서 순서대로 대기)."""
         try:
-            # 1. Thread 생성
-            thread_id = await self.create_thread()
-            self.logger.debug(f"Thread 생성됨: {thread_id}")
-            
-            # 2. Run 실행
-            run_id = await self.run_workflow(thread_id, student)
-            self.logger.debug(f"Run 시작됨: {run_id}")
-            
-            # 3. 결과 가져오기
-            result = await self.get_run_result(thread_id, run_id)
+            async with self.concurrency_limiter.slot():
+                return await self._process_single_student(student, deadline)
+        except asyncio.QueueFull:
+            raise HTTPException(
+                status_code=503,
+                detail="LangGraph Server 요청 대기열이 가득 찼습니다. 잠시 후 다시 시도해주세요."
+            )
+    
+    async def _process_single_student(
+        self, student: TeacherInputRequest, deadline: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """단일 학생 처리 (Thread 생성 → Run 실행 → 결과 반환, stateless 모드는 단일 요청)."""
+        request_count_token = _upstream_requests.set(0)
+        try:
+            if self.run_mode == "stateless":
+                result = await self.run_stateless(student, deadline)
+            else:
+                # 1. Thread 생성
+                thread_id = await self.create_thread()
+                self.logger.debug(f"Thread 생성됨: {thread_id}")
+                
+                # 2. Run 실행
+                run_id = await self.run_workflow(thread_id, student, deadline)
+                self.logger.debug(f"Run 시작됨: {run_id}")
+                
+                # 3. 결과 가져오기
+                result = await self.get_run_result(thread_id, run_id, deadline)
             
             # 4. 결과에서 detailed_record 추출
             detailed_record = None
@@ -197,6 +387,92 @@ class LangGraphService:
         except Exception as e:
             self.logger.error(f"처리 실패: {type(e).__name__}: {str(e)}")
             raise
+        finally:
+            self._record_upstream_requests(_upstream_requests.get())
+            _upstream_requests.reset(request_count_token)
+    
+    async def stream_single_student(
+        self, student: TeacherInputRequest, deadline: Optional[float] = None
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """단일 학생 스트리밍 처리 (stateless Run의 messages/updates 스트림을 그대로 중계)."""
+        payload = {
+            **self._build_run_payload(student, deadline),
+            "stream_mode": ["messages-tuple", "updates"]
+        }
+        try:
+            async with self.concurrency_limiter.slot():
+                async with self.client.stream(
+                    "POST",
+                    f"{self.server_url}/runs/stream",
+                    json=payload,
+                    # 토큰 사이 간격은 LLM 응답 속도에 달려 있으므로 읽기 타임아웃은 두지 않음
+                    timeout=httpx.Timeout(30.0, read=None)
+                ) as response:
+                    if response.status_code != 200:
+                        body = await response.aread()
+                        raise HTTPException(
+                            status_code=response.status_code,
+                            detail=f"Run 스트리밍 실패: {body.decode(errors='replace')}"
+                        )
+                    async for event, data in _iter_sse(response):
+                        if event == "messages":
+                            chunk, metadata = data
+                            if metadata.get("langgraph_node") in TOKEN_STREAM_NODES:
+                                text = message_text(chunk.get("content"))
+                                if text:
+                                    yield "token", text
+                        elif event == "updates":
+                            yield "update", data
+                        elif event == "error":
+                            if _is_deadline_error(data):
+                                raise HTTPException(status_code=504, detail="요청 처리 시간 초과")
+                            raise HTTPException(status_code=500, detail=f"워크플로우 실행 실패: {data}")
+        except asyncio.QueueFull:
+            raise HTTPException(
+                status_code=503,
+                detail="LangGraph Server 요청 대기열이 가득 찼습니다. 잠시 후 다시 시도해주세요."
+            )
+    
+    def _stats_key(self) -> str:
+        """현재 실행 방식 이름 (집계 키)."""
+        if self.run_mode == "stateless":
+            return "stateless"
+        return f"thread/{self.completion_mode}"
+    
+    def _record_upstream_requests(self, count: int) -> None:
+        """학생 1명 생성에 사용된 업스트림 요청 수 기록."""
+        key = self._stats_key()
+        stats = self._upstream_stats.setdefault(key, {"generations": 0, "requests": 0})
+        stats["generations"] += 1
+        stats["requests"] += count
+        self.logger.debug(f"업스트림 요청 수: {count} (mode: {key})")
+    
+    async def agent_stats(self) -> Dict[str, Any]:
+        """LangGraph Server 프로세스의 에이전트 구성요소 통계 조회 (조회 실패 시 error만 반환)."""
+        try:
+            response = await self.client.get(f"{self.server_url}{AGENT_STATS_PATH}", timeout=5.0)
+            response.raise_for_status()
+            return response.json()
+        except (httpx.HTTPError, ValueError) as e:
+            self.logger.warning(f"에이전트 통계 조회 실패: {type(e).__name__}: {e}")
+            return {"error": f"{type(e).__name__}: {e}"}
+    
+    def stats(self) -> Dict[str, Any]:
+        """실행 방식별 생성당 업스트림 요청 수 반환."""
+        return {
+            "backend": "remote",
+            "run_mode": self.run_mode,
+            "completion_mode": self.completion_mode,
+            "concurrency": self.concurrency_limiter.stats(),
+            "upstream_requests": {
+                key: {
+                    **value,
+                    "avg_per_generation": round(value["requests"] / value["generations"], 2)
+                }
+                for key, value in self._upstream_stats.items()
+                if value["generations"]
+            }
+        }
 
 
 # 싱글톤 인스턴스 생성
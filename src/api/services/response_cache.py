@@ -0,0 +1,125 @@
+"""동일한 생성 요청의 결과를 재사용하는 응답 캐시 모듈."""
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from agent.utils.config.config import model_fingerprint
+from agent.utils.tiered_store import TieredStore
+from src.api.config.app_config import app_config, logger
+from src.api.dto.request_dto import TeacherInputRequest
+
+PROMPT_FILE = Path(__file__).resolve().parents[2] / "static" / "prompt.py"
+
+
+def _prompt_version() -> str:
+    """프롬프트 파일 내용 해시 (프롬프트가 바뀌면 이전 캐시는 자동으로 무효화)."""
+    try:
+        return hashlib.sha256(PROMPT_FILE.read_bytes()).hexdigest()[:12]
+    except OSError:
+        logger.warning(f"프롬프트 파일을 읽을 수 없음: {PROMPT_FILE}")
+        return "unknown"
+
+
+def _normalize(value: Any) -> Any:
+    """공백 차이만 있는 입력이 같은 키가 되도록 문자열 정규화."""
+    if isinstance(value, str):
+        return " ".join(value.split())
+    return value
+
+
+def make_request_key(student: TeacherInputRequest, run_config: Dict[str, Any], prompt_version: str = "") -> str:
+    """정규화된 입력과 실행 설정으로 요청 키 생성 (응답 캐시, 중복 요청 병합에서 공용).
+
+    provider 이름뿐 아니라 실제 모델 ID와 노드별 모델 파라미터도 포함하므로
+    PROVIDER_MODELS나 NODE_MODEL_SETTINGS를 바꾸면 이전 모델로 만든 결과는 재사용되지 않음
+    """
+    configurable = run_config.get("configurable", {})
+    payload = {
+        "input": {field: _normalize(value) for field, value in student.model_dump().items()},
+        # 마감 시각은 요청마다 다르므로 키에서 제외
+        "configurable": {k: v for k, v in configurable.items() if k != "deadline"},
+        "model": model_fingerprint(configurable.get("model_name", "")),
+        "prompt_version": prompt_version,
+    }
+    encoded = json.dumps(payload, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """생성 결과 캐시.
+
+    메모리 LRU를 1차로 사용하고, db_path가 주어지면 SQLite를 2차 저장소로 사용해
+    프로세스 재시작 후에도 결과를 재사용함
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1000,
+        ttl_seconds: float = 86400,
+        db_path: str = "",
+        db_max_entries: int = 10000,
+    ):
+        """캐시 초기화.
+
+        Args:
+            max_entries: 메모리 LRU 최대 항목 수
+            ttl_seconds: 항목 유효 시간(초)
+            db_path: SQLite 파일 경로 (빈 값이면 디스크 캐시 미사용)
+            db_max_entries: SQLite 최대 항목 수 (초과 시 오래된 항목부터 삭제)
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.db_max_entries = db_max_entries
+        self.prompt_version = _prompt_version()
+        self._store = TieredStore("response_cache", max_entries, db_path, db_max_entries, ttl_seconds)
+        self._stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "bypasses": 0, "stores": 0}
+
+    def make_key(self, student: TeacherInputRequest, run_config: Dict[str, Any]) -> str:
+        """정규화된 입력 + 모델/검증 설정 + 프롬프트 버전으로 캐시 키 생성."""
+        return make_request_key(student, run_config, self.prompt_version)
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """캐시 조회 (메모리 → 디스크 순서, 디스크 적중 시 메모리에 올림)."""
+        tier, value = await self._store.get(key)
+        self._stats[f"{tier}_hits" if tier else "misses"] += 1
+        return value
+
+    async def set(self, key: str, value: Dict[str, Any]) -> None:
+        """생성 결과 저장."""
+        self._stats["stores"] += 1
+        await self._store.set(key, value)
+
+    def record_bypass(self) -> None:
+        """요청 헤더로 캐시를 건너뛴 횟수 기록."""
+        self._stats["bypasses"] += 1
+
+    def close(self) -> None:
+        """SQLite 연결 종료."""
+        self._store.close()
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 적중률 및 항목 수 반환."""
+        hits = self._stats["memory_hits"] + self._stats["disk_hits"]
+        lookups = hits + self._stats["misses"]
+        return {
+            **self._stats,
+            **self._store.counters,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            "memory_entries": len(self._store),
+            "disk_enabled": self._store.disk_enabled,
+            "prompt_version": self.prompt_version,
+        }
+
+
+def create_response_cache() -> Optional[ResponseCache]:
+    """설정에 따라 응답 캐시 생성 (비활성화 시 None)."""
+    config = app_config.config
+    if not config["response_cache_enabled"]:
+        return None
+    return ResponseCache(
+        max_entries=config["response_cache_max_entries"],
+        ttl_seconds=config["response_cache_ttl"],
+        db_path=config["response_cache_db_path"],
+        db_max_entries=config["response_cache_db_max_entries"],
+    )
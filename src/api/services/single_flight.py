@@ -0,0 +1,71 @@
+"""동시에 들어온 동일 요청을 하나의 실행으로 병합하는 모듈."""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, TypeVar
+
+T = TypeVar("T")
+
+
+class _Call:
+    """진행 중인 실행과 대기 중인 요청 수."""
+
+    def __init__(self, task: "asyncio.Task[Any]"):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Single-flight 요청 병합.
+
+    같은 키로 실행 중인 작업이 있으면 새로 실행하지 않고 그 결과를 함께 기다림
+    - 실행 결과와 예외는 모든 대기자에게 동일하게 전달
+    - 대기자 한 명이 취소(클라이언트 연결 종료)되어도 공유 실행은 계속 진행
+    - 모든 대기자가 취소되면 공유 실행도 취소
+    """
+
+    def __init__(self):
+        """실행 중인 작업 목록과 통계 초기화."""
+        self._calls: Dict[str, _Call] = {}
+        self._stats = {
+            "executions": 0,   # 실제로 실행된 작업 수
+            "coalesced": 0,    # 실행 중인 작업에 합류한 요청 수 (절약된 업스트림 실행 수)
+            "cancelled_waiters": 0,
+            "abandoned": 0,    # 대기자가 모두 취소되어 중단된 실행 수
+            "max_waiters": 0,
+        }
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """키에 해당하는 실행이 없으면 fn을 실행하고, 있으면 그 결과를 기다림."""
+        call = self._calls.get(key)
+        if call is None:
+            call = _Call(asyncio.ensure_future(fn()))
+            self._calls[key] = call
+            call.task.add_done_callback(lambda _: self._forget(key, call))
+            self._stats["executions"] += 1
+        else:
+            self._stats["coalesced"] += 1
+
+        call.waiters += 1
+        self._stats["max_waiters"] = max(self._stats["max_waiters"], call.waiters)
+        try:
+            # shield: 대기자 취소가 공유 실행으로 전파되지 않도록 보호
+            return await asyncio.shield(call.task)
+        except asyncio.CancelledError:
+            if not call.task.done():
+                self._stats["cancelled_waiters"] += 1
+                if call.waiters == 1:
+                    self._stats["abandoned"] += 1
+                    # 취소가 끝나기 전에 들어온 요청이 중단된 실행에 합류하지 않도록 즉시 제거
+                    self._forget(key, call)
+                    call.task.cancel()
+            raise
+        finally:
+            call.waiters -= 1
+
+    def _forget(self, key: str, call: _Call) -> None:
+        # 이 실행이 등록된 경우만 제거 (같은 키로 새 실행이 등록된 경우 보존)
+        if self._calls.get(key) is call:
+            del self._calls[key]
+
+    def stats(self) -> Dict[str, Any]:
+        """병합 지표 반환."""
+        return {**self._stats, "in_flight": len(self._calls)}
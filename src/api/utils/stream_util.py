@@ -0,0 +1,50 @@
+"""스트리밍 응답 유틸리티 (NDJSON/SSE 직렬화, gzip 압축)."""
+import zlib
+from typing import Any, AsyncIterator, Dict, Optional
+
+import orjson
+
+
+def ndjson_line(data: Any) -> bytes:
+    """객체를 NDJSON 한 줄로 직렬화 (datetime 등은 orjson 기본 처리, 그 외는 문자열)."""
+    return orjson.dumps(data, default=str) + b"\n"
+
+
+def sse_event(event: str, data: Any) -> bytes:
+    """Server-Sent Events 형식의 이벤트 한 개 생성."""
+    return b"event: " + event.encode() + b"\ndata: " + orjson.dumps(data, default=str) + b"\n\n"
+
+
+def _parse_accept_encoding(accept_encoding: str) -> Dict[str, float]:
+    """Accept-Encoding 헤더를 {인코딩: q값} 으로 파싱 (q값이 잘못되면 0으로 취급)."""
+    weights: Dict[str, float] = {}
+    for item in accept_encoding.lower().split(","):
+        coding, *params = [part.strip() for part in item.split(";")]
+        if not coding:
+            continue
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        weights[coding] = q
+    return weights
+
+
+def accepts_gzip(accept_encoding: Optional[str]) -> bool:
+    """Accept-Encoding 헤더가 gzip을 허용하는지 여부 (gzip;q=0은 거부, 명시가 없으면 * 값을 따름)."""
+    if not accept_encoding:
+        return False
+    weights = _parse_accept_encoding(accept_encoding)
+    return weights.get("gzip", weights.get("*", 0.0)) > 0
+
+
+async def gzip_stream(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """청크마다 flush하는 gzip 스트림 (압축해도 완료된 줄은 바로 전달됨)."""
+    compressor = zlib.compressobj(wbits=31)  # 31: gzip 헤더 포함
+    async for chunk in chunks:
+        yield compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+    yield compressor.flush()
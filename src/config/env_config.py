@@ -100,14 +100,44 @@ class EnvConfig:
             "environment": os.getenv("ENVIRONMENT", "local"),
             "debug_mode": os.getenv("DEBUG_MODE", "false").lower() == "true",
             "log_level": os.getenv("LOG_LEVEL", "INFO"),
+            "execution_backend": os.getenv("EXECUTION_BACKEND", "remote").lower(),
+            "inprocess_max_concurrency": int(os.getenv("INPROCESS_MAX_CONCURRENCY", "10")),
+            "verification_mode": os.getenv("VERIFICATION_MODE", "parallel").lower(),
             "langgraph_server_url": os.getenv("LANGGRAPH_SERVER_URL", "http://localhost:8123"),
             "assistant_id": os.getenv("ASSISTANT_ID", "agent"),
+            "langgraph_run_mode": os.getenv("LANGGRAPH_RUN_MODE", "thread").lower(),
+            "langgraph_completion_mode": os.getenv("LANGGRAPH_COMPLETION_MODE", "join").lower(),
+            "langgraph_join_timeout": float(os.getenv("LANGGRAPH_JOIN_TIMEOUT", "300")),
+            # 요청별 처리 제한 시간(초, 기본값이 있어 모든 요청에 마감 적용, 0이면 제한 없음, X-Request-Timeout 헤더로 요청마다 지정 가능)
+            # 마감 시각 이후 그래프가 최선의 결과를 정리해 반환할 때까지 프록시가 더 기다릴 시간(초)
+            "request_timeout": float(os.getenv("REQUEST_TIMEOUT", "120")),
+            "request_deadline_grace": float(os.getenv("REQUEST_DEADLINE_GRACE", "10")),
+            # LangGraph Server 동시 실행 수 자동 조절 (AIMD)
+            "langgraph_initial_concurrency": int(os.getenv("LANGGRAPH_INITIAL_CONCURRENCY", "10")),
+            "langgraph_min_concurrency": int(os.getenv("LANGGRAPH_MIN_CONCURRENCY", "1")),
+            "langgraph_max_concurrency": int(os.getenv("LANGGRAPH_MAX_CONCURRENCY", "100")),
+            "langgraph_queue_size": int(os.getenv("LANGGRAPH_QUEUE_SIZE", "1000")),
+            "langgraph_latency_tolerance": float(os.getenv("LANGGRAPH_LATENCY_TOLERANCE", "2.0")),
             "api_host": os.getenv("API_HOST", "0.0.0.0"),
             "api_port": int(os.getenv("API_PORT", "8000")),
             "cors_origins": cors_origins,
             "cors_allow_credentials": os.getenv("CORS_ALLOW_CREDENTIALS", "true").lower() == "true",
             "cors_allow_methods": cors_methods,
             "cors_allow_headers": cors_headers,
+            # LangGraph Server 통신용 공유 HTTP 커넥션 풀 설정
+            "http_max_connections": int(os.getenv("HTTP_MAX_CONNECTIONS", "100")),
+            "http_max_keepalive_connections": int(os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", "20")),
+            "http_keepalive_expiry": float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "30")),
+            "http2_enabled": os.getenv("HTTP2_ENABLED", "false").lower() == "true",
+            # 배치 작업 API (작업 상태 저장 경로, 동시에 처리할 학생 수)
+            "batch_job_db_path": os.getenv("BATCH_JOB_DB_PATH", "data/batch_jobs.sqlite3"),
+            "batch_job_workers": int(os.getenv("BATCH_JOB_WORKERS", "10")),
+            # 동일 요청 응답 캐시 설정 (DB 경로가 비어 있으면 메모리 캐시만 사용)
+            "response_cache_enabled": os.getenv("RESPONSE_CACHE_ENABLED", "true").lower() == "true",
+            "response_cache_max_entries": int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "1000")),
+            "response_cache_ttl": float(os.getenv("RESPONSE_CACHE_TTL", "86400")),
+            "response_cache_db_path": os.getenv("RESPONSE_CACHE_DB_PATH", ""),
+            "response_cache_db_max_entries": int(os.getenv("RESPONSE_CACHE_DB_MAX_ENTRIES", "10000")),
         }
 
 # 모듈 import 시 자동으로 환경 로드
@@ -63,6 +63,23 @@ VALIDATE_INPUT_PROMPT = """
 }}
 """
 
+# 추가사항 포함 여부 검증 프롬프트 (규칙 기반 검증으로 판단할 수 없을 때만 사용)
+VALIDATE_ADDITIONAL_NOTES_PROMPT = """
+생성된 세부능력 특기사항에 선생님이 입력한 추가사항의 내용이 반영되어 있는지 확인해주세요.
+표현이 달라도 의미가 반영되어 있으면 포함된 것으로 판단하세요.
+
+추가사항:
+{additional_notes}
+
+생성된 세특:
+{generated_content}
+
+다음 형식의 JSON만 응답하세요 (설명 없이):
+{{
+    "additional_notes_included": true/false
+}}
+"""
+
 # 문법 및 어휘 검증 프롬프트
 GRAMMAR_AND_VOCABULARY_CHECK_PROMPT = """
 다음 세부능력 특기사항의 문법과 어휘를 검토해주세요.
@@ -87,8 +104,8 @@ GRAMMAR_AND_VOCABULARY_CHECK_PROMPT = """
     "issues": [
         {{
             "type": "grammar 또는 vocabulary 또는 spelling 또는 inappropriate",
-            "text": "문제가 있는 부분",
-            "suggestion": "수정 제안",
+            "text": "문제가 있는 부분 (세특 원문 그대로)",
+            "suggestion": "text를 그대로 대체할 수정된 표현 (설명 없이 바꿀 어구만)",
             "severity": "high 또는 medium 또는 low"
         }}
     ],
@@ -105,6 +122,113 @@ GRAMMAR_AND_VOCABULARY_CHECK_PROMPT = """
 }}
 """
 
+# 문장 단위 문법 검증 프롬프트 (문법 수정 후 바뀐 문장만 다시 검증)
+GRAMMAR_SENTENCE_CHECK_PROMPT = """
+다음은 세부능력 특기사항에서 수정된 문장들입니다. 각 문장의 문법과 어휘를 검토해주세요.
+
+수정된 문장:
+{sentences}
+
+점검 기준:
+1. 문법: 문장 구조, 조사, 어미가 올바른지
+2. 어휘와 맞춤법: 교육 문서에 적절한 어휘와 올바른 철자인지
+3. 톤: 교육적이고 전문적인 톤을 유지하고 부적절한 표현이 없는지
+
+**중요: 반드시 아래 JSON 형식으로만 응답하세요. 확실한 문제가 아니라면 is_valid를 true로 반환하세요.**
+
+{{
+    "is_valid": true 또는 false,
+    "issues": [
+        {{
+            "type": "grammar 또는 vocabulary 또는 spelling 또는 inappropriate",
+            "text": "문제가 있는 부분 (문장 원문 그대로)",
+            "suggestion": "text를 그대로 대체할 수정된 표현 (설명 없이 바꿀 어구만)",
+            "severity": "high 또는 medium 또는 low"
+        }}
+    ]
+}}
+"""
+
+# 입력 정보 포함 + 문법 통합 검증 프롬프트 (verification_mode="fused")
+FUSED_VERIFICATION_PROMPT = """
+생성된 세부능력 특기사항을 검토하여 (1) 선생님이 입력한 정보가 포함되어 있는지와
+(2) 문법과 어휘가 적절한지를 한 번에 확인해주세요.
+
+선생님 입력 정보:
+- 학생 이름: {name}
+- 학생 번호: {student_id}
+- 과목명: {subject}
+- 2학기 중간 수행평가: {midterm_score}점
+- 2학기 기말 수행평가: {final_score}점
+- 추가사항: {additional_notes}
+
+생성된 세특:
+{generated_content}
+
+입력 정보 검증 규칙 (validation):
+1. 학생 이름과 과목명은 반드시 포함되어야 함
+2. 학생 번호는 포함되지 않아도 됨 (항상 true로 반환)
+3. 중간/기말 점수는 반드시 포함되어야 함
+4. 추가사항이 "없음"이 아닌 경우에만 확인, "없음"이면 항상 true로 반환
+5. 점수는 "50점", "50점을 기록", "50점 획득", "모두 50점" 등 다양한 표현 모두 인정
+
+문법 점검 기준 (grammar):
+1. 문법: 문장 구조, 조사, 어미가 올바른지
+2. 어휘: 교육 문서에 적절한 어휘 사용 여부
+3. 맞춤법: 철자 오류가 없는지
+4. 가독성: 문장이 자연스럽고 이해하기 쉬운지
+5. 톤: 교육적이고 전문적인 톤 유지 여부
+6. 부적절한 표현: 비속어, 은어, 부정적 표현 등이 없는지
+문제가 없거나 확실한 문제가 아니라면 grammar.is_valid를 true로 반환하세요.
+문제의 text에는 세특 원문의 해당 부분을 그대로 옮겨 적고, suggestion에는 text를 그대로 대체할 수정된 표현만 적으세요.
+
+다음 형식의 JSON만 응답하세요 (설명 없이):
+{{
+    "validation": {{
+        "is_valid": true/false,
+        "missing_items": [],
+        "validation_details": {{
+            "name_included": true/false,
+            "student_number_included": true,
+            "subject_included": true/false,
+            "midterm_score_included": true/false,
+            "final_score_included": true/false,
+            "additional_notes_included": true/false
+        }}
+    }},
+    "grammar": {{
+        "is_valid": true/false,
+        "issues": [
+            {{
+                "type": "grammar 또는 vocabulary 또는 spelling 또는 inappropriate",
+                "text": "문제가 있는 부분 (세특 원문 그대로)",
+                "suggestion": "text를 그대로 대체할 수정된 표현 (설명 없이 바꿀 어구만)",
+                "severity": "high 또는 medium 또는 low"
+            }}
+        ],
+        "overall_quality": "excellent 또는 good 또는 fair 또는 poor",
+        "suggestions": "전체적인 개선 제안사항"
+    }}
+}}
+"""
+
+# 누락 정보 보완 프롬프트 (전체 재생성 대신 추가할 문장만 생성)
+REPAIR_MISSING_INPUTS_PROMPT = """
+다음 세부능력 특기사항에 빠진 정보를 보완하는 문장을 작성해주세요.
+
+현재 세특:
+{current_content}
+
+빠진 정보:
+{missing_info}
+
+작성 지침:
+1. 빠진 정보만 자연스럽게 담은 1-2개의 문장을 작성하세요
+2. 현재 세특의 문체와 종결 어미를 그대로 따르세요 (예: ~함, ~음)
+3. 현재 세특의 문장을 다시 쓰지 말고, 덧붙일 문장만 작성하세요
+4. 다른 설명 없이 문장만 출력하세요
+"""
+
 # 문법 수정 재생성 프롬프트
 FIX_GRAMMAR_PROMPT = """
 다음 세부능력 특기사항의 문법과 어휘 문제를 수정해주세요.
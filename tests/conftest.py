@@ -4,3 +4,13 @@ import pytest
 @pytest.fixture(scope="session")
 def anyio_backend():
     return "asyncio"
+
+
+@pytest.fixture(autouse=True)
+def clear_node_memo():
+    # 테스트마다 가짜 모델 응답이 달라지므로 이전 테스트의 검증 결과를 재사용하지 않도록 초기화
+    from agent.utils.memo import node_memo
+
+    node_memo.clear()
+    yield
+    node_memo.clear()
@@ -0,0 +1,81 @@
+import asyncio
+
+import httpx
+import pytest
+
+from src.api.services.adaptive_limiter import AdaptiveConcurrencyLimiter
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_requests_over_limit_wait_in_bounded_queue() -> None:
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_queue=1)
+    release = asyncio.Event()
+
+    async def run():
+        async with limiter.slot():
+            await release.wait()
+
+    running = [asyncio.ensure_future(run()) for _ in range(3)]
+    await asyncio.sleep(0.01)
+
+    assert limiter.stats()["in_flight"] == 2
+    assert limiter.stats()["queue_depth"] == 1
+    with pytest.raises(asyncio.QueueFull):
+        await limiter.acquire()
+
+    release.set()
+    await asyncio.gather(*running)
+    assert limiter.stats()["in_flight"] == 0
+    assert limiter.stats()["rejected"] == 1
+
+
+async def test_cancelled_waiter_leaves_queue() -> None:
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1)
+    await limiter.acquire()
+    waiter = asyncio.ensure_future(limiter.acquire())
+    await asyncio.sleep(0.01)
+
+    waiter.cancel()
+    await asyncio.sleep(0.01)
+    limiter.release()
+
+    assert limiter.stats()["queue_depth"] == 0
+    assert limiter.stats()["in_flight"] == 0
+
+
+def test_limit_grows_additively_and_shrinks_multiplicatively() -> None:
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=10, backoff=0.5)
+    for _ in range(10):
+        limiter.on_result(latency=0.0, overloaded=False)
+    assert limiter.stats()["limit"] == 10
+    for _ in range(10):
+        limiter.on_result(latency=0.0, overloaded=False)
+    assert limiter.stats()["limit"] == 11
+
+    limiter.on_result(latency=1.0, overloaded=False)  # 기준(0초) 대비 지연
+    assert limiter.stats()["limit"] == 5
+
+
+async def test_timeouts_reduce_limit_but_client_errors_do_not() -> None:
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=10, backoff=0.5)
+
+    with pytest.raises(ValueError):
+        async with limiter.slot():
+            raise ValueError("invalid input")
+    assert limiter.stats()["decreases"] == 0
+
+    with pytest.raises(httpx.ReadTimeout):
+        async with limiter.slot():
+            raise httpx.ReadTimeout("timeout")
+    assert limiter.stats()["limit"] == 5
+
+
+def test_mixed_cycle_latencies_do_not_shrink_limit() -> None:
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=10, backoff=0.5)
+    # 수정 없이 끝난 Run(1초)과 수정 단계를 두 번 더 거친 Run(3초)이 섞여도 오류가 없으면 과부하가 아님
+    for index in range(200):
+        limiter.on_result(latency=1.0 if index % 2 == 0 else 3.0, overloaded=False)
+
+    assert limiter.stats()["decreases"] == 0
+    assert limiter.stats()["limit"] > 10
@@ -0,0 +1,95 @@
+import asyncio
+import importlib
+import json
+import time
+
+import pytest
+from langchain_core.messages import AIMessage
+
+from agent.utils.model.model_registry import model_registry
+
+pytestmark = pytest.mark.anyio
+
+MODEL_LATENCY = 0.2
+CONCURRENT_RUNS = 10
+
+CONTENT = "홍길동 학생은 화학 과목에서 중간 수행평가 50점, 기말 수행평가 60점을 기록함."
+GRAMMAR = {"is_valid": True, "issues": []}
+
+
+class FakeModel:
+    """고정 지연 후 프롬프트 종류에 맞는 응답을 돌려주는 모델."""
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def with_structured_output(self, schema, **kwargs):
+        # 구조화 출력 미지원 → 일반 호출 후 파싱 경로 사용
+        raise NotImplementedError
+
+    async def ainvoke(self, prompt, config=None):
+        await asyncio.sleep(MODEL_LATENCY)
+        if "additional_notes_included" in prompt:
+            return AIMessage(content=json.dumps({"additional_notes_included": True}))
+        if "점검 기준" in prompt:
+            return AIMessage(content=json.dumps(GRAMMAR))
+        return AIMessage(content=CONTENT)
+
+
+@pytest.fixture
+def graph(monkeypatch):
+    monkeypatch.setitem(model_registry.factories, "openai", FakeModel)
+    model_registry.clear()
+    yield importlib.import_module("agent.agent").graph
+    model_registry.clear()
+
+
+def make_input(student_id: int, additional_notes=None):
+    return {
+        "teacher_input": {
+            "student_id": student_id,
+            "name": "홍길동",
+            "subject": "화학",
+            "midterm_score": 50,
+            "final_score": 60,
+            "additional_notes": additional_notes,
+        },
+        "generation_status": "pending",
+        "semester": 2,
+        "academic_year": 2025,
+    }
+
+
+async def test_concurrent_runs_overlap_on_event_loop(graph) -> None:
+    started = time.monotonic()
+    result = await graph.ainvoke(make_input(0))
+    single_elapsed = time.monotonic() - started
+
+    assert result["detailed_record"]["content"] == CONTENT
+    assert result["final_approval"] is True
+
+    started = time.monotonic()
+    results = await asyncio.gather(
+        *(graph.ainvoke(make_input(i)) for i in range(CONCURRENT_RUNS))
+    )
+    concurrent_elapsed = time.monotonic() - started
+
+    assert len(results) == CONCURRENT_RUNS
+    # 같은 설정을 쓰는 노드들은 클라이언트 하나를 모든 Run에서 재사용함
+    assert model_registry.stats()["clients"] == 1
+    assert model_registry.stats()["hits"] > 0
+    # N개 동시 실행이 1개 실행 시간과 비슷하게 끝나야 함 (직렬이면 N배)
+    assert concurrent_elapsed < single_elapsed * 2
+
+
+async def test_validation_and_grammar_run_in_parallel(graph) -> None:
+    # 추가사항 확인(LLM)과 문법 검증(LLM)이 모두 필요한 입력
+    started = time.monotonic()
+    result = await graph.ainvoke(make_input(0, additional_notes="과학 동아리에서 실험 설계를 주도함"))
+    elapsed = time.monotonic() - started
+
+    assert result["validation_result"]["details"]["validator"] == "rule+llm"
+    assert result["grammar_result"]["details"]["checker"] == "lint+llm"
+    assert result["final_approval"] is True
+    # 생성 → (입력 검증 ∥ 문법 검증): LLM 3회 호출이지만 임계 경로는 2회
+    assert elapsed < MODEL_LATENCY * 2.5
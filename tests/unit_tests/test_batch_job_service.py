@@ -0,0 +1,94 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from src.api.dto.request_dto import TeacherInputRequest
+from src.api.services.batch_job_service import BatchJobService
+from src.api.services.batch_job_store import BatchJobStore
+
+pytestmark = pytest.mark.anyio
+
+
+def make_request(student_id: int) -> TeacherInputRequest:
+    return TeacherInputRequest(
+        student_id=student_id,
+        name="홍길동",
+        subject="화학",
+        midterm_score=50,
+        final_score=60,
+        semester=2,
+        academic_year=2025,
+    )
+
+
+async def fake_generate(student: TeacherInputRequest):
+    await asyncio.sleep(0.01)
+    if student.student_id == 2:
+        raise HTTPException(status_code=500, detail="세특 생성 결과를 찾을 수 없습니다")
+    return {
+        "student_id": student.student_id,
+        "subject": student.subject,
+        "content": "홍길동 학생은 ...",
+        "generated_at": "2025-01-01T00:00:00",
+        "version": 1,
+    }
+
+
+async def wait_until_completed(service: BatchJobService, job_id: str):
+    for _ in range(100):
+        job = await service.get_job(job_id)
+        if job.status == "completed":
+            return job
+        await service.wait_for_update(job_id, timeout=0.1)
+    raise AssertionError("작업이 끝나지 않음")
+
+
+async def test_job_runs_in_background_and_pages_results(tmp_path) -> None:
+    service = BatchJobService(str(tmp_path / "jobs.sqlite3"), workers=2, generate=fake_generate)
+    await service.start()
+    try:
+        submitted = await service.submit([make_request(student_id) for student_id in range(1, 6)])
+        assert submitted.total == 5
+
+        job = await wait_until_completed(service, submitted.job_id)
+        assert (job.succeeded, job.failed) == (4, 1)
+
+        page = await service.get_results(submitted.job_id, offset=1, limit=2)
+        assert [item.index for item in page.items] == [1, 2]
+        assert page.items[0].status == "failed"
+        assert page.items[0].error == "세특 생성 결과를 찾을 수 없습니다"
+        assert page.items[1].result.student_id == 3
+
+        with pytest.raises(HTTPException):
+            await service.get_job("unknown")
+    finally:
+        await service.stop()
+
+
+async def test_restart_resumes_only_unfinished_students(tmp_path) -> None:
+    db_path = str(tmp_path / "jobs.sqlite3")
+    store = BatchJobStore(db_path)
+    job_id = store.create_job([make_request(student_id).model_dump() for student_id in (1, 3, 4)])
+    store.start_item(job_id, 0)
+    store.finish_item(job_id, 0, result={"student_id": 1})
+    store.start_item(job_id, 1)  # 재시작 전에 처리 중이던 학생
+    assert store.get_job(job_id)["running"] == 1
+    store.close()
+
+    generated = []
+
+    async def recording_generate(student):
+        generated.append(student.student_id)
+        return await fake_generate(student)
+
+    service = BatchJobService(db_path, workers=2, generate=recording_generate)
+    await service.start()
+    try:
+        job = await wait_until_completed(service, job_id)
+    finally:
+        await service.stop()
+
+    assert sorted(generated) == [3, 4]
+    assert job.succeeded == 3
+    assert service.stats()["recovered"] == 2
@@ -0,0 +1,80 @@
+import asyncio
+import gzip
+
+import pytest
+from fastapi import HTTPException
+
+from src.api.dto.request_dto import TeacherInputRequest
+from src.api.services.generate_service import GenerateService
+from src.api.utils.stream_util import accepts_gzip, gzip_stream, ndjson_line
+
+pytestmark = pytest.mark.anyio
+
+# student_id별 생성 시간 (3번은 실패)
+DELAYS = {1: 0.3, 2: 0.1, 3: 0.2}
+
+
+class FakeBackend:
+    async def process_single_student(self, student, deadline=None):
+        await asyncio.sleep(DELAYS[student.student_id])
+        if student.student_id == 3:
+            raise HTTPException(status_code=500, detail="세특 생성 결과를 찾을 수 없습니다")
+        return {
+            "student_id": student.student_id,
+            "subject": student.subject,
+            "content": "홍길동 학생은 ...",
+            "generated_at": "2025-01-01T00:00:00",
+            "version": 1,
+        }
+
+
+def make_request(student_id: int) -> TeacherInputRequest:
+    return TeacherInputRequest(
+        student_id=student_id,
+        name="홍길동",
+        subject="화학",
+        midterm_score=50,
+        final_score=60,
+        semester=2,
+        academic_year=2025,
+    )
+
+
+async def test_results_stream_in_completion_order_with_error_lines() -> None:
+    service = GenerateService()
+    service.backend = FakeBackend()
+    service.cache = None
+
+    items = [item async for item in service.stream_batch_students([make_request(i) for i in (1, 2, 3)])]
+
+    assert [(item["index"], item["status"]) for item in items] == [(1, "success"), (2, "failed"), (0, "success")]
+    assert items[1]["error"] == "세특 생성 결과를 찾을 수 없습니다"
+    assert items[0]["result"]["student_id"] == 2
+
+
+async def test_gzip_stream_decodes_to_ndjson_lines() -> None:
+    async def lines():
+        for index in range(3):
+            yield ndjson_line({"index": index, "content": "세특"})
+
+    compressed = b"".join([chunk async for chunk in gzip_stream(lines())])
+
+    assert gzip.decompress(compressed).decode().splitlines()[2] == '{"index":2,"content":"세특"}'
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        ("gzip", True),
+        ("gzip, deflate, br", True),
+        ("br;q=1.0, gzip;q=0.5", True),
+        ("*", True),
+        ("gzip;q=0", False),
+        ("gzip;q=0.0, deflate", False),
+        ("*;q=0.5, gzip;q=0", False),
+        ("identity", False),
+        (None, False),
+    ],
+)
+def test_accepts_gzip_respects_q_values(header, expected) -> None:
+    assert accepts_gzip(header) is expected
@@ -0,0 +1,130 @@
+import asyncio
+import importlib
+import json
+import time
+
+import pytest
+from langchain_core.messages import AIMessage
+
+from agent.utils.model.model_registry import model_registry
+from agent.utils.rules.run_budget import limit_reason
+from src.api.dto.request_dto import TeacherInputRequest
+from src.api.services.execution_backend import build_run_config
+from src.api.services.response_cache import make_request_key
+
+pytestmark = pytest.mark.anyio
+
+CONTENT = "홍길동 학생은 화학 과목에서 중간 수행평가 50점, 기말 수행평가 60점을 기록함."
+GRAMMAR = {
+    "is_valid": False,
+    "issues": [{"type": "grammar", "text": "없는 표현", "suggestion": "고친 표현", "severity": "medium"}],
+}
+TEACHER_INPUT = {
+    "student_id": 1,
+    "name": "홍길동",
+    "subject": "화학",
+    "midterm_score": 50,
+    "final_score": 60,
+    "additional_notes": None,
+}
+
+
+class SlowRewriteModel:
+    """첫 생성은 바로 반환하고, 이후 재작성은 마감 시각보다 오래 걸리는 모델."""
+
+    rewrites = 0
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def with_structured_output(self, schema, **kwargs):
+        raise NotImplementedError
+
+    async def ainvoke(self, prompt, config=None):
+        if "점검 기준" in prompt:
+            return AIMessage(content=json.dumps(GRAMMAR))
+        SlowRewriteModel.rewrites += 1
+        if SlowRewriteModel.rewrites > 1:
+            await asyncio.sleep(5)
+        return AIMessage(content=CONTENT)
+
+
+class SlowNotesModel:
+    """생성과 문법 검증은 바로 통과시키고, 추가사항 확인만 마감 시각보다 오래 걸리는 모델."""
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def with_structured_output(self, schema, **kwargs):
+        raise NotImplementedError
+
+    async def ainvoke(self, prompt, config=None):
+        if "추가사항의 내용이 반영" in prompt:
+            await asyncio.sleep(5)
+            return AIMessage(content='{"additional_notes_included": true}')
+        if "점검 기준" in prompt:
+            return AIMessage(content='{"is_valid": true, "issues": []}')
+        return AIMessage(content=CONTENT)
+
+
+def test_limit_reason_checks_deadline_first() -> None:
+    expired = {"configurable": {"deadline": time.time() - 1}}
+    assert limit_reason({"llm_call_count": 3}, "fix_grammar", expired) == "deadline"
+    assert limit_reason({"llm_call_count": 3}, "end", expired) is None
+    assert limit_reason({"llm_call_count": 3, "degraded": True}, "fix_grammar") == "deadline"
+    # 검증을 통과했어도 마감 시각 때문에 판정을 생략한 Run은 종료 노드에서 degraded로 표시
+    assert limit_reason({"llm_call_count": 3, "degraded": True}, "end") == "deadline"
+    assert limit_reason({"llm_call_count": 3}, "fix_grammar", {"configurable": {"deadline": None}}) is None
+
+
+def test_deadline_is_not_part_of_request_key() -> None:
+    student = TeacherInputRequest(**TEACHER_INPUT, semester=2, academic_year=2025)
+    assert build_run_config(123.0)["configurable"]["deadline"] == 123.0
+    assert make_request_key(student, build_run_config(123.0)) == make_request_key(student, build_run_config())
+
+
+async def test_slow_fix_returns_degraded_record_before_deadline(monkeypatch) -> None:
+    monkeypatch.setattr("agent.utils.rules.run_budget.DEADLINE_MIN_CYCLE_SECONDS", 0)
+    monkeypatch.setattr("agent.utils.model.deadline.DEADLINE_RESERVE_SECONDS", 0)
+    monkeypatch.setitem(model_registry.factories, "openai", SlowRewriteModel)
+    SlowRewriteModel.rewrites = 0
+    model_registry.clear()
+    graph = importlib.import_module("agent.agent").graph
+
+    started = time.monotonic()
+    result = await graph.ainvoke(
+        {"teacher_input": TEACHER_INPUT, "generation_status": "pending", "semester": 2, "academic_year": 2025},
+        config={"configurable": {"deadline": time.time() + 1.0}},
+    )
+    model_registry.clear()
+
+    assert time.monotonic() - started < 4
+    assert result["termination_reason"] == "deadline"
+    assert result["detailed_record"]["content"] == CONTENT
+    assert result["detailed_record"]["best_effort"] is True
+    assert result["detailed_record"]["degraded"] is True
+
+
+async def test_timed_out_notes_check_is_not_approved(monkeypatch) -> None:
+    monkeypatch.setattr("agent.utils.rules.run_budget.DEADLINE_MIN_CYCLE_SECONDS", 0)
+    monkeypatch.setattr("agent.utils.model.deadline.DEADLINE_RESERVE_SECONDS", 0)
+    monkeypatch.setitem(model_registry.factories, "openai", SlowNotesModel)
+    model_registry.clear()
+    graph = importlib.import_module("agent.agent").graph
+
+    result = await graph.ainvoke(
+        {
+            "teacher_input": {**TEACHER_INPUT, "additional_notes": "실험 보고서를 꼼꼼하게 작성함"},
+            "generation_status": "pending",
+            "semester": 2,
+            "academic_year": 2025,
+        },
+        config={"configurable": {"deadline": time.time() + 1.0}},
+    )
+    model_registry.clear()
+
+    assert result["validation_result"]["details"]["validator"] == "rule+llm(timed_out)"
+    assert result["final_approval"] is False
+    assert result["termination_reason"] == "deadline"
+    assert result["detailed_record"]["degraded"] is True
+    assert result["detailed_record"]["best_effort"] is True
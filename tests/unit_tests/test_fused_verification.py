@@ -0,0 +1,104 @@
+import pytest
+from langchain_core.messages import AIMessage
+
+from agent.agent import route_to_verification, should_regenerate_or_fix
+from agent.utils.dto.verification_schema import FusedVerification
+from agent.utils.model.model_registry import model_registry
+from agent.utils.node.verify_record import verify_detailed_record
+
+pytestmark = pytest.mark.anyio
+
+CONTENT = "홍길동 학생은 화학 과목에서 중간 수행평가 50점, 기말 수행평가 60점을 기록함."
+FUSED = {
+    "validation": {
+        "is_valid": False,
+        "missing_items": ["additional_notes"],
+        "validation_details": {
+            "name_included": True,
+            "subject_included": True,
+            "midterm_score_included": True,
+            "final_score_included": True,
+            "additional_notes_included": False,
+        },
+    },
+    "grammar": {
+        "is_valid": False,
+        "issues": [{"type": "grammar", "text": "기록함", "suggestion": "기록하였음", "severity": "low"}],
+    },
+}
+
+
+def _fake_model(payload):
+    """구조화 출력 호출에 payload(None이면 파싱 불가 응답)를 돌려주는 모델 클래스."""
+
+    class FakeModel:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def with_structured_output(self, schema, include_raw=False):
+            class Runnable:
+                async def ainvoke(self, prompt, config=None):
+                    if payload is None:
+                        return {"raw": AIMessage(content="판단할 수 없습니다"), "parsed": None, "parsing_error": "invalid"}
+                    return {"raw": None, "parsed": FusedVerification.model_validate(payload)}
+
+            return Runnable()
+
+    return FakeModel
+
+
+def _state():
+    return {
+        "teacher_input": {
+            "student_id": 1,
+            "name": "홍길동",
+            "subject": "화학",
+            "midterm_score": 50,
+            "final_score": 60,
+            "additional_notes": "실험 보고서를 꼼꼼하게 작성함",
+        },
+        "detailed_record": {"content": CONTENT, "version": 1},
+    }
+
+
+@pytest.fixture
+def escalate_lint(monkeypatch):
+    # 린트 신뢰도와 관계없이 문법 판정을 LLM 응답으로 받도록 설정
+    monkeypatch.setattr("agent.utils.node.verify_record.GRAMMAR_LINT_CONFIDENCE_THRESHOLD", 1.01)
+    yield
+    model_registry.clear()
+
+
+async def test_fused_verdict_maps_to_both_results(monkeypatch, escalate_lint) -> None:
+    monkeypatch.setitem(model_registry.factories, "openai", _fake_model(FUSED))
+    model_registry.clear()
+
+    state = await verify_detailed_record(_state())
+
+    assert state["validation_result"]["missing_items"] == ["additional_notes"]
+    assert state["validation_result"]["details"]["validator"] == "fused_llm"
+    assert state["grammar_result"]["is_valid"] is False
+    assert [issue["text"] for issue in state["grammar_result"]["issues"]] == ["기록함"]
+    assert state["final_approval"] is False
+    assert state["llm_call_count"] == 1
+    # 누락 항목은 먼저 보완 단계로
+    assert should_regenerate_or_fix(state) == "repair_missing"
+
+
+async def test_fused_parse_failure_is_not_approved(monkeypatch, escalate_lint) -> None:
+    monkeypatch.setitem(model_registry.factories, "openai", _fake_model(None))
+    model_registry.clear()
+
+    state = await verify_detailed_record(_state())
+
+    assert state["validation_result"]["details"]["validator"] == "fused_llm(parse_failed)"
+    assert state["validation_result"]["missing_items"] == ["additional_notes"]
+    assert state["final_approval"] is False
+
+
+def test_route_to_verification_by_mode() -> None:
+    assert route_to_verification({}, {"configurable": {"verification_mode": "fused"}}) == "verify"
+    assert route_to_verification({}, {"configurable": {"verification_mode": "parallel"}}) == [
+        "validate_input",
+        "check_grammar",
+    ]
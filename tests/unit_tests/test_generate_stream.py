@@ -0,0 +1,73 @@
+import json
+import re
+
+import pytest
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+
+from agent.utils.model.model_registry import model_registry
+from src.api.dto.request_dto import TeacherInputRequest
+from src.api.services.generate_service import GenerateService
+from src.api.services.inprocess_graph_service import InProcessGraphService
+
+pytestmark = pytest.mark.anyio
+
+CONTENT = "홍길동 학생은 화학 과목에서 중간 수행평가 50점, 기말 수행평가 60점을 기록함."
+
+
+class StreamingFakeModel(BaseChatModel):
+    """생성 프롬프트에는 세특을 단어 단위로 스트리밍하고, 문법 검증에는 JSON으로 답하는 모델."""
+
+    model_name: str = "fake"
+    temperature: float = 0.0
+
+    @property
+    def _llm_type(self) -> str:
+        return "streaming-fake"
+
+    def _reply(self, messages) -> str:
+        if "점검 기준" in messages[-1].content:
+            return json.dumps({"is_valid": True, "issues": []})
+        return CONTENT
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=self._reply(messages)))])
+
+    async def _astream(self, messages, stop=None, run_manager=None, **kwargs):
+        for token in re.findall(r"\S+\s*", self._reply(messages)):
+            chunk = ChatGenerationChunk(message=AIMessageChunk(content=token))
+            if run_manager:
+                await run_manager.on_llm_new_token(token, chunk=chunk)
+            yield chunk
+
+
+@pytest.fixture
+def service(monkeypatch):
+    monkeypatch.setitem(model_registry.factories, "openai", StreamingFakeModel)
+    model_registry.clear()
+    service = GenerateService()
+    service.backend = InProcessGraphService()
+    service.cache = None
+    yield service
+    model_registry.clear()
+
+
+async def test_stream_emits_tokens_then_node_progress_then_result(service) -> None:
+    request = TeacherInputRequest(
+        student_id=1, name="홍길동", subject="화학", midterm_score=50, final_score=60,
+        semester=2, academic_year=2025,
+    )
+
+    events = [(event, data) async for event, data in service.stream_single_student(request)]
+    kinds = [event for event, _ in events]
+
+    tokens = [data["text"] for event, data in events if event == "token"]
+    assert "".join(tokens) == CONTENT
+    assert kinds.index("token") < kinds.index("node")
+    nodes = {data["node"]: data for event, data in events if event == "node"}
+    assert nodes["generate"]["version"] == 1
+    assert nodes["validate_input"]["input_valid"] is True
+    assert "grammar_issues" in nodes["check_grammar"]
+    assert kinds[-1] == "result"
+    assert events[-1][1]["content"] == CONTENT
@@ -0,0 +1,81 @@
+import pytest
+
+from agent.utils.rules.grammar_lint import lint_record, lint_verdict
+from agent.utils.rules.grammar_patch import patch_record
+
+CLEAN_RECORD = (
+    "화학 수업에서 물질의 구성과 변화에 대한 기본 개념을 성실하게 학습함. "
+    "2학기 중간 수행평가에서 50점, 기말 수행평가에서 60점을 기록하며 꾸준히 향상된 모습을 보임. "
+    "산화와 환원 반응을 주제로 한 모둠 실험에서 실험 절차를 꼼꼼히 확인하고 결과를 정리하는 역할을 맡아 "
+    "친구들과 협력하는 태도가 돋보임. 실험 결과를 해석하는 과정에서 궁금한 점을 스스로 찾아보고 질문하며 "
+    "탐구하려는 자세를 보였음. 화학 반응식을 세우는 데 어려움을 겪었으나 반복 연습을 통해 점차 익숙해짐. "
+    "수업 시간에 제시된 개념을 일상생활의 사례와 연결하여 설명하려고 노력함. "
+    "앞으로 기본 개념을 깊이 있게 복습하고 다양한 문제에 적용해 본다면 더욱 발전할 것으로 기대됨."
+)
+
+
+def test_clean_record_skips_llm() -> None:
+    result = lint_record(CLEAN_RECORD)
+
+    assert result["issues"] == []
+    assert result["escalate"] is False
+
+
+def test_banned_word_escalates() -> None:
+    result = lint_record(CLEAN_RECORD.replace("성실하게", "게으름뱅이처럼"))
+
+    assert result["escalate"] is True
+    assert any(issue["type"] == "inappropriate" for issue in result["issues"])
+
+
+def test_mixed_sentence_endings() -> None:
+    result = lint_record(CLEAN_RECORD.replace("돋보임.", "돋보였다."))
+
+    assert result["escalate"] is True
+    assert any("종결 어미" in issue["suggestion"] for issue in result["issues"])
+
+
+def test_spacing_suggestions() -> None:
+    result = lint_record(CLEAN_RECORD.replace("꾸준히 향상", "꾸준히  향상"))
+
+    suggestions = {issue["text"]: issue["suggestion"] for issue in result["issues"]}
+    assert suggestions["꾸준히  향상된"] == "꾸준히 향상된"
+
+
+def test_nouns_ending_like_particles_are_not_flagged() -> None:
+    result = lint_record(CLEAN_RECORD.replace("친구들과", "친구들과 차이가 있는 사과와"))
+
+    assert not any(issue["type"] == "grammar" for issue in result["issues"])
+
+
+def test_nouns_ending_in_particle_syllable_are_not_flagged() -> None:
+    for phrase in ("높이가", "길이가", "놀이가", "문제 풀이가", "결과와", "성과와"):
+        result = lint_record(CLEAN_RECORD.replace("친구들과", f"{phrase} 친구들과"))
+
+        assert not any(issue["type"] == "grammar" for issue in result["issues"]), phrase
+
+
+@pytest.mark.parametrize("phrase", ["학생이가", "결과를을"])
+def test_doubled_particle_escalates_without_suggestion(phrase) -> None:
+    result = lint_record(CLEAN_RECORD.replace("친구들과", f"{phrase} 친구들과"))
+
+    assert result["escalate"] is True
+    assert [suspect["text"] for suspect in result["suspects"]] == [phrase]
+    assert result["suspects"][0]["suggestion"] == ""
+    assert not any(issue["type"] == "grammar" for issue in result["issues"])
+
+
+@pytest.mark.parametrize("phrase", ["어린이가 좋아하는 실험", "고양이가 등장하는 실험"])
+def test_particle_suspects_are_not_patched(phrase) -> None:
+    content = CLEAN_RECORD.replace("친구들과", f"{phrase}에서 친구들과")
+    verdict = lint_verdict(lint_record(content))
+
+    assert verdict["is_valid"] is True
+    assert patch_record(content, verdict["issues"])["content"] == content
+
+
+def test_short_record_fails_length() -> None:
+    result = lint_record("화학 수업에 성실하게 참여함.")
+
+    assert result["escalate"] is True
+    assert any(issue["type"] == "length" for issue in result["issues"])
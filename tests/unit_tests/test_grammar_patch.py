@@ -0,0 +1,60 @@
+import pytest
+
+from agent.utils.model.model_registry import model_registry
+from agent.utils.node.fix_grammer import fix_grammar_and_regenerate
+from agent.utils.rules.grammar_patch import patch_record
+
+pytestmark = pytest.mark.anyio
+
+CONTENT = "홍길동 학생은  화학 실험에 적극적으로 참여함. 실험 보고서를을 꼼꼼히 작성함."
+
+
+def issue(text, suggestion, severity="medium"):
+    return {"type": "grammar", "text": text, "suggestion": suggestion, "severity": severity}
+
+
+def test_exact_unique_spans_are_replaced() -> None:
+    result = patch_record(CONTENT, [issue("학생은  화학", "학생은 화학", "low"), issue("보고서를을", "보고서를")])
+
+    assert result["content"] == "홍길동 학생은 화학 실험에 적극적으로 참여함. 실험 보고서를 꼼꼼히 작성함."
+    assert len(result["applied"]) == 2
+    assert result["unpatched"] == []
+
+
+def test_ambiguous_overlapping_and_instruction_issues_are_left_for_llm() -> None:
+    issues = [
+        issue("실험", "실습"),  # 두 번 나옴
+        issue("참여함", "~함/~음 형태로 종결 어미 통일"),  # 수정 지시
+        issue("적극적으로 참여함", "적극 참여함"),
+        issue("참여함. 실험", "참여함. 또한 실험"),  # 앞 문제와 겹침
+        issue("", "300-500자 내외로 조정", "medium"),
+    ]
+
+    result = patch_record(CONTENT, issues)
+
+    assert [item["text"] for item in result["applied"]] == ["적극적으로 참여함"]
+    assert len(result["unpatched"]) == 4
+
+
+class FailingModel:
+    def __init__(self, *args, **kwargs):
+        pass
+
+    async def ainvoke(self, prompt, config=None):
+        raise AssertionError("치환으로 해결되는 문제에 LLM을 호출함")
+
+
+async def test_fix_node_skips_llm_when_every_issue_is_patched(monkeypatch) -> None:
+    monkeypatch.setitem(model_registry.factories, "openai", FailingModel)
+    model_registry.clear()
+    state = {
+        "detailed_record": {"student_id": 1, "subject": "화학", "content": CONTENT, "generated_at": "", "version": 1},
+        "grammar_result": {"is_valid": False, "issues": [issue("보고서를을", "보고서를")], "details": {}},
+    }
+
+    result = await fix_grammar_and_regenerate(state)
+    model_registry.clear()
+
+    assert "보고서를 꼼꼼히" in result["detailed_record"]["content"]
+    assert result["detailed_record"]["version"] == 2
+    assert result["grammar_result"]["details"]["llm_rewrite"] is False
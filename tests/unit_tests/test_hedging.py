@@ -0,0 +1,77 @@
+import asyncio
+import time
+
+import pytest
+
+from agent.utils.model.hedging import HedgedModel, NodeHedger
+
+pytestmark = pytest.mark.anyio
+
+
+class SlowOnceModel:
+    """첫 호출만 오래 걸리고 이후 호출은 바로 응답하는 모델."""
+
+    def __init__(self):
+        self.calls = 0
+        self.cancelled = 0
+
+    async def ainvoke(self, prompt, config=None):
+        self.calls += 1
+        call = self.calls
+        if call == 1:
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                self.cancelled += 1
+                raise
+        return f"응답 {call}"
+
+
+def _warm_hedger(**kwargs) -> NodeHedger:
+    hedger = NodeHedger("generate", min_samples=5, **kwargs)
+    for _ in range(5):
+        hedger.record(0.05)
+    return hedger
+
+
+async def test_hedge_fires_after_percentile_and_cancels_loser() -> None:
+    model = SlowOnceModel()
+    hedger = _warm_hedger(max_rate=1.0)
+
+    started = time.monotonic()
+    result = await HedgedModel(model, hedger).ainvoke("프롬프트")
+
+    assert result == "응답 2"
+    assert time.monotonic() - started < 1
+    await asyncio.sleep(0)
+    assert model.cancelled == 1
+    stats = hedger.stats()
+    assert (stats["fired"], stats["won"]) == (1, 1)
+
+
+async def test_hedge_goes_to_alternate_provider() -> None:
+    primary, alternate = SlowOnceModel(), SlowOnceModel()
+    alternate.calls = 1  # 대체 provider는 바로 응답
+    hedger = _warm_hedger(max_rate=1.0)
+
+    assert await HedgedModel(primary, hedger, alternate).ainvoke("프롬프트") == "응답 2"
+    assert primary.calls == 1
+
+
+async def test_hedge_rate_is_capped() -> None:
+    hedger = _warm_hedger(max_rate=0.0)
+    slow = SlowOnceModel()
+    task = asyncio.ensure_future(HedgedModel(slow, hedger).ainvoke("프롬프트"))
+    await asyncio.sleep(0.3)
+    assert slow.calls == 1  # 한도 0이면 중복 호출하지 않음
+    task.cancel()
+    assert hedger.stats()["capped"] == 1
+
+
+def test_no_hedging_without_enough_samples() -> None:
+    hedger = NodeHedger("generate", min_samples=3)
+    hedger.record(1.0)
+    assert hedger.hedge_delay() is None
+    hedger.record(2.0)
+    hedger.record(3.0)
+    assert hedger.hedge_delay() == 3.0
@@ -0,0 +1,52 @@
+import httpx
+import pytest
+
+from src.api.config.app_config import app_config
+from src.api.services.batch_job_service import batch_job_service
+from src.api.services.langgraph_service import langgraph_service
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def mock_upstream(monkeypatch):
+    """공유 풀의 실제 transport를 LangGraph Server 응답을 흉내 내는 MockTransport로 교체."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"thread_id": "thread-1"})
+
+    monkeypatch.setattr(httpx, "AsyncHTTPTransport", lambda **kwargs: httpx.MockTransport(handler))
+
+    async def noop():
+        return None
+
+    # 배치 작업 워커/SQLite는 이 테스트와 무관하므로 실행하지 않음
+    monkeypatch.setattr(batch_job_service, "start", noop)
+    monkeypatch.setattr(batch_job_service, "stop", noop)
+
+
+async def test_lifespan_shares_one_client_and_counts_requests(mock_upstream) -> None:
+    pool = app_config.http_client_pool
+
+    async with app_config._lifespan(app_config.app):
+        client = langgraph_service.client
+        assert pool.client is client
+        assert pool.start() is client
+
+        assert await langgraph_service.create_thread() == "thread-1"
+        assert await langgraph_service.create_thread() == "thread-1"
+
+        # 요청마다 새 클라이언트를 만들지 않고 같은 클라이언트(커넥션 풀)를 재사용
+        assert langgraph_service.client is client
+        stats = pool.stats()
+        assert stats["started"] is True
+        assert stats["total_requests"] == 2
+        assert stats["failed_requests"] == 0
+        assert stats["in_flight"] == 0
+
+    # lifespan 종료 시 클라이언트를 닫고 서비스에서 분리
+    assert client.is_closed
+    assert pool.client is None
+    assert pool.stats() == {"started": False}
+    with pytest.raises(RuntimeError):
+        langgraph_service.client
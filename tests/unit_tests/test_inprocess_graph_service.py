@@ -0,0 +1,94 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+from langchain_core.messages import AIMessageChunk
+
+from src.api.dto.request_dto import TeacherInputRequest
+from src.api.services.inprocess_graph_service import InProcessGraphService
+
+pytestmark = pytest.mark.anyio
+
+RECORD = {
+    "student_id": 1,
+    "subject": "화학",
+    "content": "홍길동 학생은 ...",
+    "generated_at": "2025-01-01T00:00:00",
+    "version": 1,
+}
+
+
+class StubGraph:
+    """컴파일된 graph 대신 받은 입력/config를 기록하고 동시 실행 수를 재는 그래프."""
+
+    def __init__(self):
+        self.configs = []
+        self.running = 0
+        self.max_running = 0
+
+    async def ainvoke(self, input, config=None):
+        self.configs.append(config)
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(0.05)
+        self.running -= 1
+        return {**input, "detailed_record": RECORD}
+
+    async def astream(self, input, config=None, stream_mode=None):
+        self.configs.append(config)
+        yield "messages", (AIMessageChunk(content="홍길동 "), {"langgraph_node": "generate"})
+        yield "messages", (AIMessageChunk(content='{"is_valid": true}'), {"langgraph_node": "check_grammar"})
+        yield "updates", {"generate": {"detailed_record": RECORD}}
+
+
+def make_service(max_concurrency: int = 2) -> InProcessGraphService:
+    service = InProcessGraphService(max_concurrency=max_concurrency)
+    service._graph = StubGraph()
+    return service
+
+
+def make_student() -> TeacherInputRequest:
+    return TeacherInputRequest(
+        student_id=1,
+        name="홍길동",
+        subject="화학",
+        midterm_score=50,
+        final_score=60,
+        semester=2,
+        academic_year=2025,
+    )
+
+
+async def test_process_returns_record_within_concurrency_bound() -> None:
+    service = make_service(max_concurrency=2)
+
+    records = await asyncio.gather(*(service.process_single_student(make_student(), 123.0) for _ in range(5)))
+
+    assert records == [RECORD] * 5
+    assert service.graph.max_running == 2
+    assert all(config["configurable"]["deadline"] == 123.0 for config in service.graph.configs)
+    stats = service.stats()
+    assert (stats["completed"], stats["failed"], stats["in_flight"]) == (5, 0, 0)
+
+
+async def test_process_without_record_fails() -> None:
+    service = make_service()
+
+    async def empty(input, config=None):
+        return {}
+
+    service.graph.ainvoke = empty
+    with pytest.raises(HTTPException) as excinfo:
+        await service.process_single_student(make_student())
+    assert excinfo.value.status_code == 500
+    assert service.stats()["failed"] == 1
+
+
+async def test_stream_relays_generate_tokens_and_updates() -> None:
+    service = make_service()
+
+    events = [event async for event in service.stream_single_student(make_student())]
+
+    assert events == [("token", "홍길동 "), ("update", {"generate": {"detailed_record": RECORD}})]
+    assert "deadline" not in service.graph.configs[0]["configurable"]
+    assert service.stats()["completed"] == 1
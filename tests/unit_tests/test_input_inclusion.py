@@ -0,0 +1,99 @@
+import pytest
+
+from agent.utils.rules.input_inclusion import check_input_inclusion
+
+
+def make_input(midterm: int = 50, final: int = 60, notes=None):
+    return {
+        "student_id": 1,
+        "name": "홍길동",
+        "subject": "화학",
+        "midterm_score": midterm,
+        "final_score": final,
+        "additional_notes": notes,
+    }
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "홍길동 학생은 화학 수업에서 중간 수행평가 50점, 기말 수행평가 60점을 기록함.",
+        "홍길동은 화학 과목 중간 수행평가에서 50 점을 획득하고 기말에서는 60점을 받음.",
+        "화학 시간에 길동이는 중간 50점, 기말 60점으로 꾸준히 성장함.",
+    ],
+)
+def test_all_items_included(content) -> None:
+    result = check_input_inclusion(make_input(), content)
+
+    assert result["conclusive"] is True
+    assert result["is_valid"] is True
+    assert result["missing_items"] == []
+
+
+def test_same_scores_mentioned_once() -> None:
+    content = "홍길동 학생은 화학 중간·기말 수행평가에서 모두 50점을 기록함."
+
+    result = check_input_inclusion(make_input(midterm=50, final=50), content)
+
+    assert result["is_valid"] is True
+
+
+def test_missing_final_score_is_conclusive() -> None:
+    # 100점 안의 "00점"을 0점으로 읽지 않아야 함
+    content = "홍길동 학생은 화학 중간 수행평가에서 100점을 기록함."
+
+    result = check_input_inclusion(make_input(midterm=100, final=0), content)
+
+    assert result["conclusive"] is True
+    assert result["is_valid"] is False
+    assert result["missing_items"] == ["final_score"]
+
+
+def test_paraphrased_notes_need_llm() -> None:
+    content = "홍길동 학생은 화학 중간 50점, 기말 60점을 기록했으며 수업 몰입도를 높이면 더 성장할 것임."
+
+    result = check_input_inclusion(
+        make_input(notes="수업에 좀 더 집중할 필요가 있어 보임"), content
+    )
+
+    assert result["conclusive"] is False
+    assert result["validation_details"]["additional_notes_included"] is None
+
+
+def test_notes_tokens_found() -> None:
+    content = "홍길동 학생은 화학 중간 50점, 기말 60점을 기록함. 실험 보고서도 꼼꼼히 작성함."
+
+    result = check_input_inclusion(
+        make_input(notes="실험 보고서를 꼼꼼히 작성함"), content
+    )
+
+    assert result["is_valid"] is True
+
+
+@pytest.mark.parametrize(
+    ("notes", "content"),
+    [
+        ("집중력이 부족함", "홍길동 학생은 화학 중간 50점, 기말 60점을 기록함. 집중력이 뛰어나 부족함 없이 참여함."),
+        ("금상 수상", "홍길동 학생은 화학 중간 50점, 기말 60점을 기록함. 수상 경력 없음."),
+        ("집중력이 부족함", "홍길동 학생은 화학 중간 50점, 기말 60점을 기록함. 집중력이 부족함 없이 참여함."),
+    ],
+)
+def test_negated_notes_need_llm(notes, content) -> None:
+    result = check_input_inclusion(make_input(notes=notes), content)
+
+    assert result["conclusive"] is False
+    assert result["validation_details"]["additional_notes_included"] is None
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "홍길동 학생은 화학 중간 50점, 기말 60점을 기록함. 봉사활동에서 20점을 받음.",
+        "홍길동 학생은 화학 중간 50점, 기말 60점을 기록함. 봉사활동 120시간을 채움.",
+    ],
+)
+def test_mismatched_number_or_unit_needs_llm(content) -> None:
+    result = check_input_inclusion(make_input(notes="봉사활동 20시간"), content)
+
+    assert result["conclusive"] is False
+    assert result["validation_details"]["additional_notes_included"] is None
@@ -0,0 +1,79 @@
+import importlib
+import json
+
+import pytest
+from langchain_core.messages import AIMessage
+
+from agent.utils.model.model_registry import model_registry
+from agent.utils.node.repair_record import get_repair_stats
+from agent.utils.rules.input_repair import repair_deterministic
+
+pytestmark = pytest.mark.anyio
+
+TEACHER_INPUT = {
+    "student_id": 1,
+    "name": "홍길동",
+    "subject": "화학",
+    "midterm_score": 50,
+    "final_score": 60,
+    "additional_notes": None,
+}
+
+# 기말 점수가 빠진 세특
+CONTENT = "홍길동 학생은 화학 과목에서 중간 수행평가 50점을 기록함. 실험 보고서를 꼼꼼히 작성함."
+
+
+def test_missing_score_is_inserted_in_record_style() -> None:
+    result = repair_deterministic(TEACHER_INPUT, CONTENT, ["final_score"])
+    assert result["content"] == (
+        "홍길동 학생은 화학 과목에서 중간 수행평가 50점을 기록함. "
+        "2학기 기말 수행평가에서 60점을 기록함. 실험 보고서를 꼼꼼히 작성함."
+    )
+    assert result["remaining"] == []
+
+    declarative = repair_deterministic(TEACHER_INPUT, "본 학생은 화학에 흥미를 보였다.", ["name", "midterm_score"])
+    assert declarative["content"] == "홍길동 학생은 화학에 흥미를 보였다. 2학기 중간 수행평가에서 50점을 기록하였다."
+
+
+def test_items_without_a_rule_are_left_for_llm() -> None:
+    result = repair_deterministic(TEACHER_INPUT, "화학 실험을 주도함.", ["name", "additional_notes"])
+    assert result["remaining"] == ["name", "additional_notes"]
+
+
+class CountingModel:
+    """생성은 기말 점수를 빠뜨리고, 문법 검증은 통과시키는 모델."""
+
+    generate_calls = 0
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    async def ainvoke(self, prompt, config=None):
+        if "점검 기준" in prompt:
+            return AIMessage(content=json.dumps({"is_valid": True, "issues": []}))
+        CountingModel.generate_calls += 1
+        return AIMessage(content=CONTENT)
+
+    def with_structured_output(self, schema, **kwargs):
+        raise NotImplementedError
+
+
+async def test_graph_repairs_instead_of_regenerating(monkeypatch) -> None:
+    monkeypatch.setitem(model_registry.factories, "openai", CountingModel)
+    model_registry.clear()
+    graph = importlib.import_module("agent.agent").graph
+    attempts_before = get_repair_stats()["attempts"]
+
+    result = await graph.ainvoke({
+        "teacher_input": TEACHER_INPUT,
+        "generation_status": "pending",
+        "semester": 2,
+        "academic_year": 2025,
+    })
+    model_registry.clear()
+
+    assert CountingModel.generate_calls == 1
+    assert "60점" in result["detailed_record"]["content"]
+    assert result["detailed_record"]["version"] == 2
+    assert result["validation_result"]["is_valid"] is True
+    assert get_repair_stats()["attempts"] == attempts_before + 1
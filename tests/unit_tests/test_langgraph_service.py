@@ -0,0 +1,206 @@
+import asyncio
+import json
+import time
+import uuid
+
+import httpx
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.responses import StreamingResponse
+
+from src.api.dto.request_dto import TeacherInputRequest
+from src.api.services.langgraph_service import LangGraphService
+
+pytestmark = pytest.mark.anyio
+
+RUN_SECONDS = 0.35
+
+FINAL_STATE = {
+    "detailed_record": {
+        "student_id": 1,
+        "subject": "화학",
+        "content": "홍길동 학생은 ...",
+        "generated_at": "2025-01-01T00:00:00",
+        "version": 1,
+    }
+}
+
+
+def make_stand_in_server(supports_join: bool = True):
+    """LangGraph Server API 일부를 흉내 내는 로컬 서버 (Run은 RUN_SECONDS 후 완료)."""
+    app = FastAPI()
+    app.state.requests = 0
+    runs = {}
+
+    @app.middleware("http")
+    async def count_requests(request, call_next):
+        app.state.requests += 1
+        return await call_next(request)
+
+    @app.post("/threads")
+    async def create_thread():
+        return {"thread_id": str(uuid.uuid4())}
+
+    @app.post("/threads/{thread_id}/runs")
+    async def create_run(thread_id: str):
+        run_id = str(uuid.uuid4())
+        runs[run_id] = time.monotonic() + RUN_SECONDS
+        return {"run_id": run_id}
+
+    @app.get("/threads/{thread_id}/runs/{run_id}")
+    async def get_run(thread_id: str, run_id: str):
+        done = time.monotonic() >= runs[run_id]
+        return {"run_id": run_id, "status": "success" if done else "running"}
+
+    if supports_join:
+        @app.get("/threads/{thread_id}/runs/{run_id}/join")
+        async def join_run(thread_id: str, run_id: str):
+            await asyncio.sleep(max(0.0, runs[run_id] - time.monotonic()))
+            return FINAL_STATE
+
+    @app.post("/runs/wait")
+    async def wait_stateless_run():
+        await asyncio.sleep(RUN_SECONDS)
+        return FINAL_STATE
+
+    @app.post("/runs/stream")
+    async def stream_stateless_run():
+        async def events():
+            for token in ("홍길동 ", "학생은 "):
+                chunk = {"type": "AIMessageChunk", "content": token}
+                yield f"event: messages\ndata: {json.dumps([chunk, {'langgraph_node': 'generate'}])}\n\n"
+            grammar = {"type": "AIMessageChunk", "content": '{"is_valid": true}'}
+            yield f"event: messages\ndata: {json.dumps([grammar, {'langgraph_node': 'check_grammar'}])}\n\n"
+            yield f"event: updates\ndata: {json.dumps({'generate': FINAL_STATE})}\n\n"
+
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    @app.get("/threads/{thread_id}/state")
+    async def get_state(thread_id: str):
+        return {"values": FINAL_STATE}
+
+    return app
+
+
+def make_service(server: FastAPI, mode: str, run_mode: str = "thread") -> LangGraphService:
+    client = httpx.AsyncClient(transport=httpx.ASGITransport(app=server))
+    service = LangGraphService(client=client)
+    service.server_url = "http://langgraph"
+    service.completion_mode = mode
+    service.run_mode = run_mode
+    return service
+
+
+def make_student() -> TeacherInputRequest:
+    return TeacherInputRequest(
+        student_id=1,
+        name="홍길동",
+        subject="화학",
+        midterm_score=50,
+        final_score=60,
+        semester=2,
+        academic_year=2025,
+    )
+
+
+async def run_once(server: FastAPI, mode: str):
+    service = make_service(server, mode)
+    started = time.monotonic()
+    record = await service.process_single_student(make_student())
+    return record, time.monotonic() - started
+
+
+async def test_join_mode_saves_requests_and_latency() -> None:
+    poll_server = make_stand_in_server()
+    poll_record, poll_elapsed = await run_once(poll_server, "poll")
+
+    join_server = make_stand_in_server()
+    join_record, join_elapsed = await run_once(join_server, "join")
+
+    assert poll_record == join_record == FINAL_STATE["detailed_record"]
+    # thread 생성 + run 생성 + join 1회
+    assert join_server.state.requests == 3
+    assert join_server.state.requests < poll_server.state.requests
+    # 폴링 간격(0.3초)만큼 늦게 끝나지 않음
+    assert join_elapsed < poll_elapsed
+    assert join_elapsed < RUN_SECONDS + 0.2
+
+
+async def test_join_mode_falls_back_to_polling() -> None:
+    server = make_stand_in_server(supports_join=False)
+    record, _ = await run_once(server, "join")
+
+    assert record == FINAL_STATE["detailed_record"]
+    assert server.state.requests > 3
+
+
+async def test_stateless_mode_uses_single_request() -> None:
+    server = make_stand_in_server()
+    service = make_service(server, "join", run_mode="stateless")
+
+    record = await service.process_single_student(make_student())
+
+    assert record == FINAL_STATE["detailed_record"]
+    assert server.state.requests == 1
+    assert service.stats()["upstream_requests"]["stateless"]["avg_per_generation"] == 1
+
+
+async def test_stream_relays_generate_tokens_and_updates() -> None:
+    service = make_service(make_stand_in_server(), "join")
+
+    events = [event async for event in service.stream_single_student(make_student())]
+
+    assert events == [("token", "홍길동 "), ("token", "학생은 "), ("update", {"generate": FINAL_STATE})]
+
+
+async def test_agent_stats_are_read_from_graph_server_route() -> None:
+    from agent.utils.stats import collect_stats
+    from agent.webapp import app as graph_server_routes
+
+    service = make_service(graph_server_routes, "join")
+
+    stats = await service.agent_stats()
+
+    assert set(stats) == set(collect_stats())
+    assert "model_registry" in stats and "node_memo" in stats
+
+
+async def test_agent_stats_report_unreachable_graph_server() -> None:
+    service = make_service(FastAPI(), "join")
+
+    stats = await service.agent_stats()
+
+    assert "HTTPStatusError" in stats["error"]
+
+
+def make_deadline_exceeded_server() -> FastAPI:
+    """첫 세특을 만들기 전에 마감 시각이 지난 Run의 에러를 돌려주는 서버."""
+    from agent.utils.model.deadline import DeadlineExceeded
+
+    app = FastAPI()
+    error = {"error": DeadlineExceeded.__name__, "message": "요청 마감 시각이 지나 LLM 호출을 생략했습니다"}
+
+    @app.post("/runs/wait")
+    async def wait_stateless_run():
+        return {"__error__": error}
+
+    @app.post("/runs/stream")
+    async def stream_stateless_run():
+        async def events():
+            yield f"event: error\ndata: {json.dumps(error)}\n\n"
+
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    return app
+
+
+async def test_deadline_exceeded_run_maps_to_gateway_timeout() -> None:
+    service = make_service(make_deadline_exceeded_server(), "join", run_mode="stateless")
+
+    with pytest.raises(HTTPException) as wait_error:
+        await service.process_single_student(make_student())
+    with pytest.raises(HTTPException) as stream_error:
+        _ = [event async for event in service.stream_single_student(make_student())]
+
+    assert wait_error.value.status_code == 504
+    assert stream_error.value.status_code == 504
@@ -0,0 +1,76 @@
+import json
+
+import pytest
+from langchain_core.messages import AIMessage
+
+from agent.utils.memo import NodeMemo, node_memo
+from agent.utils.model.model_registry import model_registry
+from agent.utils.node.validate_input_inclusion import validate_input_inclusion
+
+pytestmark = pytest.mark.anyio
+
+TEACHER_INPUT = {
+    "student_id": 1,
+    "name": "홍길동",
+    "subject": "화학",
+    "midterm_score": 50,
+    "final_score": 60,
+    "additional_notes": "실험 보고서 우수",
+}
+CONTENT = "홍길동 학생은 화학 과목에서 중간 수행평가 50점, 기말 수행평가 60점을 기록함. 탐구 결과를 잘 정리함."
+
+
+async def test_memory_lru_and_disk_store(tmp_path) -> None:
+    memo = NodeMemo(max_entries=1, db_path=str(tmp_path / "memo.sqlite3"))
+    first = memo.make_key("check_grammar", "v1", "openai", CONTENT)
+    second = memo.make_key("check_grammar", "v1", "openai", CONTENT + " 추가함.")
+
+    # 공백 차이는 같은 키, 프롬프트 버전이 다르면 다른 키
+    assert memo.make_key("check_grammar", "v1", "openai", CONTENT.replace(" ", "  ")) == first
+    assert memo.make_key("check_grammar", "v2", "openai", CONTENT) != first
+
+    await memo.set("check_grammar", first, {"is_valid": True})
+    await memo.set("check_grammar", second, {"is_valid": False})
+    assert await memo.get("check_grammar", first) == {"is_valid": True}  # LRU에서 밀려나 디스크에서 조회
+    memo.close()
+
+    # 재시작 후에도 디스크에서 재사용
+    restarted = NodeMemo(max_entries=10, db_path=str(tmp_path / "memo.sqlite3"))
+    assert await restarted.get("check_grammar", second) == {"is_valid": False}
+    assert await restarted.get("check_grammar", "unknown") is None
+    assert restarted.stats()["nodes"]["check_grammar"] == {
+        "memory_hits": 0, "disk_hits": 1, "misses": 1, "stores": 0, "hit_rate": 0.5
+    }
+    restarted.close()
+
+
+class NotesModel:
+    """추가사항 확인 호출 수를 세는 모델."""
+
+    calls = 0
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def with_structured_output(self, schema, **kwargs):
+        raise NotImplementedError
+
+    async def ainvoke(self, prompt, config=None):
+        NotesModel.calls += 1
+        return AIMessage(content=json.dumps({"additional_notes_included": True}))
+
+
+async def test_repeated_validation_reuses_llm_verdict(monkeypatch) -> None:
+    monkeypatch.setitem(model_registry.factories, "openai", NotesModel)
+    model_registry.clear()
+    state = {"teacher_input": TEACHER_INPUT, "detailed_record": {"content": CONTENT}}
+
+    first = await validate_input_inclusion(state)
+    second = await validate_input_inclusion(state)
+    model_registry.clear()
+
+    assert NotesModel.calls == 1
+    assert first["validation_result"]["details"]["validator"] == "rule+llm"
+    assert second["validation_result"]["details"]["validator"] == "rule+memo"
+    assert second["validation_result"]["is_valid"] is True
+    assert node_memo.stats()["nodes"]["validate_input"]["hit_rate"] == 0.5
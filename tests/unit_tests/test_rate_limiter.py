@@ -0,0 +1,110 @@
+import asyncio
+import time
+
+import pytest
+from langchain_core.messages import AIMessage
+
+from agent.utils.model.rate_limiter import (
+    ProviderRateLimiter,
+    RateLimitedModel,
+    estimate_tokens,
+)
+
+pytestmark = pytest.mark.anyio
+
+
+class RateLimitError(Exception):
+    status_code = 429
+
+    def __init__(self, retry_after: str):
+        super().__init__("rate limited")
+        self.response = type("Response", (), {"headers": {"retry-after": retry_after}})()
+
+
+class FlakyModel:
+    """첫 호출은 429, 이후는 정상 응답하는 모델."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def ainvoke(self, prompt):
+        self.calls += 1
+        if self.calls == 1:
+            raise RateLimitError("0.2")
+        return AIMessage(content="ok", usage_metadata={"input_tokens": 5, "output_tokens": 5, "total_tokens": 10})
+
+
+def test_estimate_tokens_counts_hangul_per_character() -> None:
+    assert estimate_tokens("홍길동 학생") == 5 + 1 // 4 + 1
+    assert estimate_tokens("a" * 40) == 11
+
+
+async def test_tokens_per_minute_bucket_throttles_calls() -> None:
+    # 분당 60000 토큰 = 초당 1000 토큰
+    limiter = ProviderRateLimiter("test", tpm=60000)
+    async with limiter.slot(60000):
+        pass
+
+    started = time.monotonic()
+    async with limiter.slot(200):
+        pass
+    assert time.monotonic() - started >= 0.18
+
+
+async def test_waiting_calls_are_served_in_arrival_order() -> None:
+    limiter = ProviderRateLimiter("test", tpm=60000)
+    async with limiter.slot(60000):
+        pass
+    order = []
+
+    async def call(name, tokens):
+        async with limiter.slot(tokens):
+            order.append(name)
+
+    large = asyncio.ensure_future(call("large", 300))
+    await asyncio.sleep(0.01)
+    await asyncio.gather(large, call("small", 10))
+
+    assert order == ["large", "small"]
+
+
+async def test_429_pauses_provider_and_retries_after_retry_after() -> None:
+    limiter = ProviderRateLimiter("test", rpm=1000)
+    model = RateLimitedModel(FlakyModel(), limiter)
+
+    started = time.monotonic()
+    result = await model.ainvoke("프롬프트")
+
+    assert result.content == "ok"
+    assert time.monotonic() - started >= 0.19
+    stats = limiter.stats()
+    assert stats["rate_limited"] == 1
+    assert stats["used_tokens"] == 10
+
+
+async def test_cancelled_waiter_refunds_tokens() -> None:
+    limiter = ProviderRateLimiter("test", rpm=10, tpm=60000, max_concurrency=1)
+    release = asyncio.Event()
+
+    async def hold():
+        async with limiter.slot(100):
+            await release.wait()
+
+    holder = asyncio.ensure_future(hold())
+    await asyncio.sleep(0.01)
+
+    async def wait_for_slot():
+        async with limiter.slot(30000):
+            pass
+
+    # 버킷에서 차감된 뒤 동시 호출 슬롯을 기다리다 취소된 호출 (헤징에서 진 호출, 마감 시각 초과)
+    waiter = asyncio.ensure_future(wait_for_slot())
+    await asyncio.sleep(0.01)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    assert limiter._tokens.level > 59000
+    assert limiter._requests.level > 8.9
+    release.set()
+    await holder
@@ -0,0 +1,87 @@
+import pytest
+
+from agent.utils.config import config as agent_config
+from src.api.dto.request_dto import TeacherInputRequest
+from src.api.services.response_cache import ResponseCache
+
+pytestmark = pytest.mark.anyio
+
+RUN_CONFIG = {"configurable": {"model_name": "openai", "verification_mode": "parallel"}}
+
+RECORD = {
+    "student_id": 1,
+    "subject": "화학",
+    "content": "홍길동 학생은 ...",
+    "generated_at": "2025-01-01T00:00:00",
+    "version": 1,
+}
+
+
+def make_request(student_id: int = 1, additional_notes: str = "실험 보고서를 꼼꼼히 작성함"):
+    return TeacherInputRequest(
+        student_id=student_id,
+        name="홍길동",
+        subject="화학",
+        midterm_score=50,
+        final_score=60,
+        semester=2,
+        academic_year=2025,
+        additional_notes=additional_notes,
+    )
+
+
+def test_key_ignores_whitespace_but_not_model() -> None:
+    cache = ResponseCache()
+    key = cache.make_key(make_request(), RUN_CONFIG)
+
+    assert cache.make_key(make_request(additional_notes="  실험 보고서를  꼼꼼히 작성함 "), RUN_CONFIG) == key
+    assert cache.make_key(make_request(), {"configurable": {"model_name": "anthropic"}}) != key
+
+
+def test_key_changes_with_model_id_and_node_settings(monkeypatch) -> None:
+    cache = ResponseCache()
+    key = cache.make_key(make_request(), RUN_CONFIG)
+
+    monkeypatch.setitem(agent_config.PROVIDER_MODELS, "openai", "gpt-4o")
+    model_changed = cache.make_key(make_request(), RUN_CONFIG)
+    assert model_changed != key
+
+    monkeypatch.setitem(agent_config.NODE_MODEL_SETTINGS, "generate", {"temperature": 0.9})
+    assert cache.make_key(make_request(), RUN_CONFIG) != model_changed
+
+
+async def test_memory_lru_evicts_oldest() -> None:
+    cache = ResponseCache(max_entries=2)
+    keys = [cache.make_key(make_request(student_id), RUN_CONFIG) for student_id in (1, 2, 3)]
+    for key in keys:
+        await cache.set(key, RECORD)
+
+    assert await cache.get(keys[0]) is None
+    assert await cache.get(keys[2]) == RECORD
+    stats = cache.stats()
+    assert stats["memory_evictions"] == 1
+    assert (stats["memory_hits"], stats["misses"]) == (1, 1)
+
+
+async def test_disk_tier_survives_restart_and_evicts_by_size(tmp_path) -> None:
+    db_path = str(tmp_path / "cache.sqlite3")
+    cache = ResponseCache(db_path=db_path, db_max_entries=2)
+    keys = [cache.make_key(make_request(student_id), RUN_CONFIG) for student_id in (1, 2, 3)]
+    for key in keys:
+        await cache.set(key, RECORD)
+    assert cache.stats()["disk_evictions"] == 1
+    cache.close()
+
+    restarted = ResponseCache(db_path=db_path, db_max_entries=2)
+    assert await restarted.get(keys[0]) is None
+    assert await restarted.get(keys[2]) == RECORD
+    assert restarted.stats()["disk_hits"] == 1
+
+
+async def test_expired_entries_are_not_served() -> None:
+    cache = ResponseCache(ttl_seconds=-1)
+    key = cache.make_key(make_request(), RUN_CONFIG)
+    await cache.set(key, RECORD)
+
+    assert await cache.get(key) is None
+    assert cache.stats()["expired"] == 1
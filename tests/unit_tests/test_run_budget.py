@@ -0,0 +1,84 @@
+import importlib
+import json
+
+import pytest
+from langchain_core.messages import AIMessage
+
+from agent.utils.config.config import MAX_GRAMMAR_FIX_ATTEMPTS, MAX_LLM_CALLS_PER_RUN
+from agent.utils.model.model_registry import model_registry
+from agent.utils.rules.run_budget import limit_reason, pick_best_candidate
+
+pytestmark = pytest.mark.anyio
+
+CONTENT = "홍길동 학생은 화학 과목에서 중간 수행평가 50점, 기말 수행평가 60점을 기록함."
+# 본문에 없는 구간이라 직접 치환할 수 없어 매번 LLM 재작성이 필요한 문제
+GRAMMAR = {
+    "is_valid": False,
+    "issues": [{"type": "grammar", "text": "없는 표현", "suggestion": "고친 표현", "severity": "medium"}],
+}
+
+
+class NeverValidModel:
+    """문법 검증을 항상 실패시키고, 수정해도 같은 본문을 돌려주는 모델."""
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def with_structured_output(self, schema, **kwargs):
+        raise NotImplementedError
+
+    async def ainvoke(self, prompt, config=None):
+        if "점검 기준" in prompt:
+            return AIMessage(content=json.dumps(GRAMMAR))
+        return AIMessage(content=CONTENT)
+
+
+def test_limit_reason() -> None:
+    assert limit_reason({"llm_call_count": MAX_LLM_CALLS_PER_RUN - 1}, "end") is None
+    assert limit_reason({"llm_call_count": MAX_LLM_CALLS_PER_RUN - 1}, "fix_grammar") == "llm_call_limit"
+    assert limit_reason({"llm_call_count": 3, "regeneration_attempts": 3}, "clear_for_regeneration") == "regeneration_limit"
+    assert limit_reason({"llm_call_count": 3, "grammar_fix_attempts": 1}, "fix_grammar") is None
+
+
+def test_best_candidate_prefers_complete_inputs() -> None:
+    complete = pick_best_candidate({
+        "detailed_record": {"content": "a", "version": 1},
+        "validation_result": {"is_valid": True},
+        "grammar_result": {"is_valid": False, "issues": [{}]},
+    })
+    kept = pick_best_candidate({
+        "detailed_record": {"content": "b", "version": 2},
+        "validation_result": {"is_valid": False},
+        "grammar_result": {"is_valid": True, "issues": []},
+        "best_candidate": complete,
+    })
+    assert kept["record"]["content"] == "a"
+
+
+async def test_grammar_loop_ends_with_best_effort_record(monkeypatch) -> None:
+    monkeypatch.setitem(model_registry.factories, "openai", NeverValidModel)
+    model_registry.clear()
+    graph = importlib.import_module("agent.agent").graph
+
+    result = await graph.ainvoke({
+        "teacher_input": {
+            "student_id": 1,
+            "name": "홍길동",
+            "subject": "화학",
+            "midterm_score": 50,
+            "final_score": 60,
+            "additional_notes": None,
+        },
+        "generation_status": "pending",
+        "semester": 2,
+        "academic_year": 2025,
+    })
+    model_registry.clear()
+
+    assert result["termination_reason"] == "grammar_fix_limit"
+    assert result["grammar_fix_attempts"] == MAX_GRAMMAR_FIX_ATTEMPTS
+    assert result["final_approval"] is False
+    assert result["detailed_record"]["best_effort"] is True
+    assert result["detailed_record"]["version"] == MAX_GRAMMAR_FIX_ATTEMPTS + 1
+    # 생성 1 + 첫 문법 검증 1 + 수정마다 재작성 1 (같은 본문의 재검증은 메모이제이션으로 생략)
+    assert result["llm_call_count"] == 2 + MAX_GRAMMAR_FIX_ATTEMPTS
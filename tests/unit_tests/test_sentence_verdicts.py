@@ -0,0 +1,73 @@
+import json
+
+import pytest
+from langchain_core.messages import AIMessage
+
+from agent.utils.model.model_registry import model_registry
+from agent.utils.node.check_grammer import check_grammar_and_vocabulary
+from agent.utils.rules.grammar_lint import split_sentences
+from agent.utils.rules.sentence_verdicts import (
+    cached_result,
+    changed_sentences,
+    record_verdicts,
+)
+
+pytestmark = pytest.mark.anyio
+
+FIRST = "홍길동 학생은 화학 과목에서 중간 수행평가 50점, 기말 수행평가 60점을 기록함."
+SECOND = "실험 결과를를 꼼꼼히 정리함."
+FIXED = "실험 결과를 꼼꼼히 정리함."
+ISSUE = {"type": "grammar", "text": "결과를를", "suggestion": "결과를", "severity": "medium"}
+
+
+def test_split_sentences_keeps_decimals() -> None:
+    assert split_sentences("평균 3.5점을 기록함. 발표가 돋보임!\n탐구함") == ["평균 3.5점을 기록함.", "발표가 돋보임!", "탐구함"]
+
+
+def test_verdicts_are_reused_for_unchanged_sentences() -> None:
+    verdicts = record_verdicts({}, [FIRST, SECOND], [ISSUE], is_valid=False)
+    assert verdicts[FIRST] == {"is_valid": True, "issues": []}
+    assert verdicts[SECOND]["is_valid"] is False
+
+    assert changed_sentences([FIRST, FIXED], verdicts) == [FIXED]
+    assert cached_result([FIRST], verdicts) == {"is_valid": True, "issues": []}
+
+    # 어느 문장에도 속하지 않는 지적이 있으면 문제없는 문장도 통과로 기록하지 않음
+    unknown = record_verdicts({}, [FIRST, SECOND], [{**ISSUE, "text": "전체적인 톤"}], is_valid=False)
+    assert unknown == {}
+
+
+class PromptRecorder:
+    """받은 프롬프트를 기록하고 문제없음으로 응답하는 모델."""
+
+    prompts = []
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def with_structured_output(self, schema, **kwargs):
+        raise NotImplementedError
+
+    async def ainvoke(self, prompt, config=None):
+        PromptRecorder.prompts.append(prompt)
+        return AIMessage(content=json.dumps({"is_valid": True, "issues": []}))
+
+
+async def test_recheck_sends_only_changed_sentences(monkeypatch) -> None:
+    monkeypatch.setitem(model_registry.factories, "openai", PromptRecorder)
+    model_registry.clear()
+    verdicts = record_verdicts({}, [FIRST, SECOND], [ISSUE], is_valid=False)
+
+    # 짧은 본문이라 린트가 분량 문제로 LLM 검증을 요청함
+    update = await check_grammar_and_vocabulary({
+        "detailed_record": {"content": f"{FIRST} {FIXED}"},
+        "sentence_verdicts": verdicts,
+    })
+    model_registry.clear()
+
+    assert len(PromptRecorder.prompts) == 1
+    assert FIXED in PromptRecorder.prompts[0]
+    assert FIRST not in PromptRecorder.prompts[0]
+    assert update["grammar_result"]["is_valid"] is True
+    assert update["grammar_result"]["details"]["checker"] == "lint+llm(incremental)"
+    assert update["sentence_verdicts"][FIXED] == {"is_valid": True, "issues": []}
@@ -0,0 +1,93 @@
+import asyncio
+
+import pytest
+
+from src.api.services.single_flight import SingleFlight
+
+pytestmark = pytest.mark.anyio
+
+
+class Upstream:
+    """호출 횟수를 세고 잠시 뒤 결과(또는 예외)를 돌려주는 업스트림."""
+
+    def __init__(self, error: Exception = None):
+        self.calls = 0
+        self.cancelled = False
+        self.error = error
+
+    async def run(self):
+        self.calls += 1
+        try:
+            await asyncio.sleep(0.05)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self.error:
+            raise self.error
+        return {"content": "세특"}
+
+
+async def test_concurrent_identical_requests_share_one_run() -> None:
+    flight = SingleFlight()
+    upstream = Upstream()
+
+    results = await asyncio.gather(*(flight.do("key", upstream.run) for _ in range(5)))
+
+    assert upstream.calls == 1
+    assert results == [{"content": "세특"}] * 5
+    assert flight.stats()["coalesced"] == 4
+    assert flight.stats()["in_flight"] == 0
+
+
+async def test_error_propagates_to_every_waiter() -> None:
+    flight = SingleFlight()
+    upstream = Upstream(error=RuntimeError("upstream failed"))
+
+    results = await asyncio.gather(*(flight.do("key", upstream.run) for _ in range(3)), return_exceptions=True)
+
+    assert upstream.calls == 1
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+async def test_cancelled_waiter_does_not_cancel_shared_run() -> None:
+    flight = SingleFlight()
+    upstream = Upstream()
+    first = asyncio.ensure_future(flight.do("key", upstream.run))
+    second = asyncio.ensure_future(flight.do("key", upstream.run))
+    await asyncio.sleep(0.01)
+
+    first.cancel()
+
+    assert await second == {"content": "세특"}
+    assert first.cancelled()
+    assert not upstream.cancelled
+    assert flight.stats()["cancelled_waiters"] == 1
+
+
+async def test_run_is_cancelled_when_every_waiter_leaves() -> None:
+    flight = SingleFlight()
+    upstream = Upstream()
+    waiter = asyncio.ensure_future(flight.do("key", upstream.run))
+    await asyncio.sleep(0.01)
+
+    waiter.cancel()
+    await asyncio.sleep(0.01)
+
+    assert upstream.cancelled
+    assert flight.stats()["abandoned"] == 1
+    assert flight.stats()["in_flight"] == 0
+
+
+async def test_request_after_abandonment_starts_new_run() -> None:
+    flight = SingleFlight()
+    upstream = Upstream()
+    waiter = asyncio.ensure_future(flight.do("key", upstream.run))
+    await asyncio.sleep(0.01)
+
+    waiter.cancel()
+    # 대기자가 취소를 처리한 직후, 중단된 실행이 끝나기 전에 같은 요청 도착
+    await asyncio.sleep(0)
+
+    assert await flight.do("key", upstream.run) == {"content": "세특"}
+    assert upstream.calls == 2
+    assert flight.stats()["executions"] == 2
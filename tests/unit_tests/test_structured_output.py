@@ -0,0 +1,83 @@
+import pytest
+from langchain_core.messages import AIMessage
+
+from agent.utils.dto.verification_schema import GrammarCheck
+from agent.utils.model.model_registry import model_registry
+from agent.utils.model.structured_output import (
+    ainvoke_structured,
+    get_parse_stats,
+    parse_json_tolerant,
+)
+from agent.utils.node.merge_verification import merge_verification_results
+from agent.utils.node.validate_input_inclusion import validate_input_inclusion
+
+pytestmark = pytest.mark.anyio
+
+
+class StructuredModel:
+    """구조화 출력 파싱에 실패하고 원본 메시지만 돌려주는 모델."""
+
+    def __init__(self, content: str):
+        self.content = content
+
+    def with_structured_output(self, schema, include_raw=False):
+        model = self
+
+        class Runnable:
+            async def ainvoke(self, prompt, config=None):
+                return {"raw": AIMessage(content=model.content), "parsed": None, "parsing_error": "invalid"}
+
+        return Runnable()
+
+
+def test_parse_json_tolerant_repairs_common_llm_output() -> None:
+    text = '검증 결과입니다.\n```json\n{"is_valid": False, "issues": [],}\n```'
+    assert parse_json_tolerant(text) == {"is_valid": False, "issues": []}
+
+    with pytest.raises(ValueError):
+        parse_json_tolerant("JSON 없음")
+
+
+async def test_ainvoke_structured_repairs_then_gives_up() -> None:
+    repaired = await ainvoke_structured(
+        StructuredModel('```json\n{"is_valid": true, "issues": [],}\n```'), "prompt", GrammarCheck, node="test"
+    )
+    assert repaired == GrammarCheck(is_valid=True, issues=[])
+
+    failed = await ainvoke_structured(StructuredModel("잘 모르겠습니다"), "prompt", GrammarCheck, node="test")
+    assert failed is None
+    assert get_parse_stats()["test"] == {"calls": 2, "parsed": 0, "repaired": 1, "failed": 1, "timed_out": 0}
+
+
+class GarbageModel(StructuredModel):
+    """어떤 프롬프트에도 JSON이 아닌 응답을 돌려주는 모델."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__("잘 모르겠습니다")
+
+
+async def test_unparsable_notes_check_is_not_approved(monkeypatch) -> None:
+    monkeypatch.setitem(model_registry.factories, "openai", GarbageModel)
+    model_registry.clear()
+    state = {
+        "teacher_input": {
+            "student_id": 1,
+            "name": "홍길동",
+            "subject": "화학",
+            "midterm_score": 50,
+            "final_score": 60,
+            "additional_notes": "실험 보고서를 꼼꼼하게 작성함",
+        },
+        "detailed_record": {"content": "홍길동 학생은 화학 과목에서 중간 수행평가 50점, 기말 수행평가 60점을 기록함."},
+    }
+
+    result = (await validate_input_inclusion(state))["validation_result"]
+    model_registry.clear()
+
+    assert result["details"]["validator"] == "rule+llm(parse_failed)"
+    assert result["is_valid"] is False
+    assert "additional_notes" in result["missing_items"]
+    merged = await merge_verification_results({
+        **state, "validation_result": result, "grammar_result": {"is_valid": True, "issues": []}
+    })
+    assert merged["final_approval"] is False